@@ -1,471 +1,733 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL
-=========================================================
-Implementação completa em Python de física quântica + relatividade geral
-Constantes SI 2019 - Precisão máxima
-Todos os cálculos verificáveis e reproduzíveis
-"""
-
-import math
-import numpy as np
-from datetime import datetime
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                    CONSTANTES FÍSICAS FUNDAMENTAIS SI 2019                ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-# Constantes quânticas
-hbar = 1.054571817e-34  # J·s (Constante de Planck reduzida)
-h = 6.62607015e-34      # J·s (Constante de Planck)
-c = 299792458           # m/s (Velocidade da luz - exato por definição)
-G = 6.67430e-11         # m³/(kg·s²) (Constante gravitacional)
-
-# Constantes derivadas de Planck
-l_P = math.sqrt(hbar * G / c**3)        # Comprimento de Planck
-m_P = math.sqrt(hbar * c / G)           # Massa de Planck
-t_P = math.sqrt(hbar * G / c**5)        # Tempo de Planck
-E_P = m_P * c**2                        # Energia de Planck
-
-# Constantes adicionais
-k_B = 1.380649e-23      # J/K (Constante de Boltzmann)
-M_sun = 1.98892e+30     # kg (Massa do Sol)
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                   1. CONSTANTES FUNDAMENTAIS VERIFICADAS                  ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def exibir_constantes():
-    """Exibe todas as constantes fundamentais com verificação"""
-    print("\n" + "="*80)
-    print("CONSTANTES FUNDAMENTAIS VERIFICADAS")
-    print("="*80)
-    print(f"Constante de Planck reduzida (ħ):     {hbar:.6e} J·s")
-    print(f"Velocidade da luz (c):                {c:.6e} m/s")
-    print(f"Constante gravitacional (G):          {G:.6e} m³/kg·s²")
-    print(f"Comprimento de Planck (l_P):          {l_P:.6e} m")
-    print(f"Massa de Planck (m_P):                {m_P:.6e} kg")
-    print(f"Tempo de Planck (t_P):                {t_P:.6e} s")
-    print(f"Energia de Planck (E_P):              {E_P:.6e} J")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                 2. PRINCÍPIO DE INCERTEZA DE HEISENBERG                   ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def incerteza_heisenberg(delta_x):
-    """
-    Princípio de Incerteza de Heisenberg: Δx·Δp ≥ ħ/2
-    
-    Args:
-        delta_x: Incerteza na posição (m)
-    
-    Returns:
-        Incerteza mínima no momento (kg·m/s)
-    """
-    return hbar / (2 * delta_x)
-
-def teste_heisenberg():
-    """Testa o princípio de Heisenberg em dois cenários"""
-    print("\n" + "="*80)
-    print("2. PRINCÍPIO DE INCERTEZA DE HEISENBERG")
-    print("="*80)
-    print("Relação: Δx·Δp ≥ ħ/2 (mínimo para estados comprimidos)\n")
-    
-    # Teste 1: Átomo de Bohr
-    delta_x_1 = 1e-10  # 0.1 nm
-    delta_p_1 = incerteza_heisenberg(delta_x_1)
-    v_1 = delta_p_1 / 9.10938e-31  # massa do elétron
-    
-    print("Teste 1: Partícula no átomo de Bohr")
-    print(f"Posição incerta (Δx):                 {delta_x_1:.6e} m (0.1 nm)")
-    print(f"Momento incerto mínimo (Δp):          {delta_p_1:.6e} kg·m/s")
-    print(f"Velocidade incerta mínima:            {v_1:.6e} m/s")
-    print(f"Percentual da velocidade da luz:      {(v_1/c)*100:.2f}% da velocidade da luz")
-    
-    # Teste 2: Escala de Planck
-    delta_x_2 = l_P
-    delta_p_2 = incerteza_heisenberg(delta_x_2)
-    v_2 = delta_p_2 / m_P
-    
-    print(f"\nTeste 2: Partícula na escala de Planck")
-    print(f"Posição incerta (Δx):                 {delta_x_2:.6e} m")
-    print(f"Momento incerto mínimo (Δp):          {delta_p_2:.6e} kg·m/s")
-    print(f"Velocidade incerta mínima:            {v_2:.6e} m/s")
-    print(f"Percentual da velocidade da luz:      {(v_2/c)*100:.2f}% da velocidade da luz")
-    
-    # Verificação
-    verificacao = delta_x_1 * delta_p_1
-    print(f"\nVerificação: Δx·Δp = {verificacao:.6e} J·s")
-    print(f"             ħ/2   = {hbar/2:.6e} J·s")
-    print(f"             Razão = {verificacao / (hbar/2):.6f}")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║             3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO               ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def autoenergias_poco_infinito(n, L, m):
-    """
-    Autoenergias para partícula em poço de potencial infinito
-    E_n = (n² π² ħ²) / (2 m L²)
-    
-    Args:
-        n: Número quântico principal
-        L: Largura do poço (m)
-        m: Massa da partícula (kg)
-    
-    Returns:
-        Energia do estado n (J)
-    """
-    return (n**2 * math.pi**2 * hbar**2) / (2 * m * L**2)
-
-def teste_schrodinger():
-    """Testa a equação de Schrödinger para partícula em poço infinito"""
-    print("\n" + "="*80)
-    print("3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO")
-    print("="*80)
-    print("Para partícula em poço de potencial infinito:")
-    print("E_n = (n² π² ħ²) / (2 m L²)\n")
-    
-    L = 1e-9  # 1 nm
-    m_electron = 9.10938e-31  # kg
-    
-    print("Partícula em poço infinito (L = 1 nm)")
-    print("Estado quântico | Energia (J)      | Energia (eV)")
-    print("-" * 60)
-    
-    for n in range(1, 6):
-        E = autoenergias_poco_infinito(n, L, m_electron)
-        E_eV = E / 1.60218e-19  # Conversão para eV
-        print(f"    n = {n}       | {E:.6e} | {E_eV:.6f}")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                4. OSCILADOR HARMÔNICO QUÂNTICO                            ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def energia_oscilador_harmonico(n, omega):
-    """
-    Energia de oscilador harmônico quântico
-    E_n = ħω(n + 1/2)
-    
-    Args:
-        n: Número quântico
-        omega: Frequência angular (rad/s)
-    
-    Returns:
-        Energia (J)
-    """
-    return hbar * omega * (n + 0.5)
-
-def teste_oscilador():
-    """Testa oscilador harmônico quântico"""
-    print("\n" + "="*80)
-    print("4. OSCILADOR HARMÔNICO QUÂNTICO")
-    print("="*80)
-    print("Energia: E_n = ħω(n + 1/2)\n")
-    
-    omega = 1e15  # Hz (frequência alta)
-    
-    print("Oscilador Harmônico Quântico (ω = 1e15 Hz)")
-    print("Estado | Energia de ponto zero | Energia total | Comprimento de onda")
-    print("-" * 75)
-    
-    for n in range(5):
-        E_zero = hbar * omega * 0.5
-        E_total = energia_oscilador_harmonico(n, omega)
-        lambda_wave = (2 * math.pi * c) / omega
-        
-        print(f"  n={n}  | {E_zero:.6e} J   | {E_total:.6e} J | λ = {lambda_wave:.6e} m")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║            5. TENSOR DE ENERGIA-MOMENTO RELATIVIDADE GERAL                ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def tensor_stress_energy_dust(rho, u):
-    """
-    Tensor de Energia-Momento para matéria poeirenta
-    T^μν = ρ u^μ u^ν
-    
-    Args:
-        rho: Densidade de massa (kg/m³)
-        u: Quadrivelocidade [u^0, u^1, u^2, u^3]
-    
-    Returns:
-        Tensor T^μν (4x4)
-    """
-    T = np.zeros((4, 4))
-    for mu in range(4):
-        for nu in range(4):
-            T[mu, nu] = rho * u[mu] * u[nu]
-    return T
-
-def teste_tensor_energia():
-    """Testa o tensor de energia-momento"""
-    print("\n" + "="*80)
-    print("5. TENSOR DE ENERGIA-MOMENTO EM RELATIVIDADE GERAL")
-    print("="*80)
-    print("Para matéria poeirenta: T^μν = ρ u^μ u^ν\n")
-    
-    # Matéria em repouso (u^μ = [1, 0, 0, 0])
-    rho = 1.0  # Densidade normalizada
-    u = np.array([1.0, 0.0, 0.0, 0.0])
-    
-    T = tensor_stress_energy_dust(rho, u)
-    
-    print("Tensor de Energia-Momento (matéria em repouso)")
-    print("Componentes T^μν:")
-    print(f"T^00 = {T[0,0]:.6e}")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                6. EQUAÇÃO DE CAMPO DE EINSTEIN                            ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def schwarzschild_metric(r, M):
-    """
-    Métrica de Schwarzschild: ds² = -g₀₀ dt² + g₁₁ dr² + r²(dθ² + sin²θ dφ²)
-    
-    Args:
-        r: Coordenada radial (m)
-        M: Massa central (kg)
-    
-    Returns:
-        Componentes da métrica [g₀₀, g₁₁, g₂₂]
-    """
-    r_s = 2 * G * M / c**2  # Raio de Schwarzschild
-    
-    g_00 = -(1 - r_s/r)
-    g_11 = 1 / (1 - r_s/r)
-    g_22 = r**2
-    
-    return g_00, g_11, g_22, r_s
-
-def teste_einstein():
-    """Testa a métrica de Schwarzschild"""
-    print("\n" + "="*80)
-    print("6. EQUAÇÃO DE CAMPO DE EINSTEIN")
-    print("="*80)
-    print("G^μν + Λg^μν = (8πG/c⁴) T^μν\n")
-    
-    # Fator de acoplamento
-    kappa = 8 * math.pi * G / c**4
-    print(f"Fator de acoplamento: κ = 8πG/c⁴")
-    print(f"κ = {kappa:.6e} m/J\n")
-    
-    # Métrica de Schwarzschild ao redor do Sol
-    r = 1.496e11  # 1 UA
-    
-    g_00, g_11, g_22, r_s = schwarzschild_metric(r, M_sun)
-    
-    print("Métrica de Schwarzschild ao redor do Sol")
-    print(f"Massa do Sol: {M_sun:.6e} kg")
-    print(f"Raio de Schwarzschild: {r_s:.6e} m")
-    print(f"Distância teste (1 UA): {r:.6e} m\n")
-    
-    print("Componentes da métrica em r = 1 UA:")
-    print(f"g₀₀ = {g_00:.15f}")
-    print(f"g₁₁ = {g_11:.15f}")
-    print(f"g₂₂ = {g_22:.6e}")
-    
-    desvio = abs(1 + g_00) * 100
-    print(f"Desvio da planicidade: {desvio:.6e}%")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║            7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO                   ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def temperatura_hawking(M):
-    """
-    Temperatura de radiação de Hawking
-    T_H = (ħc³) / (8πk_B GM²)
-    
-    Args:
-        M: Massa do buraco negro (kg)
-    
-    Returns:
-        Temperatura (K)
-    """
-    return (hbar * c**3) / (8 * math.pi * k_B * G * M**2)
-
-def teste_hawking():
-    """Testa a radiação de Hawking"""
-    print("\n" + "="*80)
-    print("7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO")
-    print("="*80)
-    print("Radiação de Hawking: E_Hawking = (ħc³) / (8πk_B G M²)\n")
-    
-    M_BN = 5 * M_sun  # 5 massas solares
-    T_H = temperatura_hawking(M_BN)
-    
-    print("Radiação de Hawking")
-    print(f"Massa do buraco negro: {M_BN:.6e} kg")
-    print(f"Temperatura de Hawking: {T_H:.6e} K")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║            8. RELAÇÃO DE DISPERSÃO QUÂNTICA + RELATIVÍSTICA               ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def energia_relativistica(p, m):
-    """
-    Relação de dispersão de Dirac
-    E² = (pc)² + (mc²)²
-    
-    Args:
-        p: Momento (kg·m/s)
-        m: Massa (kg)
-    
-    Returns:
-        Energia (J)
-    """
-    return math.sqrt((p * c)**2 + (m * c**2)**2)
-
-def teste_dirac():
-    """Testa a relação relativística quântica"""
-    print("\n" + "="*80)
-    print("8. RELAÇÃO DE DISPERSÃO (QUÂNTICA + RELATIVÍSTICA)")
-    print("="*80)
-    print("E² = (pc)² + (mc²)²\n")
-    
-    m_e = 9.10938e-31  # kg (elétron)
-    p = 1e-24  # kg·m/s
-    
-    E_0 = m_e * c**2
-    E_total = energia_relativistica(p, m_e)
-    E_kinetic = E_total - E_0
-    
-    print("Elétron com momento p = 1e-24 kg·m/s")
-    print(f"Energia de repouso (E₀):    {E_0:.6e} J ({E_0/1.60218e-19:.6f} MeV)")
-    print(f"Energia total (E):          {E_total:.6e} J ({E_total/1.60218e-19:.6f} MeV)")
-    print(f"Energia cinética (K):       {E_kinetic:.6e} J ({E_kinetic/1.60218e-19:.6f} MeV)")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                9. ENTROPIA BEKENSTEIN-HAWKING                             ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def entropia_bekenstein_hawking(M):
-    """
-    Entropia de um buraco negro
-    S = (A k_B c³) / (4 ħ G) onde A = 4πr_s²
-    
-    Args:
-        M: Massa do buraco negro (kg)
-    
-    Returns:
-        Entropia (J/K)
-    """
-    r_s = 2 * G * M / c**2
-    A = 4 * math.pi * r_s**2
-    return (A * k_B * c**3) / (4 * hbar * G)
-
-def teste_bekenstein():
-    """Testa a entropia de Bekenstein-Hawking"""
-    print("\n" + "="*80)
-    print("9. ENTROPIA DE UM BURACO NEGRO (BEKENSTEIN-HAWKING)")
-    print("="*80)
-    print("S = (A k_B c³) / (4 ħ G)\n")
-    
-    M_BN = 5 * M_sun
-    S = entropia_bekenstein_hawking(M_BN)
-    
-    # Número de microestados
-    microstates_log10 = S / (k_B * math.log(10))
-    
-    print("Buraco Negro de ~5 massas solares")
-    print(f"Massa: {M_BN:.6e} kg")
-    print(f"Entropia de Bekenstein-Hawking: {S:.6e} J/K")
-    print(f"Número de estados quânticos: 10^{microstates_log10:.2e}")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║               10. SÍNTESE: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL              ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def teste_sintese():
-    """Síntese final da unificação"""
-    print("\n" + "="*80)
-    print("SÍNTESE: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL")
-    print("="*80)
-    
-    print("\n1. REGIME QUÂNTICO (escalas pequenas):")
-    print(f"   Comprimento de Planck: {l_P:.6e} m")
-    print(f"   Massa de Planck: {m_P:.6e} kg")
-    print(f"   Tempo de Planck: {t_P:.6e} s")
-    print(f"   Energia de Planck: {E_P:.6e} J")
-    
-    print("\n2. REGIME GRAVITACIONAL (escalas grandes):")
-    r_s_sun = 2 * G * M_sun / c**2
-    Lambda_obs = 1.11e-52  # m⁻²
-    print(f"   Raio de Schwarzschild do Sol: {r_s_sun:.6e} m")
-    print(f"   Constante cosmológica observada: {Lambda_obs:.6e} m⁻²")
-    
-    print("\n3. TRANSIÇÃO QUÂNTICO-CLÁSSICA:")
-    razao = l_P / r_s_sun
-    print(f"   Razão l_P / r_s_sun = {razao:.6e}")
-    print(f"   → A gravidade é clássica a escalas grandes")
-    print(f"   → Efeitos quânticos dominam a escalas de Planck")
-    
-    print("\n4. PRINCÍPIOS VERIFICADOS:")
-    print(f"   ✓ Princípio de Incerteza de Heisenberg")
-    print(f"   ✓ Equação de Schrödinger")
-    print(f"   ✓ Equações de Campo de Einstein")
-    print(f"   ✓ Termodinâmica de buracos negros")
-    print(f"   ✓ Teoria Quântica de Campos")
-    
-    print("\n5. VALIDAÇÃO NUMÉRICA:")
-    delta_x = l_P
-    delta_p = incerteza_heisenberg(delta_x)
-    print(f"   Incerteza (Planck): Δx·Δp = {delta_x * delta_p:.6e} J·s (≈ ħ/2)")
-    
-    g_00, g_11, g_22, r_s = schwarzschild_metric(1.496e11, M_sun)
-    desvio_metric = abs(1 + g_00) * 100
-    print(f"   Métrica (Schwarzschild): Desvio = {desvio_metric:.6e}% (muito pequeno a 1 UA)")
-    
-    T_H = temperatura_hawking(5 * M_sun)
-    print(f"   Hawking (BN): T = {T_H:.6e} K (compatível com relatividade)")
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                         PROGRAMA PRINCIPAL                                ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def main():
-    """Executa todos os testes"""
-    print("\n" + "█"*80)
-    print("🔬 CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL 🔬")
-    print("█"*80)
-    print(f"Execução: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Precisão: SI 2019 (máxima)")
-    
-    # Executa todos os testes
-    exibir_constantes()
-    teste_heisenberg()
-    teste_schrodinger()
-    teste_oscilador()
-    teste_tensor_energia()
-    teste_einstein()
-    teste_hawking()
-    teste_dirac()
-    teste_bekenstein()
-    teste_sintese()
-    
-    # Resumo final
-    print("\n" + "="*80)
-    print("FIM DOS CÁLCULOS VERIFICADOS")
-    print("="*80)
-    print("\nTodos os cálculos acima foram realizados com:")
-    print("- Constantes físicas do SI de precisão máxima")
-    print("- Fórmulas derivadas e comprovadas experimentalmente")
-    print("- Unidades consistentes internacionalmente")
-    print("- Sem especulações ou notações inventadas")
-    print("█"*80 + "\n")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL
+=========================================================
+Implementação completa em Python de física quântica + relatividade geral
+Constantes SI 2019 - Precisão máxima
+Todos os cálculos verificáveis e reproduzíveis
+"""
+
+import sys
+import os
+import math
+import argparse
+import numpy as np
+from datetime import datetime
+from dataclasses import dataclass
+
+import constantes
+import renderizacao
+import calculos_vetorizados
+import executor_secoes
+from renderizacao import Resultado
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    CONSTANTES FÍSICAS FUNDAMENTAIS SI 2019                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# As constantes vêm de constantes.py (conjunto CODATA ativo). hbar, c, G,
+# k_B, M_sun, l_P, m_P, t_P, E_P continuam importáveis deste módulo.
+
+def __getattr__(nome):
+    return constantes.exportar(__name__, nome)
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                   1. CONSTANTES FUNDAMENTAIS VERIFICADAS                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class ResultadoConstantes(Resultado):
+    """Constantes fundamentais do conjunto CODATA ativo"""
+    titulo = "CONSTANTES FUNDAMENTAIS VERIFICADAS"
+
+    hbar: float
+    c: float
+    G: float
+    l_P: float
+    m_P: float
+    t_P: float
+    E_P: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Constante de Planck reduzida (ħ):     {self.hbar:.6e} J·s"
+        yield f"Velocidade da luz (c):                {self.c:.6e} m/s"
+        yield f"Constante gravitacional (G):          {self.G:.6e} m³/kg·s²"
+        yield f"Comprimento de Planck (l_P):          {self.l_P:.6e} m"
+        yield f"Massa de Planck (m_P):                {self.m_P:.6e} kg"
+        yield f"Tempo de Planck (t_P):                {self.t_P:.6e} s"
+        yield f"Energia de Planck (E_P):              {self.E_P:.6e} J"
+
+
+def exibir_constantes():
+    """Reúne as constantes fundamentais para exibição"""
+    K = constantes.atual()
+    return ResultadoConstantes(K.hbar, K.c, K.G, K.l_P, K.m_P, K.t_P, K.E_P)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                 2. PRINCÍPIO DE INCERTEZA DE HEISENBERG                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def incerteza_heisenberg(delta_x):
+    """
+    Princípio de Incerteza de Heisenberg: Δx·Δp ≥ ħ/2
+    
+    Args:
+        delta_x: Incerteza na posição (m)
+    
+    Returns:
+        Incerteza mínima no momento (kg·m/s)
+    """
+    return constantes.atual().hbar / (2 * delta_x)
+
+
+@dataclass
+class CenarioHeisenberg:
+    """Incerteza mínima de uma partícula de massa dada"""
+    descricao: str
+    escala: str
+    delta_x: float
+    delta_p: float
+    velocidade: float
+    percentual_c: float
+
+
+@dataclass
+class ResultadoHeisenberg(Resultado):
+    """Cenários de Heisenberg e verificação de Δx·Δp = ħ/2"""
+    titulo = "2. PRINCÍPIO DE INCERTEZA DE HEISENBERG"
+
+    cenarios: list
+    produto: float
+    meio_hbar: float
+    razao: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "Relação: Δx·Δp ≥ ħ/2 (mínimo para estados comprimidos)\n"
+        for i, cen in enumerate(self.cenarios, 1):
+            escala = f" ({cen.escala})" if cen.escala else ""
+            if i > 1:
+                yield ""
+            yield f"Teste {i}: {cen.descricao}"
+            yield f"Posição incerta (Δx):                 {cen.delta_x:.6e} m{escala}"
+            yield f"Momento incerto mínimo (Δp):          {cen.delta_p:.6e} kg·m/s"
+            yield f"Velocidade incerta mínima:            {cen.velocidade:.6e} m/s"
+            yield f"Percentual da velocidade da luz:      {cen.percentual_c:.2f}% da velocidade da luz"
+        yield f"\nVerificação: Δx·Δp = {self.produto:.6e} J·s"
+        yield f"             ħ/2   = {self.meio_hbar:.6e} J·s"
+        yield f"             Razão = {self.razao:.6f}"
+
+
+def teste_heisenberg():
+    """Testa o princípio de Heisenberg em dois cenários"""
+    K = constantes.atual()
+    
+    # Teste 1: Átomo de Bohr
+    delta_x_1 = 1e-10  # 0.1 nm
+    delta_p_1 = incerteza_heisenberg(delta_x_1)
+    v_1 = delta_p_1 / 9.10938e-31  # massa do elétron
+    
+    # Teste 2: Escala de Planck
+    delta_x_2 = K.l_P
+    delta_p_2 = incerteza_heisenberg(delta_x_2)
+    v_2 = delta_p_2 / K.m_P
+    
+    # Verificação
+    verificacao = delta_x_1 * delta_p_1
+    return ResultadoHeisenberg(
+        cenarios=[
+            CenarioHeisenberg("Partícula no átomo de Bohr", "0.1 nm",
+                              delta_x_1, delta_p_1, v_1, (v_1/K.c)*100),
+            CenarioHeisenberg("Partícula na escala de Planck", "",
+                              delta_x_2, delta_p_2, v_2, (v_2/K.c)*100),
+        ],
+        produto=verificacao,
+        meio_hbar=K.hbar/2,
+        razao=verificacao / (K.hbar/2),
+    )
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║             3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def autoenergias_poco_infinito(n, L, m):
+    """
+    Autoenergias para partícula em poço de potencial infinito
+    E_n = (n² π² ħ²) / (2 m L²)
+    
+    Args:
+        n: Número quântico principal
+        L: Largura do poço (m)
+        m: Massa da partícula (kg)
+    
+    Returns:
+        Energia do estado n (J)
+    """
+    return (n * n * math.pi**2 * constantes.atual().hbar2) / (2 * m * (L * L))
+
+
+@dataclass
+class EstadoPoco:
+    """Autoestado n do poço infinito"""
+    n: int
+    energia_J: float
+    energia_eV: float
+
+
+@dataclass
+class ResultadoSchrodinger(Resultado):
+    """Autoenergias do elétron em um poço infinito"""
+    titulo = "3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO"
+
+    L: float
+    m: float
+    estados: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "Para partícula em poço de potencial infinito:"
+        yield "E_n = (n² π² ħ²) / (2 m L²)\n"
+        yield "Partícula em poço infinito (L = 1 nm)"
+        yield "Estado quântico | Energia (J)      | Energia (eV)"
+        yield "-" * 60
+        for estado in self.estados:
+            yield f"    n = {estado.n}       | {estado.energia_J:.6e} | {estado.energia_eV:.6f}"
+
+
+def teste_schrodinger():
+    """Testa a equação de Schrödinger para partícula em poço infinito"""
+    L = 1e-9  # 1 nm
+    m_electron = 9.10938e-31  # kg
+    
+    estados = []
+    for n in range(1, 6):
+        E = autoenergias_poco_infinito(n, L, m_electron)
+        E_eV = E / 1.60218e-19  # Conversão para eV
+        estados.append(EstadoPoco(n, E, E_eV))
+
+    return ResultadoSchrodinger(L, m_electron, estados)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                4. OSCILADOR HARMÔNICO QUÂNTICO                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def energia_oscilador_harmonico(n, omega):
+    """
+    Energia de oscilador harmônico quântico
+    E_n = ħω(n + 1/2)
+    
+    Args:
+        n: Número quântico
+        omega: Frequência angular (rad/s)
+    
+    Returns:
+        Energia (J)
+    """
+    return constantes.atual().hbar * omega * (n + 0.5)
+
+
+@dataclass
+class EstadoOscilador:
+    """Nível n do oscilador harmônico"""
+    n: int
+    energia_ponto_zero: float
+    energia_total: float
+    comprimento_onda: float
+
+
+@dataclass
+class ResultadoOscilador(Resultado):
+    """Níveis do oscilador harmônico quântico"""
+    titulo = "4. OSCILADOR HARMÔNICO QUÂNTICO"
+
+    omega: float
+    estados: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "Energia: E_n = ħω(n + 1/2)\n"
+        yield "Oscilador Harmônico Quântico (ω = 1e15 Hz)"
+        yield "Estado | Energia de ponto zero | Energia total | Comprimento de onda"
+        yield "-" * 75
+        for e in self.estados:
+            yield (f"  n={e.n}  | {e.energia_ponto_zero:.6e} J   | {e.energia_total:.6e} J "
+                   f"| λ = {e.comprimento_onda:.6e} m")
+
+
+def teste_oscilador():
+    """Testa oscilador harmônico quântico"""
+    K = constantes.atual()
+    omega = 1e15  # Hz (frequência alta)
+    
+    estados = []
+    for n in range(5):
+        E_zero = K.hbar * omega * 0.5
+        E_total = energia_oscilador_harmonico(n, omega)
+        lambda_wave = (2 * math.pi * K.c) / omega
+        estados.append(EstadoOscilador(n, E_zero, E_total, lambda_wave))
+
+    return ResultadoOscilador(omega, estados)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            5. TENSOR DE ENERGIA-MOMENTO RELATIVIDADE GERAL                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def tensor_stress_energy_dust(rho, u):
+    """
+    Tensor de Energia-Momento para matéria poeirenta
+    T^μν = ρ u^μ u^ν
+    
+    Args:
+        rho: Densidade de massa (kg/m³)
+        u: Quadrivelocidade [u^0, u^1, u^2, u^3]
+    
+    Returns:
+        Tensor T^μν (4x4)
+    """
+    T = np.zeros((4, 4))
+    for mu in range(4):
+        for nu in range(4):
+            T[mu, nu] = rho * u[mu] * u[nu]
+    return T
+
+
+@dataclass
+class ResultadoTensor(Resultado):
+    """Tensor de energia-momento da poeira em repouso"""
+    titulo = "5. TENSOR DE ENERGIA-MOMENTO EM RELATIVIDADE GERAL"
+
+    rho: float
+    u: np.ndarray
+    T: np.ndarray
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "Para matéria poeirenta: T^μν = ρ u^μ u^ν\n"
+        yield "Tensor de Energia-Momento (matéria em repouso)"
+        yield "Componentes T^μν:"
+        yield f"T^00 = {self.T[0,0]:.6e}"
+
+
+def teste_tensor_energia():
+    """Testa o tensor de energia-momento"""
+    # Matéria em repouso (u^μ = [1, 0, 0, 0])
+    rho = 1.0  # Densidade normalizada
+    u = np.array([1.0, 0.0, 0.0, 0.0])
+    
+    T = tensor_stress_energy_dust(rho, u)
+    return ResultadoTensor(rho, u, T)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                6. EQUAÇÃO DE CAMPO DE EINSTEIN                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def schwarzschild_metric(r, M):
+    """
+    Métrica de Schwarzschild: ds² = -g₀₀ dt² + g₁₁ dr² + r²(dθ² + sin²θ dφ²)
+    
+    Args:
+        r: Coordenada radial (m)
+        M: Massa central (kg)
+    
+    Returns:
+        Componentes da métrica [g₀₀, g₁₁, g₂₂]
+    """
+    K = constantes.atual()
+    r_s = 2 * K.G * M / K.c2  # Raio de Schwarzschild
+    
+    g_00 = -(1 - r_s/r)
+    g_11 = 1 / (1 - r_s/r)
+    g_22 = r * r
+    
+    return g_00, g_11, g_22, r_s
+
+
+@dataclass
+class ResultadoEinstein(Resultado):
+    """Acoplamento κ e métrica de Schwarzschild do Sol a 1 UA"""
+    titulo = "6. EQUAÇÃO DE CAMPO DE EINSTEIN"
+
+    kappa: float
+    M: float
+    r_s: float
+    r: float
+    g_00: float
+    g_11: float
+    g_22: float
+    desvio_percentual: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "G^μν + Λg^μν = (8πG/c⁴) T^μν\n"
+        yield "Fator de acoplamento: κ = 8πG/c⁴"
+        yield f"κ = {self.kappa:.6e} m/J\n"
+        yield "Métrica de Schwarzschild ao redor do Sol"
+        yield f"Massa do Sol: {self.M:.6e} kg"
+        yield f"Raio de Schwarzschild: {self.r_s:.6e} m"
+        yield f"Distância teste (1 UA): {self.r:.6e} m\n"
+        yield "Componentes da métrica em r = 1 UA:"
+        yield f"g₀₀ = {self.g_00:.15f}"
+        yield f"g₁₁ = {self.g_11:.15f}"
+        yield f"g₂₂ = {self.g_22:.6e}"
+        yield f"Desvio da planicidade: {self.desvio_percentual:.6e}%"
+
+
+def teste_einstein():
+    """Testa a métrica de Schwarzschild"""
+    K = constantes.atual()
+
+    # Métrica de Schwarzschild ao redor do Sol
+    r = 1.496e11  # 1 UA
+    
+    g_00, g_11, g_22, r_s = schwarzschild_metric(r, K.M_sun)
+    
+    desvio = abs(1 + g_00) * 100
+    return ResultadoEinstein(K.kappa, K.M_sun, r_s, r, g_00, g_11, g_22, desvio)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def temperatura_hawking(M):
+    """
+    Temperatura de radiação de Hawking
+    T_H = (ħc³) / (8πk_B GM)
+    
+    Args:
+        M: Massa do buraco negro (kg)
+    
+    Returns:
+        Temperatura (K)
+    """
+    K = constantes.atual()
+    return (K.hbar * K.c3) / (8 * math.pi * K.k_B * K.G * M)
+
+
+@dataclass
+class ResultadoHawking(Resultado):
+    """Temperatura de Hawking de um buraco negro de 5 massas solares"""
+    titulo = "7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO"
+
+    M: float
+    T_H: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "Radiação de Hawking: T_H = (ħc³) / (8πk_B G M)\n"
+        yield "Radiação de Hawking"
+        yield f"Massa do buraco negro: {self.M:.6e} kg"
+        yield f"Temperatura de Hawking: {self.T_H:.6e} K"
+
+
+def teste_hawking():
+    """Testa a radiação de Hawking"""
+    M_BN = 5 * constantes.atual().M_sun  # 5 massas solares
+    return ResultadoHawking(M_BN, temperatura_hawking(M_BN))
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            8. RELAÇÃO DE DISPERSÃO QUÂNTICA + RELATIVÍSTICA               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def energia_relativistica(p, m):
+    """
+    Relação de dispersão de Dirac
+    E² = (pc)² + (mc²)²
+    
+    Args:
+        p: Momento (kg·m/s)
+        m: Massa (kg)
+    
+    Returns:
+        Energia (J)
+    """
+    K = constantes.atual()
+    pc = p * K.c
+    mc2 = m * K.c2
+    return math.sqrt(pc * pc + mc2 * mc2)
+
+
+@dataclass
+class ResultadoDirac(Resultado):
+    """Energias de repouso, total e cinética de um elétron"""
+    titulo = "8. RELAÇÃO DE DISPERSÃO (QUÂNTICA + RELATIVÍSTICA)"
+
+    m: float
+    p: float
+    E_repouso: float
+    E_total: float
+    E_cinetica: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "E² = (pc)² + (mc²)²\n"
+        yield "Elétron com momento p = 1e-24 kg·m/s"
+        yield f"Energia de repouso (E₀):    {self.E_repouso:.6e} J ({self.E_repouso/1.60218e-19:.6f} MeV)"
+        yield f"Energia total (E):          {self.E_total:.6e} J ({self.E_total/1.60218e-19:.6f} MeV)"
+        yield f"Energia cinética (K):       {self.E_cinetica:.6e} J ({self.E_cinetica/1.60218e-19:.6f} MeV)"
+
+
+def teste_dirac():
+    """Testa a relação relativística quântica"""
+    m_e = 9.10938e-31  # kg (elétron)
+    p = 1e-24  # kg·m/s
+    
+    E_0 = m_e * constantes.atual().c2
+    E_total = energia_relativistica(p, m_e)
+    # K = (pc)² / (E + mc²), sem o cancelamento de E - mc² para p ≪ mc
+    _, E_kinetic, _ = calculos_vetorizados.dispersao_relativistica(p, m_e)
+    return ResultadoDirac(m_e, p, E_0, E_total, float(E_kinetic))
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                9. ENTROPIA BEKENSTEIN-HAWKING                             ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def entropia_bekenstein_hawking(M):
+    """
+    Entropia de um buraco negro
+    S = (A k_B c³) / (4 ħ G) onde A = 4πr_s²
+    
+    Args:
+        M: Massa do buraco negro (kg)
+    
+    Returns:
+        Entropia (J/K)
+    """
+    K = constantes.atual()
+    r_s = 2 * K.G * M / K.c2
+    A = 4 * math.pi * (r_s * r_s)
+    return (A * K.k_B * K.c3) / (4 * K.hbar * K.G)
+
+
+@dataclass
+class ResultadoBekenstein(Resultado):
+    """Entropia e número de microestados de 5 massas solares"""
+    titulo = "9. ENTROPIA DE UM BURACO NEGRO (BEKENSTEIN-HAWKING)"
+
+    M: float
+    S: float
+    log10_microestados: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "S = (A k_B c³) / (4 ħ G)\n"
+        yield "Buraco Negro de ~5 massas solares"
+        yield f"Massa: {self.M:.6e} kg"
+        yield f"Entropia de Bekenstein-Hawking: {self.S:.6e} J/K"
+        yield f"Número de estados quânticos: 10^{self.log10_microestados:.2e}"
+
+
+def teste_bekenstein():
+    """Testa a entropia de Bekenstein-Hawking"""
+    M_BN = 5 * constantes.atual().M_sun
+    S = entropia_bekenstein_hawking(M_BN)
+    
+    # Número de microestados
+    microstates_log10 = S / (constantes.atual().k_B * math.log(10))
+    return ResultadoBekenstein(M_BN, S, microstates_log10)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║               10. SÍNTESE: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL              ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+PRINCIPIOS_VERIFICADOS = (
+    "Princípio de Incerteza de Heisenberg",
+    "Equação de Schrödinger",
+    "Equações de Campo de Einstein",
+    "Termodinâmica de buracos negros",
+    "Teoria Quântica de Campos",
+)
+
+
+@dataclass
+class ResultadoSintese(Resultado):
+    """Escalas de Planck, escalas gravitacionais e validação cruzada"""
+    titulo = "SÍNTESE: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL"
+
+    l_P: float
+    m_P: float
+    t_P: float
+    E_P: float
+    r_s_sun: float
+    Lambda_obs: float
+    razao_l_P_r_s: float
+    principios: tuple
+    produto_incerteza: float
+    desvio_metrica: float
+    T_H: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\n1. REGIME QUÂNTICO (escalas pequenas):"
+        yield f"   Comprimento de Planck: {self.l_P:.6e} m"
+        yield f"   Massa de Planck: {self.m_P:.6e} kg"
+        yield f"   Tempo de Planck: {self.t_P:.6e} s"
+        yield f"   Energia de Planck: {self.E_P:.6e} J"
+        yield "\n2. REGIME GRAVITACIONAL (escalas grandes):"
+        yield f"   Raio de Schwarzschild do Sol: {self.r_s_sun:.6e} m"
+        yield f"   Constante cosmológica observada: {self.Lambda_obs:.6e} m⁻²"
+        yield "\n3. TRANSIÇÃO QUÂNTICO-CLÁSSICA:"
+        yield f"   Razão l_P / r_s_sun = {self.razao_l_P_r_s:.6e}"
+        yield "   → A gravidade é clássica a escalas grandes"
+        yield "   → Efeitos quânticos dominam a escalas de Planck"
+        yield "\n4. PRINCÍPIOS VERIFICADOS:"
+        for principio in self.principios:
+            yield f"   ✓ {principio}"
+        yield "\n5. VALIDAÇÃO NUMÉRICA:"
+        yield f"   Incerteza (Planck): Δx·Δp = {self.produto_incerteza:.6e} J·s (≈ ħ/2)"
+        yield f"   Métrica (Schwarzschild): Desvio = {self.desvio_metrica:.6e}% (muito pequeno a 1 UA)"
+        yield f"   Hawking (BN): T = {self.T_H:.6e} K (compatível com relatividade)"
+
+
+def teste_sintese():
+    """Síntese final da unificação"""
+    K = constantes.atual()
+    
+    r_s_sun = K.r_s_sun
+    Lambda_obs = 1.11e-52  # m⁻²
+    razao = K.l_P / r_s_sun
+    
+    delta_x = K.l_P
+    delta_p = incerteza_heisenberg(delta_x)
+    
+    g_00, g_11, g_22, r_s = schwarzschild_metric(1.496e11, K.M_sun)
+    desvio_metric = abs(1 + g_00) * 100
+    
+    T_H = temperatura_hawking(5 * K.M_sun)
+    return ResultadoSintese(K.l_P, K.m_P, K.t_P, K.E_P, r_s_sun, Lambda_obs, razao,
+                            PRINCIPIOS_VERIFICADOS, delta_x * delta_p, desvio_metric, T_H)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# Seções na ordem do relatório
+SECOES = (
+    exibir_constantes,
+    teste_heisenberg,
+    teste_schrodinger,
+    teste_oscilador,
+    teste_tensor_energia,
+    teste_einstein,
+    teste_hawking,
+    teste_dirac,
+    teste_bekenstein,
+    teste_sintese,
+)
+
+
+@dataclass
+class Abertura(Resultado):
+    """Cabeçalho do relatório"""
+    titulo = "🔬 CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL 🔬"
+
+    execucao: str
+    precisao: str = "SI 2019 (máxima)"
+
+    def linhas_console(self):
+        yield "\n" + "█"*80
+        yield self.titulo
+        yield "█"*80
+        yield f"Execução: {self.execucao}"
+        yield f"Precisão: {self.precisao}"
+
+
+@dataclass
+class Encerramento(Resultado):
+    """Resumo final do relatório"""
+    titulo = "FIM DOS CÁLCULOS VERIFICADOS"
+
+    garantias: tuple = (
+        "Constantes físicas do SI de precisão máxima",
+        "Fórmulas derivadas e comprovadas experimentalmente",
+        "Unidades consistentes internacionalmente",
+        "Sem especulações ou notações inventadas",
+    )
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\nTodos os cálculos acima foram realizados com:"
+        for garantia in self.garantias:
+            yield f"- {garantia}"
+        yield "█"*80 + "\n"
+
+
+def executar_secoes():
+    """
+    Executa todas as seções, sem formatação
+
+    Returns:
+        list: Registros de resultado, na ordem de SECOES
+    """
+    return [secao() for secao in SECOES]
+
+
+def main():
+    """Executa todos os testes e renderiza o relatório"""
+    parser = argparse.ArgumentParser(description="Cálculos verdadeiros: unificação quântico-gravitacional")
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    parser.add_argument('--saida', default=None, help="arquivo de saída (padrão: terminal)")
+    parser.add_argument('--modo', choices=executor_secoes.MODOS, default='sequencial',
+                        help="execução das seções (saída sempre na mesma ordem)")
+    parser.add_argument('--trabalhadores', type=int, default=None)
+    parser.add_argument('--tempos', action='store_true',
+                        help="acrescenta tempo de parede, CPU e pico de memória por seção")
+    args = parser.parse_args()
+
+    secoes, tempos = executor_secoes.executar(SECOES, args.modo, args.trabalhadores,
+                                              medir=args.tempos)
+    resultados = [Abertura(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))]
+    resultados += secoes
+    resultados.append(Encerramento())
+    if args.tempos:
+        resultados.append(tempos)
+
+    if args.saida is None:
+        renderizacao.renderizar(resultados, args.formato, sys.stdout)
+    else:
+        with open(args.saida, 'w', encoding='utf-8') as destino:
+            renderizacao.renderizar(resultados, args.formato, destino)
+
+
+# Instrumentação opcional (perfil.py); sem a variável, nenhum custo (nem a
+# importação do perfil); o valor (tabela, 1, 0, ...) é interpretado lá
+if os.environ.get('PERFIL_KERNELS'):
+    import perfil
+    perfil.ao_importar(__name__)
+
+
+if __name__ == "__main__":
+    main()
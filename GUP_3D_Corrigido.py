@@ -1,394 +1,735 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-GUP 3D CORRIGIDO: GRAVITAÇÃO QUÂNTICA COM INCERTEZA GENERALIZADA
-================================================================
-
-AUDITORIA TÉCNICA IMPLEMENTADA:
-✅ Correção 1: √(5α/3) ℓ_P (não √(3α/5))
-✅ Correção 2: α = 3/5 (não 5/3)
-✅ Correção 3: Declaração explícita truncamento O(ℓ_P²)
-✅ Correção 4: Marcação de termo O(ℓ_P⁴) em [X̂ᵢ, X̂ⱼ]
-
-Pronto para peer-review e publicação.
-Status: ✅ AUDITADO E CORRIGIDO
-"""
-
-import numpy as np
-import math
-from datetime import datetime
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                    CONSTANTES FÍSICAS FUNDAMENTAIS SI 2019                ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-hbar = 1.054571817e-34  # J·s
-c = 299792458           # m/s (exato)
-G = 6.67430e-11         # m³/(kg·s²)
-k_B = 1.380649e-23      # J/K
-M_sun = 1.98892e+30     # kg
-
-# Planck scales
-l_P = math.sqrt(hbar * G / c**3)
-m_P = math.sqrt(hbar * c / G)
-t_P = math.sqrt(hbar * G / c**5)
-E_P = m_P * c**2
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                  SEÇÃO I: COMUTADORES GUP EM 3D                          ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-class GUP3D:
-    """
-    Generalized Uncertainty Principle em 3+1D
-    
-    Base teórica: Kempf, Mangano, Mann (1995)
-    Extensão: Forma tensorial com diádico
-    
-    Trabalha em regime de baixa energia O(ℓ_P²),
-    negligenciando contribuições O(ℓ_P⁴) e superiores.
-    """
-    
-    def __init__(self, alpha=0.6):
-        """
-        Inicializa GUP com parâmetro de acoplamento
-        
-        Args:
-            alpha: Parâmetro de acoplamento gravitacional-quântico
-                   Valor fisicamente relevante: α = 3/5 = 0.6
-        """
-        self.alpha = alpha
-        self.beta = 2 * alpha  # Condição de Jacobi: β = 2α
-        
-        if not math.isclose(self.beta, 2 * self.alpha):
-            raise ValueError("Condição de Jacobi violada: β ≠ 2α")
-    
-    def comutador_canonico_3d(self, P_squared):
-        """
-        Comutador canônico com forma completa isotrópica
-        
-        [X̂ᵢ, P̂ⱼ] = iℏ[δᵢⱼ f(P²) + g(P²) P̂ᵢ P̂ⱼ]
-        
-        onde:
-            f(P²) = 1 + α ℓ_P² P²
-            g(P²) = 2α ℓ_P²
-        
-        Args:
-            P_squared: ⟨P²⟩ (valor esperado de P²)
-        
-        Returns:
-            Tuple (f, g) - coeficientes da forma isotrópica
-        """
-        f_P2 = 1 + self.alpha * l_P**2 * P_squared
-        g_P2 = 2 * self.alpha * l_P**2
-        
-        return f_P2, g_P2
-    
-    def incerteza_posicao_minima(self, Delta_P=None):
-        """
-        VERSÃO CORRIGIDA: Incerteza mínima de posição
-        
-        Derivação rigorosa (3D isotrópico):
-        ────────────────────────────────────
-        
-        ⟨PᵢPⱼ⟩ = (1/3)δᵢⱼ⟨P²⟩
-        
-        ΔX·ΔP ≥ (ℏ/2){1 + α ℓ_P²⟨P²⟩ + 2α ℓ_P²(1/3)⟨P²⟩}
-        
-              = (ℏ/2){1 + (5/3)α ℓ_P²(ΔP)²}
-        
-        Minimização resulta em:
-        ✅ (ΔX)ₘᵢₙ = √(5α/3) ℓ_P    [CORRIGIDO: era √(3α/5)]
-        
-        Returns:
-            float: (ΔX)ₘᵢₙ em metros
-        """
-        # Incerteza mínima (sem dependência de ΔP)
-        # Fator numérico CORRIGIDO: 5α/3 (não 3α/5)
-        coeficiente_numerico = math.sqrt(5 * self.alpha / 3)
-        
-        Delta_X_min = coeficiente_numerico * l_P
-        
-        return Delta_X_min
-    
-    def parametro_alpha_para_Planck(self):
-        """
-        CORRIGIDO: Calcula α necessário para (ΔX)ₘᵢₙ = ℓ_P
-        
-        Equação:
-        ✅ √(5α/3) = 1  ⟹  α = 3/5  [CORRIGIDO: era 5/3]
-        
-        Returns:
-            float: α = 3/5 = 0.6
-        """
-        # Fórmula corrigida
-        alpha_correct = 3 / 5  # = 0.6
-        
-        return alpha_correct
-    
-    def comutador_espacial_com_ordem(self, Delta_P):
-        """
-        [X̂ᵢ, X̂ⱼ] = -2iℏα ℓ_P²(X̂ᵢ P̂ⱼ - X̂ⱼ P̂ᵢ) + O(ℓ_P⁴)
-        
-        IMPORTANTE: Marcação de termo O(ℓ_P⁴) explicita
-        que essa é não-comutatividade EFETIVA, não fundamental.
-        
-        Args:
-            Delta_P: Incerteza no momento
-        
-        Returns:
-            dict: Componentes e estimativa do termo de ordem superior
-        """
-        termo_principal = -2 * hbar * self.alpha * l_P**2
-        
-        # Estimativa do termo O(ℓ_P⁴)
-        # Ordem de magnitude: α ℓ_P⁴ ρ³ onde ρ ~ (ΔP)
-        termo_ordem_superior = self.alpha * l_P**4 * Delta_P**3
-        razao_ordem = termo_ordem_superior / abs(termo_principal) if termo_principal != 0 else float('inf')
-        
-        return {
-            'termo_principal': termo_principal,
-            'O_termo': termo_ordem_superior,
-            'razao': razao_ordem,
-            'regime_valido': razao_ordem < 0.1  # Válido se O(ℓ_P⁴) < 10% do principal
-        }
-    
-    def verificacao_Jacobi(self):
-        """
-        Verifica identidade de Jacobi como teste de consistência
-        
-        [P̂ᵢ, [P̂ⱼ, P̂ₖ]] + cyclic = 0
-        
-        força necessariamente β = 2α
-        
-        Returns:
-            dict: Status de verificação
-        """
-        identidade_satisfeita = math.isclose(self.beta, 2 * self.alpha, rel_tol=1e-10)
-        
-        return {
-            'Jacobi_identidade': identidade_satisfeita,
-            'alpha': self.alpha,
-            'beta': self.beta,
-            'beta_esperado': 2 * self.alpha,
-            'diferenca': abs(self.beta - 2 * self.alpha)
-        }
-
-
-# ╔════════════════════════════════════════════════════════════════════════════╗
-# ║                      TESTES E VALIDAÇÃO NUMÉRICA                          ║
-# ╚════════════════════════════════════════════════════════════════════════════╝
-
-def teste_1_comutador_canonico():
-    """Teste 1: Comutador canônico 3D"""
-    print("\n" + "="*80)
-    print("TESTE 1: COMUTADOR CANÔNICO TENSORIAL 3D")
-    print("="*80)
-    
-    gup = GUP3D(alpha=0.6)
-    
-    # Vários valores de P²
-    P_squared_values = np.logspace(0, 30, 5)
-    
-    print("\nForma tensorial completa:")
-    print("[X̂ᵢ, P̂ⱼ] = iℏ[δᵢⱼ f(P²) + 2α ℓ_P² P̂ᵢ P̂ⱼ]")
-    print("\nf(P²) = 1 + α ℓ_P² P²")
-    print("g(P²) = 2α ℓ_P² = constant")
-    
-    print("\n{:>15} | {:>20} | {:>20}".format("P² (kg·m/s)²", "f(P²)", "g(P²)"))
-    print("-" * 60)
-    
-    for P2 in P_squared_values:
-        f, g = gup.comutador_canonico_3d(P2)
-        print("{:>15.6e} | {:>20.12f} | {:>20.12e}".format(P2, f, g))
-    
-    return gup
-
-
-def teste_2_incerteza_minima():
-    """Teste 2: INCERTEZA MÍNIMA CORRIGIDA"""
-    print("\n" + "="*80)
-    print("TESTE 2: RELAÇÃO DE INCERTEZA MÍNIMA (CORRIGIDA)")
-    print("="*80)
-    
-    print("\n⚠️  CORREÇÃO APLICADA:")
-    print("❌ Anterior (ERRADA):  (ΔX)ₘᵢₙ = √(3α/5) ℓ_P")
-    print("✅ Corrigida (CERTA):  (ΔX)ₘᵢₙ = √(5α/3) ℓ_P")
-    
-    valores_alpha = {
-        'α = 1/2': 0.5,
-        'α = 3/5 (FÍSICO)': 0.6,
-        'α = 1': 1.0
-    }
-    
-    print("\nIncerteza mínima por valor de α:")
-    print("{:>20} | {:>20} | {:>20}".format("Parametro α", "(ΔX)ₘᵢₙ (m)", "(ΔX)ₘᵢₙ/ℓ_P"))
-    print("-" * 65)
-    
-    for label, alpha_val in valores_alpha.items():
-        gup = GUP3D(alpha=alpha_val)
-        Delta_X_min = gup.incerteza_posicao_minima()
-        razao = Delta_X_min / l_P
-        
-        marca = " ✅ CORRETO" if alpha_val == 0.6 else ""
-        print("{:>20} | {:>20.6e} | {:>20.6f}{}".format(label, Delta_X_min, razao, marca))
-
-
-def teste_3_parametro_alpha():
-    """Teste 3: FIXAÇÃO DE α PARA (ΔX)ₘᵢₙ = ℓ_P"""
-    print("\n" + "="*80)
-    print("TESTE 3: PARAMETRO ACOPLAMENTO CORRIGIDO")
-    print("="*80)
-    
-    print("\n⚠️  CORREÇÃO APLICADA:")
-    print("❌ Anterior (ERRADA):  α = 5/3 ≈ 1.667")
-    print("✅ Corrigida (CERTA):  α = 3/5 = 0.6")
-    
-    gup = GUP3D(alpha=0.6)
-    alpha_correto = gup.parametro_alpha_para_Planck()
-    
-    print("\nDerivação:")
-    print("Desejamos: (ΔX)ₘᵢₙ = ℓ_P")
-    print("\n√(5α/3) ℓ_P = ℓ_P")
-    print("⟹ 5α/3 = 1")
-    print("⟹ α = 3/5 = 0.6")
-    
-    print(f"\n✅ Valor correto: α = {alpha_correto}")
-    print(f"   (ANTES: α = 5/3 ≈ {5/3:.4f} estava ERRADO)")
-    
-    # Teste
-    Delta_X_min = gup.incerteza_posicao_minima()
-    diferenca = abs(Delta_X_min - l_P) / l_P * 100
-    
-    print(f"\nVerificação:")
-    print(f"(ΔX)ₘᵢₙ = {Delta_X_min:.6e} m")
-    print(f"ℓ_P      = {l_P:.6e} m")
-    print(f"Diferença: {diferenca:.6e} % ✅ (OK)")
-
-
-def teste_4_jacobi_consistency():
-    """Teste 4: Verificação de Jacobi"""
-    print("\n" + "="*80)
-    print("TESTE 4: IDENTIDADE DE JACOBI (CONSISTÊNCIA)")
-    print("="*80)
-    
-    gup = GUP3D(alpha=0.6)
-    result = gup.verificacao_Jacobi()
-    
-    print("\nIdentidade de Jacobi:")
-    print("[P̂ᵢ, [P̂ⱼ, P̂ₖ]] + ciclos = 0")
-    print("\nForça necessariamente: β = 2α")
-    
-    print(f"\nParâmetros:")
-    print(f"  α = {result['alpha']}")
-    print(f"  β (implementado) = {result['beta']}")
-    print(f"  β (esperado) = {result['beta_esperado']}")
-    print(f"  Diferença = {result['diferenca']:.6e}")
-    
-    status = "✅ PASSA" if result['Jacobi_identidade'] else "❌ FALHA"
-    print(f"\n{status}: Jacobi identidade consistente")
-
-
-def teste_5_ordem_grandeza():
-    """Teste 5: Análise de ordem de grandeza O(ℓ_P⁴)"""
-    print("\n" + "="*80)
-    print("TESTE 5: VALIDAÇÃO DO REGIME O(ℓ_P²)")
-    print("="*80)
-    
-    gup = GUP3D(alpha=0.6)
-    
-    print("\nDeclaração de truncamento:")
-    print("Trabalhamos até ordem O(ℓ_P²), negligenciando contribuições O(ℓ_P⁴).")
-    
-    # Teste com vários momentos
-    Delta_P_valores = np.array([1e-30, 1e-25, 1e-20, 1e-15]) * hbar / l_P
-    
-    print("\nValidação: razão O(ℓ_P⁴) / termo principal")
-    print("{:>20} | {:>20} | {:>15}".format("ΔP (kg·m/s)", "Razão", "Válido?"))
-    print("-" * 60)
-    
-    for DP in Delta_P_valores:
-        result = gup.comutador_espacial_com_ordem(DP)
-        validez = "✅ SIM" if result['regime_valido'] else "❌ NÃO"
-        print("{:>20.6e} | {:>20.6e} | {:>15}".format(DP, result['razao'], validez))
-    
-    print("\n✅ Regime O(ℓ_P²) válido para escalas quântico-gravitacionais")
-
-
-def teste_6_comparacao_antes_depois():
-    """Teste 6: Comparação antes/depois da auditoria"""
-    print("\n" + "="*80)
-    print("TESTE 6: TABELA COMPARATIVA - ANTES vs DEPOIS")
-    print("="*80)
-    
-    print("\n{:>40} | {:>25} | {:>25}".format("QUANTIDADE", "ANTES (ERRADO)", "DEPOIS (CORRETO)"))
-    print("-" * 95)
-    
-    dados = [
-        ("Forma [X̂ᵢ, P̂ⱼ]", "Apenas termo δᵢⱼ f", "✅ + termo diádico P̂ᵢ P̂ⱼ"),
-        ("Coef. incerteza", "√(3α/5)", "✅ √(5α/3)"),
-        ("Parâmetro α", "5/3 ≈ 1.667", "✅ 3/5 = 0.6"),
-        ("Truncamento", "Não declarado", "✅ O(ℓ_P²) explícito"),
-        ("[X̂ᵢ, X̂ⱼ]", "Sem O(ℓ_P⁴)", "✅ + O(ℓ_P⁴) marcado"),
-    ]
-    
-    for quant, antes, depois in dados:
-        print("{:>40} | {:>25} | {:>25}".format(quant, antes, depois))
-    
-    print("\n✅ TODAS AS CORREÇÕES IMPLEMENTADAS")
-
-
-def relatorio_auditoria_final():
-    """Relatório final de auditoria"""
-    print("\n" + "█"*80)
-    print("RELATÓRIO FINAL DE AUDITORIA TÉCNICA")
-    print("█"*80)
-    
-    print("\n📋 STATUS DE VERIFICAÇÃO:")
-    print("  ✅ Erro 1 (fator numérico): CORRIGIDO")
-    print("  ✅ Erro 2 (parâmetro α): CORRIGIDO")
-    print("  ✅ Erro 3 (truncamento): DECLARADO")
-    print("  ✅ Erro 4 (termo O(ℓ_P⁴)): ADICIONADO")
-    
-    print("\n🎯 VIABILIDADE PARA PUBLICAÇÃO:")
-    print("  ⭐⭐⭐⭐⭐ (5/5) - Pronto para peer-review")
-    
-    print("\n📚 REFERÊNCIAS IMPLEMENTADAS:")
-    print("  [1] Kempf, A., Mangano, G., Mann, R. B. (1995)")
-    print("      'Hilbert space representation of minimal length'")
-    print("      Phys. Rev. D 52, 1108")
-    print("  [2] Snyder, H. S. (1947) 'Quantized space-time'")
-    print("      Phys. Rev. 71, 38")
-    
-    print("\n✅ CONCLUSÃO:")
-    print("  Estrutura corrigida e pronta para:"
-)
-    print("  • Publicação em periódico peer-reviewed")
-    print("  • Defesa em seminário técnico")
-    print("  • Extensão para acoplamento com relatividade geral")
-    
-    print("\n" + "█"*80 + "\n")
-
-
-def main():
-    """Executa todos os testes da auditoria"""
-    print("\n" + "█"*80)
-    print("🔬 AUDITORIA TÉCNICA: GUP 3D COM CORREÇÕES")
-    print("█"*80)
-    print(f"Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("Status: ✅ TODAS AS CORREÇÕES IMPLEMENTADAS")
-    
-    # Executa testes
-    teste_1_comutador_canonico()
-    teste_2_incerteza_minima()
-    teste_3_parametro_alpha()
-    teste_4_jacobi_consistency()
-    teste_5_ordem_grandeza()
-    teste_6_comparacao_antes_depois()
-    
-    # Relatório final
-    relatorio_auditoria_final()
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GUP 3D CORRIGIDO: GRAVITAÇÃO QUÂNTICA COM INCERTEZA GENERALIZADA
+================================================================
+
+AUDITORIA TÉCNICA IMPLEMENTADA:
+✅ Correção 1: √(5α/3) ℓ_P (não √(3α/5))
+✅ Correção 2: α = 3/5 (não 5/3)
+✅ Correção 3: Declaração explícita truncamento O(ℓ_P²)
+✅ Correção 4: Marcação de termo O(ℓ_P⁴) em [X̂ᵢ, X̂ⱼ]
+
+Pronto para peer-review e publicação.
+Status: ✅ AUDITADO E CORRIGIDO
+"""
+
+import sys
+import os
+import math
+import argparse
+import numpy as np
+from datetime import datetime
+from dataclasses import dataclass
+
+import constantes
+import renderizacao
+import executor_secoes
+from renderizacao import Resultado
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    CONSTANTES FÍSICAS FUNDAMENTAIS SI 2019                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# hbar, c, G, k_B, M_sun e as escalas de Planck vêm de constantes.py
+# (conjunto CODATA ativo) e continuam importáveis deste módulo
+
+def __getattr__(nome):
+    return constantes.exportar(__name__, nome)
+
+
+# Coeficiente de α no termo principal de [X̂ᵢ, X̂ⱼ], recalculado só quando
+# ħ ou ℓ_P² mudam
+@constantes.derivada('hbar', 'l_P2', nome='gup_termo_principal')
+def _gup_termo_principal(K):
+    return -2 * K.hbar * K.l_P2
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                  SEÇÃO I: COMUTADORES GUP EM 3D                          ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class GUP3D:
+    """
+    Generalized Uncertainty Principle em 3+1D
+    
+    Base teórica: Kempf, Mangano, Mann (1995)
+    Extensão: Forma tensorial com diádico
+    
+    Trabalha em regime de baixa energia O(ℓ_P²),
+    negligenciando contribuições O(ℓ_P⁴) e superiores.
+    """
+    
+    def __init__(self, alpha=0.6):
+        """
+        Inicializa GUP com parâmetro de acoplamento
+        
+        Args:
+            alpha: Parâmetro de acoplamento gravitacional-quântico
+                   Valor fisicamente relevante: α = 3/5 = 0.6
+        """
+        self.alpha = alpha
+        self.beta = 2 * alpha  # Condição de Jacobi: β = 2α
+        
+        if not math.isclose(self.beta, 2 * self.alpha):
+            raise ValueError("Condição de Jacobi violada: β ≠ 2α")
+    
+    def comutador_canonico_3d(self, P_squared):
+        """
+        Comutador canônico com forma completa isotrópica
+        
+        [X̂ᵢ, P̂ⱼ] = iℏ[δᵢⱼ f(P²) + g(P²) P̂ᵢ P̂ⱼ]
+        
+        onde:
+            f(P²) = 1 + α ℓ_P² P²
+            g(P²) = 2α ℓ_P²
+        
+        Args:
+            P_squared: ⟨P²⟩ (valor esperado de P²)
+        
+        Returns:
+            Tuple (f, g) - coeficientes da forma isotrópica
+        """
+        l_P2 = constantes.atual().l_P2
+        f_P2 = 1 + self.alpha * l_P2 * P_squared
+        g_P2 = 2 * self.alpha * l_P2
+        
+        return f_P2, g_P2
+    
+    def incerteza_posicao_minima(self, Delta_P=None):
+        """
+        VERSÃO CORRIGIDA: Incerteza mínima de posição
+        
+        Derivação rigorosa (3D isotrópico):
+        ────────────────────────────────────
+        
+        ⟨PᵢPⱼ⟩ = (1/3)δᵢⱼ⟨P²⟩
+        
+        ΔX·ΔP ≥ (ℏ/2){1 + α ℓ_P²⟨P²⟩ + 2α ℓ_P²(1/3)⟨P²⟩}
+        
+              = (ℏ/2){1 + (5/3)α ℓ_P²(ΔP)²}
+        
+        Minimização resulta em:
+        ✅ (ΔX)ₘᵢₙ = √(5α/3) ℓ_P    [CORRIGIDO: era √(3α/5)]
+        
+        Returns:
+            float: (ΔX)ₘᵢₙ em metros
+        """
+        # Incerteza mínima (sem dependência de ΔP)
+        # Fator numérico CORRIGIDO: 5α/3 (não 3α/5)
+        coeficiente_numerico = math.sqrt(5 * self.alpha / 3)
+        
+        Delta_X_min = coeficiente_numerico * constantes.atual().l_P
+        
+        return Delta_X_min
+    
+    def parametro_alpha_para_Planck(self):
+        """
+        CORRIGIDO: Calcula α necessário para (ΔX)ₘᵢₙ = ℓ_P
+        
+        Equação:
+        ✅ √(5α/3) = 1  ⟹  α = 3/5  [CORRIGIDO: era 5/3]
+        
+        Returns:
+            float: α = 3/5 = 0.6
+        """
+        # Fórmula corrigida
+        alpha_correct = 3 / 5  # = 0.6
+        
+        return alpha_correct
+    
+    def comutador_espacial_com_ordem(self, Delta_P):
+        """
+        [X̂ᵢ, X̂ⱼ] = -2iℏα ℓ_P²(X̂ᵢ P̂ⱼ - X̂ⱼ P̂ᵢ) + O(ℓ_P⁴)
+        
+        IMPORTANTE: Marcação de termo O(ℓ_P⁴) explicita
+        que essa é não-comutatividade EFETIVA, não fundamental.
+        
+        Args:
+            Delta_P: Incerteza no momento
+        
+        Returns:
+            dict: Componentes e estimativa do termo de ordem superior
+        """
+        K = constantes.atual()
+        termo_principal = K.gup_termo_principal * self.alpha
+        
+        # Estimativa do termo O(ℓ_P⁴)
+        # Ordem de magnitude: α ℓ_P⁴ ρ³ onde ρ ~ (ΔP)
+        termo_ordem_superior = self.alpha * K.l_P4 * (Delta_P * Delta_P * Delta_P)
+        razao_ordem = termo_ordem_superior / abs(termo_principal) if termo_principal != 0 else float('inf')
+        
+        return {
+            'termo_principal': termo_principal,
+            'O_termo': termo_ordem_superior,
+            'razao': razao_ordem,
+            'regime_valido': razao_ordem < 0.1  # Válido se O(ℓ_P⁴) < 10% do principal
+        }
+    
+    def verificacao_Jacobi(self):
+        """
+        Verifica identidade de Jacobi como teste de consistência
+        
+        [P̂ᵢ, [P̂ⱼ, P̂ₖ]] + cyclic = 0
+        
+        força necessariamente β = 2α
+        
+        Returns:
+            dict: Status de verificação
+        """
+        identidade_satisfeita = math.isclose(self.beta, 2 * self.alpha, rel_tol=1e-10)
+        
+        return {
+            'Jacobi_identidade': identidade_satisfeita,
+            'alpha': self.alpha,
+            'beta': self.beta,
+            'beta_esperado': 2 * self.alpha,
+            'diferenca': abs(self.beta - 2 * self.alpha)
+        }
+
+
+class GUP3DEnsemble:
+    """
+    Conjunto de N modelos GUP3D em estrutura de arrays
+
+    Guarda os N pares (α, β) em dois arrays contíguos, em vez de N objetos
+    GUP3D. Os métodos avaliam todos os modelos contra uma grade de momentos
+    em uma única chamada com broadcasting: o resultado tem forma
+    (N,) + forma_dos_momentos.
+
+    Em float64 os valores são idênticos, bit a bit, aos de GUP3D.
+    """
+
+    def __init__(self, alpha, beta=None):
+        """
+        Inicializa o conjunto de parâmetros de acoplamento
+
+        Args:
+            alpha: Array (N,) de parâmetros α
+            beta: Array (N,) de parâmetros β (padrão: β = 2α, condição
+                  de Jacobi). Valores explícitos não são validados aqui;
+                  use verificacao_Jacobi() para testá-los em lote.
+        """
+        self.alpha = np.atleast_1d(np.asarray(alpha, dtype=np.float64))
+        if self.alpha.ndim != 1:
+            raise ValueError("alpha deve ser um array 1D")
+
+        if beta is None:
+            self.beta = 2 * self.alpha
+        else:
+            self.beta = np.broadcast_to(np.asarray(beta, dtype=np.float64), self.alpha.shape).copy()
+
+    def __len__(self):
+        return self.alpha.size
+
+    def _alpha_grade(self, momentos):
+        """α com eixos extras para broadcasting contra `momentos`"""
+        return self.alpha.reshape((-1,) + (1,) * momentos.ndim)
+
+    def comutador_canonico_3d(self, P_squared, out=None):
+        """
+        Coeficientes f(P²) e g(P²) para a grade α × P²
+
+        Args:
+            P_squared: Array de valores ⟨P²⟩
+            out: Buffer opcional para f, de forma (N,) + P_squared.shape,
+                 ou tupla (f, g) de buffers (entradas None são alocadas);
+                 g tem forma (N,) + (1,) * P_squared.ndim
+
+        Returns:
+            Tuple (f, g) - arrays de forma (N,) + P_squared.shape;
+            g não depende de P² e é devolvido como visão sem cópia
+        """
+        out_f, out_g = out if isinstance(out, tuple) else (out, None)
+        P_squared = np.asarray(P_squared, dtype=np.float64)
+        alpha = self._alpha_grade(P_squared)
+
+        l_P2 = constantes.atual().l_P2
+        f_P2 = np.empty(alpha.shape[:1] + P_squared.shape) if out_f is None else out_f
+        np.multiply(alpha, l_P2, out=f_P2)
+        np.multiply(f_P2, P_squared, out=f_P2)
+        f_P2 += 1
+
+        g_P2 = np.multiply(2, alpha, out=out_g)
+        g_P2 *= l_P2
+
+        return f_P2, np.broadcast_to(g_P2, f_P2.shape)
+
+    def incerteza_posicao_minima(self, out=None):
+        """
+        Incerteza mínima de posição (ΔX)ₘᵢₙ = √(5α/3) ℓ_P para cada α
+
+        Args:
+            out: Buffer opcional de forma (N,)
+
+        Returns:
+            Array (N,) em metros
+        """
+        Delta_X = np.multiply(5, self.alpha, out=out)
+        np.divide(Delta_X, 3, out=Delta_X)
+        np.sqrt(Delta_X, out=Delta_X)
+        np.multiply(Delta_X, constantes.atual().l_P, out=Delta_X)
+        return Delta_X
+
+    def comutador_espacial_com_ordem(self, Delta_P, out=None):
+        """
+        Razão O(ℓ_P⁴) / termo principal de [X̂ᵢ, X̂ⱼ] para a grade α × ΔP
+
+        Args:
+            Delta_P: Array de incertezas no momento
+            out: Tupla opcional (O_termo, razao, regime_valido) de buffers
+                 de forma (N,) + Delta_P.shape (o último booleano), com um
+                 quarto buffer opcional para termo_principal, de forma
+                 (N,) + (1,) * Delta_P.ndim
+
+        Returns:
+            dict: Mesmas chaves de GUP3D.comutador_espacial_com_ordem;
+                  'termo_principal' tem forma (N, 1, ...) e as demais
+                  (N,) + Delta_P.shape
+        """
+        if out is None:
+            out = (None, None, None)
+        if len(out) == 3:
+            out = tuple(out) + (None,)
+        Delta_P = np.asarray(Delta_P, dtype=np.float64)
+        alpha = self._alpha_grade(Delta_P)
+
+        K = constantes.atual()
+        termo_principal = np.multiply(K.gup_termo_principal, alpha, out=out[3])
+
+        forma = alpha.shape[:1] + Delta_P.shape
+        termo_ordem_superior = np.empty(forma) if out[0] is None else out[0]
+        np.multiply(alpha, K.l_P4, out=termo_ordem_superior)
+        np.multiply(termo_ordem_superior, Delta_P * Delta_P * Delta_P, out=termo_ordem_superior)
+
+        # Mesma convenção escalar: razão infinita quando o termo principal é nulo
+        denominador = np.abs(termo_principal)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razao_ordem = np.divide(termo_ordem_superior, denominador, out=out[1])
+        np.copyto(razao_ordem, np.inf, where=denominador == 0)
+
+        return {
+            'termo_principal': termo_principal,
+            'O_termo': termo_ordem_superior,
+            'razao': razao_ordem,
+            'regime_valido': np.less(razao_ordem, 0.1, out=out[2])
+        }
+
+    def verificacao_Jacobi(self, out=None):
+        """
+        Verifica β = 2α para todos os modelos de uma vez
+
+        Args:
+            out: Tupla opcional (Jacobi_identidade, beta_esperado, diferenca)
+                 de buffers de forma (N,) (o primeiro booleano)
+
+        Returns:
+            dict: Mesmas chaves de GUP3D.verificacao_Jacobi, com arrays (N,)
+        """
+        if out is None:
+            out = (None, None, None)
+        beta_esperado = np.multiply(2, self.alpha, out=out[1])
+        diferenca = np.subtract(self.beta, beta_esperado, out=out[2])
+        np.abs(diferenca, out=diferenca)
+
+        # Mesmo critério simétrico de math.isclose(rel_tol=1e-10)
+        tolerancia = np.maximum(np.abs(self.beta), np.abs(beta_esperado))
+        tolerancia *= 1e-10
+        identidade_satisfeita = np.equal(self.beta, beta_esperado, out=out[0])
+        identidade_satisfeita |= diferenca <= tolerancia
+
+        return {
+            'Jacobi_identidade': identidade_satisfeita,
+            'alpha': self.alpha,
+            'beta': self.beta,
+            'beta_esperado': beta_esperado,
+            'diferenca': diferenca
+        }
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                      TESTES E VALIDAÇÃO NUMÉRICA                          ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class LinhaComutador:
+    """Coeficientes f e g para um valor de P²"""
+    P_squared: float
+    f: float
+    g: float
+
+
+@dataclass
+class ResultadoComutadorCanonico(Resultado):
+    """Teste 1: coeficientes da forma tensorial de [X̂ᵢ, P̂ⱼ]"""
+    titulo = "TESTE 1: COMUTADOR CANÔNICO TENSORIAL 3D"
+
+    alpha: float
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\nForma tensorial completa:"
+        yield "[X̂ᵢ, P̂ⱼ] = iℏ[δᵢⱼ f(P²) + 2α ℓ_P² P̂ᵢ P̂ⱼ]"
+        yield "\nf(P²) = 1 + α ℓ_P² P²"
+        yield "g(P²) = 2α ℓ_P² = constant"
+        yield "\n{:>15} | {:>20} | {:>20}".format("P² (kg·m/s)²", "f(P²)", "g(P²)")
+        yield "-" * 60
+        for linha in self.linhas:
+            yield "{:>15.6e} | {:>20.12f} | {:>20.12e}".format(linha.P_squared, linha.f, linha.g)
+
+
+def teste_1_comutador_canonico():
+    """Teste 1: Comutador canônico 3D"""
+    gup = GUP3D(alpha=0.6)
+    
+    # Vários valores de P²
+    P_squared_values = np.logspace(0, 30, 5)
+    
+    linhas = []
+    for P2 in P_squared_values:
+        f, g = gup.comutador_canonico_3d(P2)
+        linhas.append(LinhaComutador(P2, f, g))
+    
+    return ResultadoComutadorCanonico(gup.alpha, linhas)
+
+
+@dataclass
+class LinhaIncerteza:
+    """(ΔX)ₘᵢₙ para um valor de α"""
+    rotulo: str
+    alpha: float
+    Delta_X_min: float
+    razao_l_P: float
+
+
+@dataclass
+class ResultadoIncertezaMinima(Resultado):
+    """Teste 2: incerteza mínima de posição para vários α"""
+    titulo = "TESTE 2: RELAÇÃO DE INCERTEZA MÍNIMA (CORRIGIDA)"
+
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\n⚠️  CORREÇÃO APLICADA:"
+        yield "❌ Anterior (ERRADA):  (ΔX)ₘᵢₙ = √(3α/5) ℓ_P"
+        yield "✅ Corrigida (CERTA):  (ΔX)ₘᵢₙ = √(5α/3) ℓ_P"
+        yield "\nIncerteza mínima por valor de α:"
+        yield "{:>20} | {:>20} | {:>20}".format("Parametro α", "(ΔX)ₘᵢₙ (m)", "(ΔX)ₘᵢₙ/ℓ_P")
+        yield "-" * 65
+        for linha in self.linhas:
+            marca = " ✅ CORRETO" if linha.alpha == 0.6 else ""
+            yield "{:>20} | {:>20.6e} | {:>20.6f}{}".format(
+                linha.rotulo, linha.Delta_X_min, linha.razao_l_P, marca)
+
+
+def teste_2_incerteza_minima():
+    """Teste 2: INCERTEZA MÍNIMA CORRIGIDA"""
+    valores_alpha = {
+        'α = 1/2': 0.5,
+        'α = 3/5 (FÍSICO)': 0.6,
+        'α = 1': 1.0
+    }
+    
+    linhas = []
+    for label, alpha_val in valores_alpha.items():
+        gup = GUP3D(alpha=alpha_val)
+        Delta_X_min = gup.incerteza_posicao_minima()
+        razao = Delta_X_min / constantes.atual().l_P
+        linhas.append(LinhaIncerteza(label, alpha_val, Delta_X_min, razao))
+
+    return ResultadoIncertezaMinima(linhas)
+
+
+@dataclass
+class ResultadoParametroAlpha(Resultado):
+    """Teste 3: α que fixa (ΔX)ₘᵢₙ = ℓ_P"""
+    titulo = "TESTE 3: PARAMETRO ACOPLAMENTO CORRIGIDO"
+
+    alpha_correto: float
+    Delta_X_min: float
+    l_P: float
+    diferenca_percentual: float
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\n⚠️  CORREÇÃO APLICADA:"
+        yield "❌ Anterior (ERRADA):  α = 5/3 ≈ 1.667"
+        yield "✅ Corrigida (CERTA):  α = 3/5 = 0.6"
+        yield "\nDerivação:"
+        yield "Desejamos: (ΔX)ₘᵢₙ = ℓ_P"
+        yield "\n√(5α/3) ℓ_P = ℓ_P"
+        yield "⟹ 5α/3 = 1"
+        yield "⟹ α = 3/5 = 0.6"
+        yield f"\n✅ Valor correto: α = {self.alpha_correto}"
+        yield f"   (ANTES: α = 5/3 ≈ {5/3:.4f} estava ERRADO)"
+        yield f"\nVerificação:"
+        yield f"(ΔX)ₘᵢₙ = {self.Delta_X_min:.6e} m"
+        yield f"ℓ_P      = {self.l_P:.6e} m"
+        yield f"Diferença: {self.diferenca_percentual:.6e} % ✅ (OK)"
+
+
+def teste_3_parametro_alpha():
+    """Teste 3: FIXAÇÃO DE α PARA (ΔX)ₘᵢₙ = ℓ_P"""
+    gup = GUP3D(alpha=0.6)
+    alpha_correto = gup.parametro_alpha_para_Planck()
+    
+    # Teste
+    Delta_X_min = gup.incerteza_posicao_minima()
+    l_P = constantes.atual().l_P
+    diferenca = abs(Delta_X_min - l_P) / l_P * 100
+    
+    return ResultadoParametroAlpha(alpha_correto, Delta_X_min, l_P, diferenca)
+
+
+@dataclass
+class ResultadoJacobi(Resultado):
+    """Teste 4: consistência β = 2α exigida pela identidade de Jacobi"""
+    titulo = "TESTE 4: IDENTIDADE DE JACOBI (CONSISTÊNCIA)"
+
+    alpha: float
+    beta: float
+    beta_esperado: float
+    diferenca: float
+    identidade_satisfeita: bool
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\nIdentidade de Jacobi:"
+        yield "[P̂ᵢ, [P̂ⱼ, P̂ₖ]] + ciclos = 0"
+        yield "\nForça necessariamente: β = 2α"
+        yield f"\nParâmetros:"
+        yield f"  α = {self.alpha}"
+        yield f"  β (implementado) = {self.beta}"
+        yield f"  β (esperado) = {self.beta_esperado}"
+        yield f"  Diferença = {self.diferenca:.6e}"
+        status = "✅ PASSA" if self.identidade_satisfeita else "❌ FALHA"
+        yield f"\n{status}: Jacobi identidade consistente"
+
+
+def teste_4_jacobi_consistency():
+    """Teste 4: Verificação de Jacobi"""
+    gup = GUP3D(alpha=0.6)
+    result = gup.verificacao_Jacobi()
+    
+    return ResultadoJacobi(result['alpha'], result['beta'], result['beta_esperado'],
+                           result['diferenca'], result['Jacobi_identidade'])
+
+
+@dataclass
+class LinhaOrdem:
+    """Razão O(ℓ_P⁴) / termo principal para um ΔP"""
+    Delta_P: float
+    razao: float
+    regime_valido: bool
+
+
+@dataclass
+class ResultadoOrdemGrandeza(Resultado):
+    """Teste 5: validade do truncamento O(ℓ_P²)"""
+    titulo = "TESTE 5: VALIDAÇÃO DO REGIME O(ℓ_P²)"
+
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\nDeclaração de truncamento:"
+        yield "Trabalhamos até ordem O(ℓ_P²), negligenciando contribuições O(ℓ_P⁴)."
+        yield "\nValidação: razão O(ℓ_P⁴) / termo principal"
+        yield "{:>20} | {:>20} | {:>15}".format("ΔP (kg·m/s)", "Razão", "Válido?")
+        yield "-" * 60
+        for linha in self.linhas:
+            validez = "✅ SIM" if linha.regime_valido else "❌ NÃO"
+            yield "{:>20.6e} | {:>20.6e} | {:>15}".format(linha.Delta_P, linha.razao, validez)
+        yield "\n✅ Regime O(ℓ_P²) válido para escalas quântico-gravitacionais"
+
+
+def teste_5_ordem_grandeza():
+    """Teste 5: Análise de ordem de grandeza O(ℓ_P⁴)"""
+    gup = GUP3D(alpha=0.6)
+    
+    # Teste com vários momentos
+    K = constantes.atual()
+    Delta_P_valores = np.array([1e-30, 1e-25, 1e-20, 1e-15]) * K.hbar / K.l_P
+    
+    linhas = []
+    for DP in Delta_P_valores:
+        result = gup.comutador_espacial_com_ordem(DP)
+        linhas.append(LinhaOrdem(DP, result['razao'], result['regime_valido']))
+
+    return ResultadoOrdemGrandeza(linhas)
+
+
+@dataclass
+class LinhaComparacao:
+    """Uma quantidade antes e depois da auditoria"""
+    quantidade: str
+    antes: str
+    depois: str
+
+
+@dataclass
+class ResultadoComparacao(Resultado):
+    """Teste 6: tabela comparativa da auditoria"""
+    titulo = "TESTE 6: TABELA COMPARATIVA - ANTES vs DEPOIS"
+
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield "\n{:>40} | {:>25} | {:>25}".format("QUANTIDADE", "ANTES (ERRADO)", "DEPOIS (CORRETO)")
+        yield "-" * 95
+        for linha in self.linhas:
+            yield "{:>40} | {:>25} | {:>25}".format(linha.quantidade, linha.antes, linha.depois)
+        yield "\n✅ TODAS AS CORREÇÕES IMPLEMENTADAS"
+
+
+def teste_6_comparacao_antes_depois():
+    """Teste 6: Comparação antes/depois da auditoria"""
+    dados = [
+        ("Forma [X̂ᵢ, P̂ⱼ]", "Apenas termo δᵢⱼ f", "✅ + termo diádico P̂ᵢ P̂ⱼ"),
+        ("Coef. incerteza", "√(3α/5)", "✅ √(5α/3)"),
+        ("Parâmetro α", "5/3 ≈ 1.667", "✅ 3/5 = 0.6"),
+        ("Truncamento", "Não declarado", "✅ O(ℓ_P²) explícito"),
+        ("[X̂ᵢ, X̂ⱼ]", "Sem O(ℓ_P⁴)", "✅ + O(ℓ_P⁴) marcado"),
+    ]
+    
+    return ResultadoComparacao([LinhaComparacao(*linha) for linha in dados])
+
+
+@dataclass
+class RelatorioAuditoria(Resultado):
+    """Relatório final de auditoria"""
+    titulo = "RELATÓRIO FINAL DE AUDITORIA TÉCNICA"
+
+    status: tuple = (
+        "Erro 1 (fator numérico): CORRIGIDO",
+        "Erro 2 (parâmetro α): CORRIGIDO",
+        "Erro 3 (truncamento): DECLARADO",
+        "Erro 4 (termo O(ℓ_P⁴)): ADICIONADO",
+    )
+    viabilidade: str = "⭐⭐⭐⭐⭐ (5/5) - Pronto para peer-review"
+    referencias: tuple = (
+        ("Kempf, A., Mangano, G., Mann, R. B. (1995)",
+         "'Hilbert space representation of minimal length'",
+         "Phys. Rev. D 52, 1108"),
+        ("Snyder, H. S. (1947) 'Quantized space-time'",
+         "Phys. Rev. 71, 38"),
+    )
+    conclusao: tuple = (
+        "Publicação em periódico peer-reviewed",
+        "Defesa em seminário técnico",
+        "Extensão para acoplamento com relatividade geral",
+    )
+
+    def linhas_console(self):
+        yield "\n" + "█"*80
+        yield self.titulo
+        yield "█"*80
+        yield "\n📋 STATUS DE VERIFICAÇÃO:"
+        for item in self.status:
+            yield f"  ✅ {item}"
+        yield "\n🎯 VIABILIDADE PARA PUBLICAÇÃO:"
+        yield f"  {self.viabilidade}"
+        yield "\n📚 REFERÊNCIAS IMPLEMENTADAS:"
+        for i, (primeira, *demais) in enumerate(self.referencias, 1):
+            yield f"  [{i}] {primeira}"
+            for linha in demais:
+                yield f"      {linha}"
+        yield "\n✅ CONCLUSÃO:"
+        yield "  Estrutura corrigida e pronta para:"
+        for item in self.conclusao:
+            yield f"  • {item}"
+        yield "\n" + "█"*80 + "\n"
+
+
+def relatorio_auditoria_final():
+    """Relatório final de auditoria"""
+    return RelatorioAuditoria()
+
+
+# Seções na ordem do relatório
+SECOES = (
+    teste_1_comutador_canonico,
+    teste_2_incerteza_minima,
+    teste_3_parametro_alpha,
+    teste_4_jacobi_consistency,
+    teste_5_ordem_grandeza,
+    teste_6_comparacao_antes_depois,
+)
+
+
+@dataclass
+class Abertura(Resultado):
+    """Cabeçalho do relatório de auditoria"""
+    titulo = "🔬 AUDITORIA TÉCNICA: GUP 3D COM CORREÇÕES"
+
+    data: str
+    status: str = "✅ TODAS AS CORREÇÕES IMPLEMENTADAS"
+
+    def linhas_console(self):
+        yield "\n" + "█"*80
+        yield self.titulo
+        yield "█"*80
+        yield f"Data: {self.data}"
+        yield f"Status: {self.status}"
+
+
+def executar_secoes():
+    """
+    Executa os testes da auditoria, sem formatação
+
+    Returns:
+        list: Registros de resultado, na ordem de SECOES
+    """
+    return [secao() for secao in SECOES]
+
+
+def main():
+    """Executa todos os testes da auditoria e renderiza o relatório"""
+    parser = argparse.ArgumentParser(description="Auditoria técnica: GUP 3D com correções")
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    parser.add_argument('--saida', default=None, help="arquivo de saída (padrão: terminal)")
+    parser.add_argument('--modo', choices=executor_secoes.MODOS, default='sequencial',
+                        help="execução das seções (saída sempre na mesma ordem)")
+    parser.add_argument('--trabalhadores', type=int, default=None)
+    parser.add_argument('--tempos', action='store_true',
+                        help="acrescenta tempo de parede, CPU e pico de memória por seção")
+    args = parser.parse_args()
+
+    secoes, tempos = executor_secoes.executar(SECOES, args.modo, args.trabalhadores,
+                                              medir=args.tempos)
+    resultados = [Abertura(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))]
+    resultados += secoes
+    resultados.append(relatorio_auditoria_final())
+    if args.tempos:
+        resultados.append(tempos)
+
+    if args.saida is None:
+        renderizacao.renderizar(resultados, args.formato, sys.stdout)
+    else:
+        with open(args.saida, 'w', encoding='utf-8') as destino:
+            renderizacao.renderizar(resultados, args.formato, destino)
+
+
+# Instrumentação opcional (perfil.py); sem a variável, nenhum custo (nem a
+# importação do perfil); o valor (tabela, 1, 0, ...) é interpretado lá
+if os.environ.get('PERFIL_KERNELS'):
+    import perfil
+    perfil.ao_importar(__name__)
+
+
+if __name__ == "__main__":
+    main()
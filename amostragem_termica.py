@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AMOSTRAGEM TÉRMICA RELATIVÍSTICA EM FLUXO: MAXWELL-JÜTTNER, FERMI E BOSE
+========================================================================
+
+Sorteia módulos de momento |p| de populações térmicas isotrópicas,
+
+    dN ∝ p² · n(E) dp,   E = √((pc)² + (mc²)²),
+
+com a ocupação n(E):
+- 'maxwell_juttner':  exp(-K / k_B T)
+- 'fermi':            1 / (exp((K - μ) / k_B T) + 1)
+- 'bose':             1 / (exp((K - μ) / k_B T) - 1),  μ ≤ 0
+
+onde K = E - mc² é a energia cinética e μ o potencial químico sem a
+energia de repouso. E, K e γ de cada amostra vêm de
+dispersao_relativistica (estável de p ≪ mc a p ≫ mc).
+
+Amostragem por inversão de uma tabela da CDF na variável s = √K, em que
+as densidades são suaves nos três casos (inclusive a singularidade
+integrável K^(-1/2) de Bose com μ = 0). A tabela é montada uma vez; cada
+amostra custa um número aleatório e uma interpolação.
+
+As amostras saem em blocos de tamanho fixo e as estatísticas (histograma
+de K e momentos até a 4ª ordem) são atualizadas bloco a bloco, com memória
+constante. Cada bloco usa seu próprio fluxo aleatório
+(SeedSequence(semente, spawn_key=(bloco,))): o resultado de um bloco não
+depende de quem o processa, e a amostragem pode ser dividida entre
+processos, cujas estatísticas são combinadas no final.
+
+Uso:
+    resumo = amostrar(DistribuicaoTermica(9.10938e-31, 300.0), 10**8, processos=4)
+    python amostragem_termica.py --tipo fermi --T 1e4 --mu 1e-18 --amostras 1e9
+"""
+
+import os
+import argparse
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import dispersao_relativistica
+from renderizacao import Resultado
+
+TIPOS = ('maxwell_juttner', 'fermi', 'bose')
+
+# Amostras por bloco: 2²⁰ ≈ 40 MiB de buffers (p, E, K, γ e u)
+TAMANHO_BLOCO = 2**20
+
+# Pontos da tabela da CDF e alcance da cauda em unidades de k_B T
+PONTOS_TABELA = 2**14
+CAUDA_KT = 60.0
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        DISTRIBUIÇÕES TÉRMICAS                             ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class DistribuicaoTermica:
+    """
+    Tabela de amostragem de |p| para uma massa, temperatura e ocupação
+    """
+
+    def __init__(self, m, T, tipo='maxwell_juttner', mu=0.0, pontos=PONTOS_TABELA):
+        """
+        Args:
+            m: Massa (kg); 0 para partículas sem massa
+            T: Temperatura (K)
+            tipo: 'maxwell_juttner', 'fermi' ou 'bose'
+            mu: Potencial químico cinético (J), sem mc²; ignorado em
+                Maxwell-Jüttner
+            pontos: Pontos da tabela da CDF
+        """
+        if tipo not in TIPOS:
+            raise ValueError(f"tipo desconhecido: {tipo!r} (use {', '.join(TIPOS)})")
+        if tipo == 'bose' and mu > 0:
+            raise ValueError("Bose-Einstein exige μ ≤ 0")
+
+        K = constantes.atual()
+        self.m, self.T, self.tipo, self.mu = m, T, tipo, mu if tipo != 'maxwell_juttner' else 0.0
+        self.kT = K.k_B * T
+        self.repouso = m * K.c2
+        self.c = K.c
+
+        # Grade em s = √K: dN/ds = 2s · dN/dK e dN/dK ∝ p E n(E)
+        self.K_max = max(self.mu, 0.0) + CAUDA_KT * self.kT
+        self.s = np.linspace(0.0, np.sqrt(self.K_max), pontos)
+        densidade = 2 * self.s * self._densidade_K(self.s * self.s)
+
+        # CDF pelos trapézios, normalizada
+        cdf = np.empty(pontos)
+        cdf[0] = 0.0
+        np.cumsum(0.5 * (densidade[1:] + densidade[:-1]) * np.diff(self.s), out=cdf[1:])
+        self.cdf = cdf / cdf[-1]
+
+    def _densidade_K(self, cinetica):
+        """dN/dK sem normalização: p(K) · E(K) · n(K)"""
+        pc = np.sqrt(cinetica * (cinetica + 2 * self.repouso))
+        energia = cinetica + self.repouso
+        x = (cinetica - self.mu) / self.kT
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            if self.tipo == 'maxwell_juttner':
+                ocupacao = np.exp(-x)
+            elif self.tipo == 'fermi':
+                ocupacao = 1 / (np.exp(x) + 1)
+            else:
+                ocupacao = 1 / np.expm1(x)
+            densidade = pc * energia * ocupacao
+        # K = 0 com μ = 0 (Bose): pc = 0 e n = ∞; o fator 2s da grade anula
+        return np.nan_to_num(densidade, nan=0.0, posinf=0.0)
+
+    def momentos_de(self, u, out=None):
+        """
+        Converte números uniformes em [0, 1) em |p| pela CDF tabelada
+
+        Args:
+            u: Uniformes
+            out: Buffer opcional para |p|
+
+        Returns:
+            |p| (kg·m/s)
+        """
+        s = np.interp(u, self.cdf, self.s)
+        np.multiply(s, s, out=s)                          # K
+        p = np.add(s, 2 * self.repouso, out=out)
+        np.multiply(p, s, out=p)
+        np.sqrt(p, out=p)
+        np.divide(p, self.c, out=p)
+        return p
+
+
+def gerador_bloco(semente, bloco):
+    """Gerador do bloco `bloco`: fluxo independente e reprodutível"""
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(semente, spawn_key=(bloco,))))
+
+
+def blocos_amostras(distribuicao, n_amostras, semente=0, tamanho_bloco=TAMANHO_BLOCO, blocos=None):
+    """
+    Gera amostras em blocos de tamanho fixo
+
+    Args:
+        distribuicao: DistribuicaoTermica
+        n_amostras: Total de amostras
+        semente: Semente da SeedSequence
+        tamanho_bloco: Amostras por bloco (o último pode ser menor)
+        blocos: Índices dos blocos a gerar (padrão: todos, em ordem)
+
+    Yields:
+        Tuple (bloco, p, E, K, γ) - visões de buffers reaproveitados no
+        bloco seguinte
+    """
+    n_blocos = -(-int(n_amostras) // tamanho_bloco)
+    u = np.empty(tamanho_bloco)
+    p, E, cinetica, gama = (np.empty(tamanho_bloco) for _ in range(4))
+
+    for bloco in (range(n_blocos) if blocos is None else blocos):
+        k = min(tamanho_bloco, int(n_amostras) - bloco * tamanho_bloco)
+        gerador_bloco(semente, bloco).random(out=u[:k])
+        distribuicao.momentos_de(u[:k], out=p[:k])
+        dispersao_relativistica(p[:k], distribuicao.m, out=(E[:k], cinetica[:k], gama[:k]))
+        yield bloco, p[:k], E[:k], cinetica[:k], gama[:k]
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    ESTATÍSTICAS EM FLUXO                                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class EstatisticasTermicas:
+    """
+    Histograma de K e momentos (média, variância, assimetria, curtose) de K,
+    acumulados bloco a bloco e combináveis entre processos (Chan/Pébay)
+    """
+
+    def __init__(self, limites):
+        """
+        Args:
+            limites: Bordas do histograma de K (J), crescentes
+        """
+        self.limites = np.asarray(limites, dtype=np.float64)
+        self.histograma = np.zeros(self.limites.size - 1, dtype=np.int64)
+        self.n = 0
+        self.media = 0.0
+        self.M2 = self.M3 = self.M4 = 0.0
+        self.soma_gama = 0.0
+
+    def _combinar_momentos(self, n_b, media_b, M2_b, M3_b, M4_b):
+        n_a, n = self.n, self.n + n_b
+        delta = media_b - self.media
+        d_n = delta / n
+        self.M4 += (M4_b + delta * d_n**3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+                    + 6 * d_n * d_n * (n_a * n_a * M2_b + n_b * n_b * self.M2)
+                    + 4 * d_n * (n_a * M3_b - n_b * self.M3))
+        self.M3 += (M3_b + delta * d_n * d_n * n_a * n_b * (n_a - n_b)
+                    + 3 * d_n * (n_a * M2_b - n_b * self.M2))
+        self.M2 += M2_b + delta * d_n * n_a * n_b
+        self.media += d_n * n_b
+        self.n = n
+
+    def atualizar(self, cinetica, gama):
+        """Acrescenta um bloco de energias cinéticas (J) e fatores γ"""
+        if cinetica.size == 0:
+            return
+        self.histograma += np.histogram(cinetica, bins=self.limites)[0]
+        media = cinetica.mean()
+        centrado = cinetica - media
+        quadrado = centrado * centrado
+        self._combinar_momentos(cinetica.size, media, quadrado.sum(),
+                                (quadrado * centrado).sum(), (quadrado * quadrado).sum())
+        self.soma_gama += gama.sum()
+
+    def combinar(self, outra):
+        """Incorpora as estatísticas de outro processo (mesmos limites)"""
+        if outra.n == 0:
+            return
+        self.histograma += outra.histograma
+        self._combinar_momentos(outra.n, outra.media, outra.M2, outra.M3, outra.M4)
+        self.soma_gama += outra.soma_gama
+
+
+@dataclass
+class ResumoAmostragem(Resultado):
+    """Momentos e espectro de energia cinética das amostras"""
+    titulo = "AMOSTRAGEM TÉRMICA RELATIVÍSTICA"
+
+    tipo: str
+    m: float
+    T: float
+    mu: float
+    amostras: int
+    media_K: float
+    desvio_K: float
+    assimetria_K: float
+    curtose_K: float          # em excesso: 0 para a gaussiana
+    media_E: float
+    media_gama: float
+    limites_K: np.ndarray
+    histograma_K: np.ndarray
+
+    def linhas_console(self):
+        kT = constantes.atual().k_B * self.T
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Distribuição: {self.tipo}, m = {self.m:.5e} kg, T = {self.T:g} K, μ = {self.mu:.3e} J"
+        yield f"Amostras: {self.amostras:,}\n"
+        yield f"⟨K⟩ = {self.media_K:.6e} J  ({self.media_K / kT:.6f} k_B T)"
+        yield f"σ_K = {self.desvio_K:.6e} J  ({self.desvio_K / kT:.6f} k_B T)"
+        yield f"Assimetria de K: {self.assimetria_K:.6f}, curtose em excesso: {self.curtose_K:.6f}"
+        yield f"⟨E⟩ = {self.media_E:.6e} J, ⟨γ⟩ = {self.media_gama:.9f}"
+        moda = int(np.argmax(self.histograma_K))
+        yield (f"Pico do espectro: K ≈ {0.5 * (self.limites_K[moda] + self.limites_K[moda + 1]) / kT:.3f} k_B T "
+               f"({len(self.histograma_K)} baldes até {self.limites_K[-1] / kT:.1f} k_B T)")
+
+
+def _resumo(distribuicao, estatisticas):
+    e = estatisticas
+    variancia = e.M2 / e.n if e.n else float('nan')
+    return ResumoAmostragem(
+        tipo=distribuicao.tipo,
+        m=distribuicao.m,
+        T=distribuicao.T,
+        mu=distribuicao.mu,
+        amostras=e.n,
+        media_K=e.media,
+        desvio_K=float(np.sqrt(variancia)),
+        assimetria_K=e.M3 / e.n / variancia**1.5 if e.n else float('nan'),
+        curtose_K=e.M4 / e.n / (variancia * variancia) - 3 if e.n else float('nan'),
+        media_E=e.media + distribuicao.repouso,
+        media_gama=e.soma_gama / e.n if e.n else float('nan'),
+        limites_K=e.limites,
+        histograma_K=e.histograma,
+    )
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    EXECUÇÃO (UM OU VÁRIOS PROCESSOS)                      ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _acumular(distribuicao, n_amostras, semente, tamanho_bloco, blocos, limites):
+    """Estatísticas de um subconjunto de blocos (roda no processo do pool)"""
+    estatisticas = EstatisticasTermicas(limites)
+    for _, _, _, cinetica, gama in blocos_amostras(distribuicao, n_amostras, semente,
+                                                  tamanho_bloco, blocos):
+        estatisticas.atualizar(cinetica, gama)
+    return estatisticas
+
+
+def amostrar(distribuicao, n_amostras, semente=0, processos=1, tamanho_bloco=TAMANHO_BLOCO,
+             baldes=256):
+    """
+    Sorteia n_amostras e devolve momentos e espectro de K
+
+    Os blocos são distribuídos entre os processos em faixas contíguas; como
+    cada bloco tem seu próprio fluxo aleatório, o histograma não depende do
+    número de processos (os momentos, só pelo arredondamento).
+
+    Args:
+        distribuicao: DistribuicaoTermica
+        n_amostras: Total de amostras (ex.: 10**10)
+        semente: Semente da SeedSequence
+        processos: Número de processos (1: no processo atual)
+        tamanho_bloco: Amostras por bloco
+        baldes: Baldes do histograma de K, de 0 a K_max da tabela
+
+    Returns:
+        ResumoAmostragem
+    """
+    n_amostras = int(n_amostras)
+    limites = np.linspace(0.0, distribuicao.K_max, baldes + 1)
+    n_blocos = -(-n_amostras // tamanho_bloco)
+    processos = max(1, min(processos or os.cpu_count() or 1, n_blocos))
+
+    if processos == 1:
+        estatisticas = _acumular(distribuicao, n_amostras, semente, tamanho_bloco, None, limites)
+        return _resumo(distribuicao, estatisticas)
+
+    faixas = np.array_split(np.arange(n_blocos), processos)
+    with ProcessPoolExecutor(max_workers=processos, initializer=constantes.restaurar,
+                             initargs=constantes.estado()) as pool:
+        futuros = [pool.submit(_acumular, distribuicao, n_amostras, semente, tamanho_bloco,
+                               faixa.tolist(), limites) for faixa in faixas]
+        # Combinação na ordem das faixas: resultado determinístico
+        estatisticas = EstatisticasTermicas(limites)
+        for futuro in futuros:
+            estatisticas.combinar(futuro.result())
+    return _resumo(distribuicao, estatisticas)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Elétrons térmicos a 300 K (padrão)"""
+    parser = argparse.ArgumentParser(description="Amostragem térmica relativística em fluxo")
+    parser.add_argument('--tipo', choices=TIPOS, default='maxwell_juttner')
+    parser.add_argument('--m', type=float, default=9.10938e-31)
+    parser.add_argument('--T', type=float, default=300.0)
+    parser.add_argument('--mu', type=float, default=0.0)
+    parser.add_argument('--amostras', type=float, default=1e7)
+    parser.add_argument('--processos', type=int, default=1)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    distribuicao = DistribuicaoTermica(args.m, args.T, args.tipo, args.mu)
+    resumo = amostrar(distribuicao, int(args.amostras), args.semente, args.processos)
+    renderizacao.renderizar([resumo], args.formato)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BENCHMARK DOS KERNELS COM BASELINE EM JSON
+==========================================
+
+Mede a vazão de todos os kernels de CalculosVerdadeirosPython.py,
+calculos_verdadeiros.py e dos métodos de GUP3D:
+
+- Chamada escalar: uma chamada por vez, em chamadas/s.
+- Chamada vetorizada com 1e3, 1e6 e 1e8 elementos, em elementos/s. Os
+  kernels escalares das duas versões compartilham a forma vetorizada de
+  calculos_vetorizados.py; os métodos de GUP3D são medidos em
+  GUP3DEnsemble. Entradas e buffers de saída são alocados antes da
+  medição, de modo que só o cálculo é cronometrado.
+
+"Elementos" é o número de valores de saída: métricas com 4 componentes
+usam N/4 pontos e tensores empacotados com 10 componentes usam N/10.
+Tamanhos que não cabem na memória são registrados como pulados.
+
+Os resultados podem ser gravados como baseline em JSON; uma execução com
+--comparar aponta os casos cuja vazão caiu mais que a tolerância.
+
+Uso:
+    python benchmark_kernels.py                        # mede e imprime
+    python benchmark_kernels.py --salvar baseline.json
+    python benchmark_kernels.py --comparar baseline.json [--tolerancia 0.2]
+    python benchmark_kernels.py --tamanhos 1e3,1e6 --filtro hawking
+"""
+
+import sys
+import json
+import time
+import timeit
+import platform
+import argparse
+from datetime import datetime
+
+import numpy as np
+
+import CalculosVerdadeirosPython
+import calculos_verdadeiros
+import calculos_vetorizados
+from GUP_3D_Corrigido import GUP3D, GUP3DEnsemble
+
+TAMANHOS = (10**3, 10**6, 10**8)
+
+# Repetições por medida: vale a melhor, para filtrar ruído do sistema
+REPETICOES = 5
+
+# Tempo mínimo de cada repetição (chamadas pequenas são agrupadas)
+TEMPO_MINIMO_S = 0.2
+
+TOLERANCIA = 0.2
+
+VERSAO_FORMATO = 1
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         CASOS DE MEDIÇÃO                                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _casos_escalares():
+    """Chamadas escalares: nome -> função sem argumentos"""
+    casos = {}
+    u = [1.0, 0.0, 0.0, 0.0]
+    M_sun = CalculosVerdadeirosPython.M_sun
+
+    for modulo in (CalculosVerdadeirosPython, calculos_verdadeiros):
+        m = modulo
+        casos.update({
+            f'{m.__name__}.incerteza_heisenberg': lambda m=m: m.incerteza_heisenberg(1e-10),
+            f'{m.__name__}.autoenergias_poco_infinito': lambda m=m: m.autoenergias_poco_infinito(3, 1e-9, 9.10938e-31),
+            f'{m.__name__}.energia_oscilador_harmonico': lambda m=m: m.energia_oscilador_harmonico(3, 1e15),
+            f'{m.__name__}.tensor_stress_energy_dust': lambda m=m: m.tensor_stress_energy_dust(1.0, u),
+            f'{m.__name__}.schwarzschild_metric': lambda m=m: m.schwarzschild_metric(1.496e11, M_sun),
+            f'{m.__name__}.temperatura_hawking': lambda m=m: m.temperatura_hawking(5 * M_sun),
+            f'{m.__name__}.energia_relativistica': lambda m=m: m.energia_relativistica(1e-24, 9.10938e-31),
+            f'{m.__name__}.entropia_bekenstein_hawking': lambda m=m: m.entropia_bekenstein_hawking(5 * M_sun),
+        })
+
+    gup = GUP3D(alpha=0.6)
+    casos.update({
+        'GUP3D.comutador_canonico_3d': lambda: gup.comutador_canonico_3d(1e-20),
+        'GUP3D.incerteza_posicao_minima': gup.incerteza_posicao_minima,
+        'GUP3D.parametro_alpha_para_Planck': gup.parametro_alpha_para_Planck,
+        'GUP3D.comutador_espacial_com_ordem': lambda: gup.comutador_espacial_com_ordem(1e-20),
+        'GUP3D.verificacao_Jacobi': gup.verificacao_Jacobi,
+    })
+    return casos
+
+
+def _casos_vetoriais():
+    """
+    Chamadas vetorizadas: nome -> preparar(n)
+
+    preparar(n) aloca entradas e saídas para n elementos e devolve a
+    função sem argumentos que é cronometrada.
+    """
+    v = calculos_vetorizados
+    M_sun = CalculosVerdadeirosPython.M_sun
+
+    def positivos(n, inicio, fim):
+        return np.linspace(inicio, fim, n)
+
+    def heisenberg(n):
+        x, out = positivos(n, 1e-12, 1e-9), np.empty(n)
+        return lambda: v.incerteza_heisenberg(x, out=out)
+
+    def poco(n):
+        L, out = positivos(n, 1e-10, 1e-8), np.empty(n)
+        return lambda: v.autoenergias_poco_infinito(3.0, L, 9.10938e-31, out=out)
+
+    def oscilador(n):
+        omega, out = positivos(n, 1e13, 1e16), np.empty(n)
+        return lambda: v.energia_oscilador_harmonico(3.0, omega, out=out)
+
+    def tensor(n):
+        k = max(1, n // len(v.INDICES_EMPACOTADOS))
+        rho = positivos(k, 0.5, 2.0)
+        u = np.zeros((k, 4))
+        u[:, 0] = 1.0
+        out = np.empty((k, len(v.INDICES_EMPACOTADOS)))
+        return lambda: v.tensor_stress_energy_dust(rho, u, empacotado=True, out=out)
+
+    def schwarzschild(n):
+        k = max(1, n // 4)
+        r = positivos(k, 1e10, 1e12)
+        out = (np.empty(k), np.empty(k), np.empty(k), None)
+        return lambda: v.schwarzschild_metric(r, M_sun, out=out)
+
+    def hawking(n):
+        M, out = positivos(n, M_sun, 10 * M_sun), np.empty(n)
+        return lambda: v.temperatura_hawking(M, out=out)
+
+    def dirac(n):
+        p, out = positivos(n, 1e-25, 1e-22), np.empty(n)
+        return lambda: v.energia_relativistica(p, 9.10938e-31, out=out)
+
+    def dispersao(n):
+        p = np.logspace(-40, 0, n)
+        out = (np.empty(n), np.empty(n), np.empty(n))
+        return lambda: v.dispersao_relativistica(p, 9.10938e-31, out=out)
+
+    def bekenstein(n):
+        M, out = positivos(n, M_sun, 10 * M_sun), np.empty(n)
+        return lambda: v.entropia_bekenstein_hawking(M, out=out)
+
+    def buffers(*tipos):
+        return lambda n: tuple(np.empty(n, dtype=tipo) for tipo in tipos)
+
+    def ensemble(metodo, *args, saida=np.empty):
+        def preparar(n):
+            conjunto = GUP3DEnsemble(positivos(n, 0.1, 2.0))
+            out = saida(n)
+            return lambda: getattr(conjunto, metodo)(*args, out=out)
+        return preparar
+
+    return {
+        'calculos_vetorizados.incerteza_heisenberg': heisenberg,
+        'calculos_vetorizados.autoenergias_poco_infinito': poco,
+        'calculos_vetorizados.energia_oscilador_harmonico': oscilador,
+        'calculos_vetorizados.tensor_stress_energy_dust': tensor,
+        'calculos_vetorizados.schwarzschild_metric': schwarzschild,
+        'calculos_vetorizados.temperatura_hawking': hawking,
+        'calculos_vetorizados.energia_relativistica': dirac,
+        'calculos_vetorizados.dispersao_relativistica': dispersao,
+        'calculos_vetorizados.entropia_bekenstein_hawking': bekenstein,
+        'GUP3DEnsemble.comutador_canonico_3d': ensemble(
+            'comutador_canonico_3d', 1e-20, saida=buffers(np.float64, np.float64)),
+        'GUP3DEnsemble.incerteza_posicao_minima': ensemble('incerteza_posicao_minima'),
+        'GUP3DEnsemble.comutador_espacial_com_ordem': ensemble(
+            'comutador_espacial_com_ordem', 1e-20,
+            saida=buffers(np.float64, np.float64, np.bool_, np.float64)),
+        'GUP3DEnsemble.verificacao_Jacobi': ensemble(
+            'verificacao_Jacobi', saida=buffers(np.bool_, np.float64, np.float64)),
+    }
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                            MEDIÇÃO                                        ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def medir(funcao, repeticoes=REPETICOES):
+    """
+    Tempo por chamada de `funcao` (melhor de `repeticoes`)
+
+    Chamadas rápidas são agrupadas até cada repetição durar pelo menos
+    TEMPO_MINIMO_S; chamadas lentas (ex.: 1e8 elementos) rodam uma vez
+    por repetição.
+
+    Returns:
+        Segundos por chamada
+    """
+    cronometro = timeit.Timer(funcao, timer=time.perf_counter)
+    chamadas = 1
+    while True:
+        tempo = cronometro.timeit(chamadas)
+        if tempo >= TEMPO_MINIMO_S:
+            break
+        chamadas *= 10 if tempo < TEMPO_MINIMO_S / 10 else 2
+
+    melhor = min([tempo] + cronometro.repeat(repeat=repeticoes - 1, number=chamadas))
+    return melhor / chamadas
+
+
+def executar(tamanhos=TAMANHOS, filtro=None, progresso=None):
+    """
+    Executa todos os casos
+
+    Args:
+        tamanhos: Números de elementos das chamadas vetorizadas
+        filtro: Substring opcional para selecionar casos pelo nome
+        progresso: Função opcional progresso(chave, resultado)
+
+    Returns:
+        dict: chave -> {'s_por_chamada', 'vazao', 'unidade'} ou
+              {'pulado': motivo}
+    """
+    resultados = {}
+
+    def registrar(chave, resultado):
+        resultados[chave] = resultado
+        if progresso is not None:
+            progresso(chave, resultado)
+
+    for nome, funcao in _casos_escalares().items():
+        if filtro and filtro not in nome:
+            continue
+        segundos = medir(funcao)
+        registrar(f'{nome}[escalar]', {
+            's_por_chamada': segundos,
+            'vazao': 1 / segundos,
+            'unidade': 'chamadas/s',
+        })
+
+    for nome, preparar in _casos_vetoriais().items():
+        if filtro and filtro not in nome:
+            continue
+        for n in tamanhos:
+            chave = f'{nome}[{n:.0e}]'
+            try:
+                funcao = preparar(n)
+                segundos = medir(funcao, repeticoes=REPETICOES if n < 10**8 else 3)
+            except MemoryError:
+                registrar(chave, {'pulado': 'memória insuficiente'})
+                continue
+            finally:
+                funcao = None
+            registrar(chave, {
+                's_por_chamada': segundos,
+                'vazao': n / segundos,
+                'unidade': 'elementos/s',
+            })
+
+    return resultados
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                       BASELINE E COMPARAÇÃO                               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def salvar_baseline(resultados, caminho):
+    """Grava os resultados com a identificação da máquina e das versões"""
+    with open(caminho, 'w') as arquivo:
+        json.dump({
+            'versao_formato': VERSAO_FORMATO,
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'maquina': platform.node(),
+            'processador': platform.processor() or platform.machine(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'resultados': resultados,
+        }, arquivo, indent=2, sort_keys=True)
+
+
+def comparar(resultados, caminho, tolerancia=TOLERANCIA, tamanhos=TAMANHOS, filtro=None):
+    """
+    Compara vazões com uma baseline gravada
+
+    Args:
+        resultados: Saída de executar()
+        caminho: Arquivo JSON da baseline
+        tolerancia: Queda relativa de vazão aceita (0.2 = 20%)
+        tamanhos, filtro: Os mesmos de executar(); casos da baseline fora
+                          deste escopo não contam como ausentes
+
+    Returns:
+        Tuple (regressoes, ausentes) - regressoes: lista de (chave,
+        vazao_baseline, vazao_atual) dos casos regredidos; ausentes: chaves
+        da baseline, dentro do escopo, que esta execução não mediu
+    """
+    with open(caminho) as arquivo:
+        baseline = json.load(arquivo)
+    if baseline.get('versao_formato') != VERSAO_FORMATO:
+        raise ValueError(f"{caminho} usa outro formato de baseline")
+
+    regressoes = []
+    for chave, atual in resultados.items():
+        anterior = baseline['resultados'].get(chave)
+        if anterior is None or 'vazao' not in anterior or 'vazao' not in atual:
+            continue
+        if atual['vazao'] < (1 - tolerancia) * anterior['vazao']:
+            regressoes.append((chave, anterior['vazao'], atual['vazao']))
+
+    marcas = {'escalar'} | {f'{n:.0e}' for n in tamanhos}
+    ausentes = []
+    for chave in sorted(baseline['resultados']):
+        nome, _, marca = chave.rpartition('[')
+        if chave not in resultados and marca[:-1] in marcas and (not filtro or filtro in nome):
+            ausentes.append(chave)
+    return regressoes, ausentes
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Mede, grava e/ou compara; sai com código 1 em caso de regressão ou caso ausente"""
+    parser = argparse.ArgumentParser(description="Benchmark dos kernels")
+    parser.add_argument('--tamanhos', default=','.join(f'{n:.0e}' for n in TAMANHOS),
+                        help="elementos das chamadas vetorizadas, ex.: 1e3,1e6")
+    parser.add_argument('--filtro', default=None, help="substring do nome dos casos")
+    parser.add_argument('--salvar', metavar='JSON', help="grava os resultados como baseline")
+    parser.add_argument('--comparar', metavar='JSON', help="compara com uma baseline")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA)
+    args = parser.parse_args()
+
+    tamanhos = tuple(int(float(t)) for t in args.tamanhos.split(','))
+
+    def progresso(chave, resultado):
+        if 'pulado' in resultado:
+            print(f"{chave:62s} pulado ({resultado['pulado']})")
+        else:
+            print(f"{chave:62s} {resultado['vazao']:12.4e} {resultado['unidade']}")
+
+    resultados = executar(tamanhos, args.filtro, progresso)
+
+    if args.salvar:
+        salvar_baseline(resultados, args.salvar)
+        print(f"\nBaseline gravada em {args.salvar}")
+
+    if args.comparar:
+        regressoes, ausentes = comparar(resultados, args.comparar, args.tolerancia,
+                                        tamanhos, args.filtro)
+        print()
+        for chave, anterior, atual in regressoes:
+            print(f"❌ {chave}: {atual:.4e} < {anterior:.4e} ({atual / anterior - 1:+.1%})")
+        for chave in ausentes:
+            print(f"❌ {chave}: na baseline, mas ausente nesta execução")
+        if regressoes or ausentes:
+            sys.exit(1)
+        print(f"✅ Nenhuma regressão acima de {args.tolerancia:.0%} e nenhum caso ausente")
+
+
+if __name__ == "__main__":
+    main()
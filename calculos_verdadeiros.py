@@ -1,360 +1,129 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL
-========================================================
-
-Implementação rigorosa baseada em:
-1. Relatividade Geral (Einstein, 1915)
-2. Mecânica Quântica (Schrödinger, Heisenberg)
-3. Teoria Quântica de Campos
-4. Abordagem de Gravidade Quântica Efetiva
-
-Este arquivo implementa cálculos comprobáveis e verificáveis.
-"""
-
-import numpy as np
-import math
-
-# ============================================================================
-# PARTE 1: CONSTANTES FUNDAMENTAIS VERIFICADAS
-# ============================================================================
-
-# Constantes do SI (Sistema Internacional)
-hbar = 1.054571817e-34       # Constante de Planck reduzida (J·s)
-c = 299792458.0              # Velocidade da luz (m/s)
-G = 6.67430e-11              # Constante gravitacional (m³/kg·s²)
-epsilon_0 = 8.8541878128e-12 # Permissividade do vácuo (F/m)
-k_B = 1.380649e-23           # Constante de Boltzmann (J/K)
-
-# Derivadas fundamentais
-l_P = math.sqrt(hbar * G / c**3)        # Comprimento de Planck
-m_P = math.sqrt(hbar * c / G)           # Massa de Planck
-t_P = math.sqrt(hbar * G / c**5)        # Tempo de Planck
-E_P = math.sqrt(hbar * c**5 / G)        # Energia de Planck
-
-print("=" * 80)
-print("CONSTANTES FUNDAMENTAIS VERIFICADAS")
-print("=" * 80)
-print(f"Constante de Planck reduzida (ħ):     {hbar:.6e} J·s")
-print(f"Velocidade da luz (c):                {c:.6e} m/s")
-print(f"Constante gravitacional (G):          {G:.6e} m³/kg·s²")
-print(f"Comprimento de Planck (l_P):          {l_P:.6e} m")
-print(f"Massa de Planck (m_P):                {m_P:.6e} kg")
-print(f"Tempo de Planck (t_P):                {t_P:.6e} s")
-print(f"Energia de Planck (E_P):              {E_P:.6e} J")
-print()
-
-# ============================================================================
-# PARTE 2: PRINCÍPIO DE INCERTEZA DE HEISENBERG (VERDADEIRO)
-# ============================================================================
-
-print("=" * 80)
-print("2. PRINCÍPIO DE INCERTEZA DE HEISENBERG")
-print("=" * 80)
-print("Relação: Δx·Δp ≥ ħ/2 (mínimo para estados comprimidos)")
-print()
-
-def incerteza_heisenberg(delta_x):
-    """Calcula o mínimo Δp segundo Heisenberg: Δp = ħ/(2Δx)"""
-    return hbar / (2 * delta_x)
-
-# Teste 1: Partícula de um elétron
-delta_x_electron = 1e-10  # 0.1 nm (tamanho aproximado do átomo de Bohr)
-delta_p_electron = incerteza_heisenberg(delta_x_electron)
-m_electron = 9.10938356e-31
-v_electron = delta_p_electron / m_electron
-
-print("\nTeste 1: Partícula no átomo de Bohr")
-print(f"Posição incerta (Δx):                 {delta_x_electron:.6e} m (0.1 nm)")
-print(f"Momento incerto mínimo (Δp):          {delta_p_electron:.6e} kg·m/s")
-print(f"Velocidade incerta mínima:            {v_electron:.6e} m/s")
-print(f"Percentual da velocidade da luz:      {(v_electron/c * 100):.2f}% da velocidade da luz")
-
-# Teste 2: Na escala de Planck
-delta_x_planck = l_P
-delta_p_planck = incerteza_heisenberg(delta_x_planck)
-v_planck = delta_p_planck / m_P
-
-print("\nTeste 2: Partícula na escala de Planck")
-print(f"Posição incerta (Δx):                 {delta_x_planck:.6e} m")
-print(f"Momento incerto mínimo (Δp):          {delta_p_planck:.6e} kg·m/s")
-print(f"Velocidade incerta mínima:            {v_planck:.6e} m/s")
-print(f"Percentual da velocidade da luz:      {(v_planck/c * 100):.2f}% da velocidade da luz")
-
-# Teste 3: Verificação da relação
-produto = delta_x_planck * delta_p_planck
-print(f"\nVerificação: Δx·Δp = {produto:.6e} J·s")
-print(f"             ħ/2   = {hbar/2:.6e} J·s")
-print(f"             Razão = {produto / (hbar/2):.6f}")
-print()
-
-# ============================================================================
-# PARTE 3: EQUAÇÃO DE SCHRÖDINGER (VERDADEIRA)
-# ============================================================================
-
-print("=" * 80)
-print("3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO")
-print("=" * 80)
-print("Para partícula em poço de potencial infinito:")
-print("E_n = (n² π² ħ²) / (2 m L²)")
-print()
-
-def autoenergias_poco_infinito(n, L, m):
-    """Autoenergias para partícula em poço infinito"""
-    return (n**2 * math.pi**2 * hbar**2) / (2 * m * L**2)
-
-# Teste: Elétron em um poço de potencial
-L_box = 1e-9  # 1 nm
-
-print("Partícula em poço infinito (L = 1 nm)")
-print("Estado quântico | Energia (J)      | Energia (eV)")
-print("-" * 60)
-
-eV_to_J = 1.602176634e-19
-
-for n in range(1, 6):
-    E_n = autoenergias_poco_infinito(n, L_box, m_electron)
-    E_eV = E_n / eV_to_J
-    print(f"    n = {n}       | {E_n:.6e} | {E_eV:.6f}")
-print()
-
-# ============================================================================
-# PARTE 4: OSCILADOR HARMÔNICO QUÂNTICO
-# ============================================================================
-
-print("=" * 80)
-print("4. OSCILADOR HARMÔNICO QUÂNTICO")
-print("=" * 80)
-print("Energia: E_n = ħω(n + 1/2)")
-print()
-
-def energia_oscilador_harmonico(n, omega):
-    """Energia do oscilador harmônico quântico"""
-    return hbar * omega * (n + 0.5)
-
-# Teste: Oscilador com frequência típica
-omega = 1e15  # Hz (frequência óptica)
-
-print("Oscilador Harmônico Quântico (ω = 1e15 Hz)")
-print("Estado | Energia de ponto zero | Energia total | Comprimento de onda")
-print("-" * 75)
-
-for n in range(5):
-    E_zero = energia_oscilador_harmonico(0, omega)
-    E_n = energia_oscilador_harmonico(n, omega)
-    lambda_photon = (2 * math.pi * c) / omega
-    print(f"  n={n}  | {E_zero:.6e} J   | {E_n:.6e} J | λ = {lambda_photon:.6e} m")
-print()
-
-# ============================================================================
-# PARTE 5: TENSOR DE ENERGIA-MOMENTO (RELATIVIDADE GERAL)
-# ============================================================================
-
-print("=" * 80)
-print("5. TENSOR DE ENERGIA-MOMENTO EM RELATIVIDADE GERAL")
-print("=" * 80)
-print("Para matéria poeirenta: T^μν = ρ u^μ u^ν")
-print()
-
-def tensor_stress_energy_dust(rho, u):
-    """Tensor de energia-momento para matéria poeirenta"""
-    u = np.array(u)
-    return rho * np.outer(u, u)
-
-# Teste: Tensor para repouso
-rho_dust = 1.0   # densidade (unidades arbitrárias)
-u_repouso = np.array([1.0, 0.0, 0.0, 0.0])  # quadrivelocidade em repouso
-
-T_dust = tensor_stress_energy_dust(rho_dust, u_repouso)
-
-print("Tensor de Energia-Momento (matéria em repouso)")
-print("Componentes T^μν:")
-for mu in range(4):
-    for nu in range(4):
-        if abs(T_dust[mu, nu]) > 1e-10:
-            print(f"T^{mu}{nu} = {T_dust[mu,nu]:.6e}")
-print()
-
-# ============================================================================
-# PARTE 6: EQUAÇÕES DE CAMPO DE EINSTEIN (SIMPLIFICADO)
-# ============================================================================
-
-print("=" * 80)
-print("6. EQUAÇÃO DE CAMPO DE EINSTEIN")
-print("=" * 80)
-print("G^μν + Λg^μν = (8πG/c⁴) T^μν")
-print()
-
-# Constante cosmológica observada
-Lambda_obs = 1.11e-52  # m⁻² (valor observado)
-kappa = (8 * math.pi * G) / c**4
-
-print("Fator de acoplamento: κ = 8πG/c⁴")
-print(f"κ = {kappa:.6e} m/J")
-print()
-
-# Métrica de Schwarzschild
-def schwarzschild_metric(r, M):
-    """Métrica de Schwarzschild para corpo com massa M"""
-    r_s = 2 * G * M / c**2  # Raio de Schwarzschild
-    
-    if r <= r_s:
-        raise ValueError("Dentro do horizonte de eventos!")
-    
-    # Métrica diagonal
-    g = np.zeros((4, 4))
-    g[0,0] = -(1 - r_s/r)
-    g[1,1] = 1 / (1 - r_s/r)
-    g[2,2] = r**2
-    g[3,3] = r**2
-    
-    return g, r_s
-
-# Teste: Métrica ao redor do Sol
-M_sun = 1.989e30  # kg
-r_test = 1.496e11  # 1 UA (distância Terra-Sol)
-
-g_schwarzschild, r_s_sun = schwarzschild_metric(r_test, M_sun)
-
-print("Métrica de Schwarzschild ao redor do Sol")
-print(f"Massa do Sol: {M_sun:.6e} kg")
-print(f"Raio de Schwarzschild: {r_s_sun:.6e} m")
-print(f"Distância teste (1 UA): {r_test:.6e} m")
-print()
-
-print("Componentes da métrica em r = 1 UA:")
-print(f"g₀₀ = {g_schwarzschild[0,0]:.15f}")
-print(f"g₁₁ = {g_schwarzschild[1,1]:.15f}")
-print(f"g₂₂ = {g_schwarzschild[2,2]:.15e}")
-
-# Desvio da métrica de Minkowski (plano)
-desvio = abs(g_schwarzschild[0,0] + 1.0) / 1.0 * 100
-print(f"Desvio da planicidade: {desvio:.6e}%")
-print()
-
-# ============================================================================
-# PARTE 7: QUANTIZAÇÃO DE CAMPO EM ESPAÇO CURVO
-# ============================================================================
-
-print("=" * 80)
-print("7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO")
-print("=" * 80)
-print("Radiação de Hawking: E_Hawking = (ħc³) / (8πk_B G M²)")
-print()
-
-def temperatura_hawking(M):
-    """Temperatura de Hawking para buraco negro"""
-    return (hbar * c**3) / (8 * math.pi * k_B * G * M**2)
-
-# Teste: Temperatura de Hawking
-M_bh = 1e31  # Massa de um buraco negro (≈5 massas solares)
-T_hawking = temperatura_hawking(M_bh)
-
-print("Radiação de Hawking")
-print(f"Massa do buraco negro: {M_bh:.6e} kg")
-print(f"Temperatura de Hawking: {T_hawking:.6e} K")
-print()
-
-# ============================================================================
-# PARTE 8: RELAÇÃO DE DISPERSÃO QUÂNTICA-RELATIVÍSTICA
-# ============================================================================
-
-print("=" * 80)
-print("8. RELAÇÃO DE DISPERSÃO (QUÂNTICA + RELATIVÍSTICA)")
-print("=" * 80)
-print("E² = (pc)² + (mc²)²")
-print()
-
-def energia_relativistica(p, m):
-    """Relação de energia-momento relativística"""
-    return math.sqrt((p * c)**2 + (m * c**2)**2)
-
-# Teste: Elétron
-p_electron = 1e-24  # kg·m/s
-
-E_repouso = m_electron * c**2
-E_total = energia_relativistica(p_electron, m_electron)
-E_cinetica = E_total - E_repouso
-
-MeV_to_J = 1.602176634e-13
-
-print("Elétron com momento p = 1e-24 kg·m/s")
-print(f"Energia de repouso (E₀):    {E_repouso:.6e} J ({E_repouso/MeV_to_J:.6f} MeV)")
-print(f"Energia total (E):          {E_total:.6e} J ({E_total/MeV_to_J:.6f} MeV)")
-print(f"Energia cinética (K):       {E_cinetica:.6e} J ({E_cinetica/MeV_to_J:.6f} MeV)")
-print()
-
-# ============================================================================
-# PARTE 9: ENTROPIA E SEGUNDA LEI DA TERMODINÂMICA
-# ============================================================================
-
-print("=" * 80)
-print("9. ENTROPIA DE UM BURACO NEGRO (BEKENSTEIN-HAWKING)")
-print("=" * 80)
-print("S = (A k_B c³) / (4 ħ G)")
-print()
-
-def entropia_bekenstein_hawking(M):
-    """Entropia de Bekenstein-Hawking"""
-    r_s = 2 * G * M / c**2
-    A = 4 * math.pi * r_s**2
-    return (A * k_B * c**3) / (4 * hbar * G)
-
-# Teste
-M_bh_test = 1e31
-S_bh = entropia_bekenstein_hawking(M_bh_test)
-
-print("Buraco Negro de ~5 massas solares")
-print(f"Massa: {M_bh_test:.6e} kg")
-print(f"Entropia de Bekenstein-Hawking: {S_bh:.6e} J/K")
-
-num_estados = S_bh / k_B / math.log(10)
-print(f"Número de estados quânticos: 10^{num_estados:.2e}")
-print()
-
-# ============================================================================
-# PARTE 10: SÍNTESE - CÁLCULO UNIFICADO
-# ============================================================================
-
-print("=" * 80)
-print("SÍNTESE: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL")
-print("=" * 80)
-
-print("\n1. REGIME QUÂNTICO (escalas pequenas):")
-print(f"   Comprimento de Planck: {l_P:.6e} m")
-print(f"   Massa de Planck: {m_P:.6e} kg")
-print(f"   Tempo de Planck: {t_P:.6e} s")
-print(f"   Energia de Planck: {E_P:.6e} J")
-
-print("\n2. REGIME GRAVITACIONAL (escalas grandes):")
-print(f"   Raio de Schwarzschild do Sol: {r_s_sun:.6e} m")
-print(f"   Constante cosmológica observada: {Lambda_obs:.6e} m⁻²")
-
-print("\n3. TRANSIÇÃO QUÂNTICO-CLÁSSICA:")
-razao = l_P / r_s_sun
-print(f"   Razão l_P / r_s_sun = {razao:.6e}")
-print("   → A gravidade é clássica a escalas grandes")
-print("   → Efeitos quânticos dominam a escalas de Planck")
-
-print("\n4. PRINCÍPIOS VERIFICADOS:")
-print("   ✓ Princípio de Incerteza de Heisenberg")
-print("   ✓ Equação de Schrödinger")
-print("   ✓ Equações de Campo de Einstein")
-print("   ✓ Termodinâmica de buracos negros")
-print("   ✓ Teoria Quântica de Campos")
-
-print("\n5. VALIDAÇÃO NUMÉRICA:")
-print(f"   Incerteza (Planck): Δx·Δp = {l_P * m_P * c:.6e} J·s (≈ ħ/2)")
-print(f"   Métrica (Schwarzschild): Desvio = {desvio:.6e}% (muito pequeno a 1 UA)")
-print(f"   Hawking (BN): T = {T_hawking:.6e} K (compatível com relatividade)")
-
-print("\n" + "=" * 80)
-print("FIM DOS CÁLCULOS VERIFICADOS")
-print("=" * 80)
-print("\nTodos os cálculos acima foram realizados com:")
-print("- Constantes físicas do SI de precisão máxima")
-print("- Fórmulas derivadas e comprovadas experimentalmente")
-print("- Unidades consistentes internacionalmente")
-print("- Sem especulações ou notações inventadas")
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CÁLCULOS VERDADEIROS: UNIFICAÇÃO QUÂNTICO-GRAVITACIONAL
+========================================================
+
+Implementação rigorosa baseada em:
+1. Relatividade Geral (Einstein, 1915)
+2. Mecânica Quântica (Schrödinger, Heisenberg)
+3. Teoria Quântica de Campos
+4. Abordagem de Gravidade Quântica Efetiva
+
+Este arquivo implementa cálculos comprobáveis e verificáveis.
+
+Importar este módulo só define constantes e funções, sem cálculos nem
+impressões; a demonstração completa está em demo_calculos_verdadeiros.py.
+"""
+
+import numpy as np
+import math
+import os
+
+import constantes
+
+# ============================================================================
+# PARTE 1: CONSTANTES FUNDAMENTAIS VERIFICADAS
+# ============================================================================
+
+# Constantes do SI e derivadas de Planck vêm de constantes.py (conjunto
+# CODATA ativo): hbar, c, G, epsilon_0, k_B, M_sun, l_P, m_P, t_P, E_P
+
+def __getattr__(nome):
+    return constantes.exportar(__name__, nome)
+
+# ============================================================================
+# PARTE 2: PRINCÍPIO DE INCERTEZA DE HEISENBERG (VERDADEIRO)
+# ============================================================================
+
+def incerteza_heisenberg(delta_x):
+    """Calcula o mínimo Δp segundo Heisenberg: Δp = ħ/(2Δx)"""
+    return constantes.atual().hbar / (2 * delta_x)
+
+# ============================================================================
+# PARTE 3: EQUAÇÃO DE SCHRÖDINGER (VERDADEIRA)
+# ============================================================================
+
+def autoenergias_poco_infinito(n, L, m):
+    """Autoenergias para partícula em poço infinito"""
+    return (n**2 * math.pi**2 * constantes.atual().hbar2) / (2 * m * L**2)
+
+# ============================================================================
+# PARTE 4: OSCILADOR HARMÔNICO QUÂNTICO
+# ============================================================================
+
+def energia_oscilador_harmonico(n, omega):
+    """Energia do oscilador harmônico quântico"""
+    return constantes.atual().hbar * omega * (n + 0.5)
+
+# ============================================================================
+# PARTE 5: TENSOR DE ENERGIA-MOMENTO (RELATIVIDADE GERAL)
+# ============================================================================
+
+def tensor_stress_energy_dust(rho, u):
+    """Tensor de energia-momento para matéria poeirenta"""
+    u = np.array(u)
+    return rho * np.outer(u, u)
+
+# ============================================================================
+# PARTE 6: EQUAÇÕES DE CAMPO DE EINSTEIN (SIMPLIFICADO)
+# ============================================================================
+
+def schwarzschild_metric(r, M):
+    """Métrica de Schwarzschild para corpo com massa M"""
+    K = constantes.atual()
+    r_s = 2 * K.G * M / K.c2  # Raio de Schwarzschild
+    
+    if r <= r_s:
+        raise ValueError("Dentro do horizonte de eventos!")
+    
+    # Métrica diagonal
+    g = np.zeros((4, 4))
+    g[0,0] = -(1 - r_s/r)
+    g[1,1] = 1 / (1 - r_s/r)
+    g[2,2] = r**2
+    g[3,3] = r**2
+    
+    return g, r_s
+
+# ============================================================================
+# PARTE 7: QUANTIZAÇÃO DE CAMPO EM ESPAÇO CURVO
+# ============================================================================
+
+def temperatura_hawking(M):
+    """Temperatura de Hawking para buraco negro"""
+    K = constantes.atual()
+    return (K.hbar * K.c3) / (8 * math.pi * K.k_B * K.G * M)
+
+# ============================================================================
+# PARTE 8: RELAÇÃO DE DISPERSÃO QUÂNTICA-RELATIVÍSTICA
+# ============================================================================
+
+def energia_relativistica(p, m):
+    """Relação de energia-momento relativística"""
+    K = constantes.atual()
+    return math.sqrt((p * K.c)**2 + (m * K.c2)**2)
+
+# ============================================================================
+# PARTE 9: ENTROPIA E SEGUNDA LEI DA TERMODINÂMICA
+# ============================================================================
+
+def entropia_bekenstein_hawking(M):
+    """Entropia de Bekenstein-Hawking"""
+    K = constantes.atual()
+    r_s = 2 * K.G * M / K.c2
+    A = 4 * math.pi * r_s**2
+    return (A * K.k_B * K.c3) / (4 * K.hbar * K.G)
+
+
+# Instrumentação opcional (perfil.py); sem a variável, nenhum custo (nem a
+# importação do perfil); o valor (tabela, 1, 0, ...) é interpretado lá
+if os.environ.get('PERFIL_KERNELS'):
+    import perfil
+    perfil.ao_importar(__name__)
+
+
+if __name__ == "__main__":
+    from demo_calculos_verdadeiros import main
+    main()
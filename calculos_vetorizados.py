@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CÁLCULOS VETORIZADOS: VERSÕES NUMPY DAS FÓRMULAS VERDADEIRAS
+=============================================================
+Versões com broadcasting (estilo ufunc) das fórmulas de
+CalculosVerdadeirosPython.py, para avaliação sobre milhões de entradas.
+
+Convenções (iguais às ufuncs do NumPy):
+- Todos os argumentos aceitam escalares ou arrays e são combinados
+  por broadcasting.
+- `out=` recebe um buffer pré-alocado com a forma do resultado
+  (ou uma tupla de buffers, para funções com várias saídas).
+- `dtype=` escolhe o tipo de ponto flutuante do cálculo
+  (padrão: float64, ou o dtype de `out` quando fornecido).
+
+Em float64 os resultados são idênticos, bit a bit, às versões escalares:
+cada fórmula segue exatamente a mesma ordem de operações. Por isso as
+versões escalares elevam variáveis ao quadrado com `x * x` (corretamente
+arredondado pelo IEEE 754) e não com `x**2`, que passa pelo `pow` da libm
+e pode diferir em 1 ulp do que o NumPy calcula.
+
+Em float32 (faixa normal ~10⁻³⁸ a ~10³⁸), a ordem de operações do float64
+tira intermediários da faixa com entradas SI realistas: ħ² ≈ 10⁻⁶⁸ e
+2mL² ≈ 10⁻⁴⁸ (elétron em 1 nm) no poço infinito, r_s²·k_B ≈ 10⁻⁵² na
+entropia de buracos negros pequenos. Nesses kernels, fora do float64, as
+constantes são reunidas num coeficiente calculado em float64 e as
+operações são reordenadas para manter os intermediários na faixa; o erro
+fica em poucos ulps de float32. Entradas ou resultados que não cabem no
+float32 (ex.: a entropia de 1 M☉, ~10⁵⁴ J/K) continuam dando inf ou 0:
+para avaliar grandezas SI nessa faixa em float32, use unidades_naturais.
+"""
+
+import os
+import math
+import numpy as np
+
+import constantes
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        UTILITÁRIOS DE BROADCASTING                        ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _resolver_dtype(dtype, out):
+    """Escolhe o dtype do cálculo: explícito, o de `out` ou float64"""
+    if dtype is not None:
+        return np.dtype(dtype)
+    if out is not None:
+        return out.dtype
+    return np.dtype(np.float64)
+
+
+def _precisao_reduzida(dtype):
+    """True quando o cálculo não é em float64 (ordem de operações para float32)"""
+    return dtype != np.float64
+
+
+def _preparar_saida(out, forma, dtype):
+    """Aloca o buffer de saída ou valida o buffer fornecido"""
+    if out is None:
+        return np.empty(forma, dtype=dtype)
+    if out.shape != forma:
+        raise ValueError(f"out tem forma {out.shape}, esperado {forma}")
+    return out
+
+
+def _resultado(res, fornecido):
+    """Devolve escalar NumPy para entradas 0-d, como as ufuncs"""
+    if fornecido is None and res.ndim == 0:
+        return res[()]
+    return res
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                 2. PRINCÍPIO DE INCERTEZA DE HEISENBERG                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def incerteza_heisenberg(delta_x, out=None, dtype=None):
+    """
+    Princípio de Incerteza de Heisenberg: Δp = ħ/(2Δx)
+
+    Args:
+        delta_x: Incerteza na posição (m), escalar ou array
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Incerteza mínima no momento (kg·m/s)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    delta_x = np.asarray(delta_x, dtype=dtype)
+    res = _preparar_saida(out, delta_x.shape, dtype)
+
+    np.multiply(2, delta_x, out=res)
+    np.divide(constantes.atual().hbar, res, out=res)
+    return _resultado(res, out)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║             3. EQUAÇÃO DE SCHRÖDINGER INDEPENDENTE DO TEMPO               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def autoenergias_poco_infinito(n, L, m, out=None, dtype=None):
+    """
+    Autoenergias para partícula em poço de potencial infinito
+    E_n = (n² π² ħ²) / (2 m L²)
+
+    Args:
+        n: Número(s) quântico(s) principal(is)
+        L: Largura(s) do poço (m)
+        m: Massa(s) da partícula (kg)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Energia do estado n (J), com a forma de broadcast de (n, L, m)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    n = np.asarray(n, dtype=dtype)
+    L = np.asarray(L, dtype=dtype)
+    m = np.asarray(m, dtype=dtype)
+    res = _preparar_saida(out, np.broadcast_shapes(n.shape, L.shape, m.shape), dtype)
+
+    if _precisao_reduzida(dtype):
+        # a = (n · πħ) / L e E = a · (a / 2m): intermediários na faixa do float32
+        np.multiply(n, math.pi * constantes.atual().hbar, out=res)
+        np.divide(res, L, out=res)
+        np.multiply(res, np.divide(res, np.multiply(2, m, dtype=dtype)), out=res)
+        return _resultado(res, out)
+
+    # Numerador: ((n² · π²) · ħ²)
+    np.multiply(n, n, out=res)
+    np.multiply(res, math.pi**2, out=res)
+    np.multiply(res, constantes.atual().hbar2, out=res)
+
+    # Denominador: (2m) · L²
+    denominador = np.multiply(2, m, dtype=dtype)
+    denominador = np.multiply(denominador, np.multiply(L, L))
+
+    np.divide(res, denominador, out=res)
+    return _resultado(res, out)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                4. OSCILADOR HARMÔNICO QUÂNTICO                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def energia_oscilador_harmonico(n, omega, out=None, dtype=None):
+    """
+    Energia de oscilador harmônico quântico
+    E_n = ħω(n + 1/2)
+
+    Args:
+        n: Número(s) quântico(s)
+        omega: Frequência(s) angular(es) (rad/s)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Energia (J), com a forma de broadcast de (n, omega)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    n = np.asarray(n, dtype=dtype)
+    omega = np.asarray(omega, dtype=dtype)
+    res = _preparar_saida(out, np.broadcast_shapes(n.shape, omega.shape), dtype)
+
+    np.multiply(constantes.atual().hbar, omega, out=res)
+    np.multiply(res, np.add(n, 0.5), out=res)
+    return _resultado(res, out)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            5. TENSOR DE ENERGIA-MOMENTO RELATIVIDADE GERAL                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# Componentes independentes de um tensor simétrico 4x4, na ordem do
+# formato empacotado: (00, 01, 02, 03, 11, 12, 13, 22, 23, 33)
+INDICES_EMPACOTADOS = tuple((mu, nu) for mu in range(4) for nu in range(mu, 4))
+
+
+def tensor_stress_energy_dust(rho, u, empacotado=False, out=None, dtype=None, rascunho=None):
+    """
+    Tensor de Energia-Momento para matéria poeirenta, em lote
+    T^μν = ρ u^μ u^ν
+
+    O formato empacotado guarda só as 10 componentes independentes
+    (ver INDICES_EMPACOTADOS), 37.5% menos memória que a matriz 4x4.
+
+    Args:
+        rho: Densidade(s) de massa (kg/m³), forma (...)
+        u: Quadrivelocidade(s) [u^0, u^1, u^2, u^3], forma (..., 4)
+        empacotado: Se True, devolve forma (..., 10) em vez de (..., 4, 4)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+        rascunho: Buffer opcional (..., 4) para ρ u^μ, reaproveitável
+                  entre chamadas em lote
+
+    Returns:
+        Tensores T^μν, com forma (..., 4, 4) ou (..., 10)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    rho = np.asarray(rho, dtype=dtype)
+    u = np.asarray(u, dtype=dtype)
+    if u.shape[-1:] != (4,):
+        raise ValueError(f"u deve ter forma (..., 4), recebido {u.shape}")
+
+    lote = np.broadcast_shapes(rho.shape, u.shape[:-1])
+    forma = lote + ((len(INDICES_EMPACOTADOS),) if empacotado else (4, 4))
+    res = _preparar_saida(out, forma, dtype)
+
+    # (ρ u^μ) u^ν, na mesma ordem da versão escalar
+    rho_u = np.multiply(rho[..., None], u, out=rascunho)
+
+    if empacotado:
+        for k, (mu, nu) in enumerate(INDICES_EMPACOTADOS):
+            np.multiply(rho_u[..., mu], u[..., nu], out=res[..., k])
+    else:
+        np.multiply(rho_u[..., :, None], u[..., None, :], out=res)
+
+    return res
+
+
+def desempacotar_tensor(T_empacotado, out=None):
+    """
+    Reconstrói tensores simétricos 4x4 a partir do formato empacotado
+
+    Args:
+        T_empacotado: Array (..., 10) na ordem de INDICES_EMPACOTADOS
+        out: Buffer de saída opcional (..., 4, 4)
+
+    Returns:
+        Array (..., 4, 4)
+    """
+    T_empacotado = np.asarray(T_empacotado)
+    res = _preparar_saida(out, T_empacotado.shape[:-1] + (4, 4), T_empacotado.dtype)
+
+    for k, (mu, nu) in enumerate(INDICES_EMPACOTADOS):
+        res[..., mu, nu] = T_empacotado[..., k]
+        res[..., nu, mu] = T_empacotado[..., k]
+    return res
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                6. EQUAÇÃO DE CAMPO DE EINSTEIN                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def schwarzschild_metric(r, M, out=None, dtype=None):
+    """
+    Métrica de Schwarzschild: ds² = -g₀₀ dt² + g₁₁ dr² + r²(dθ² + sin²θ dφ²)
+
+    Args:
+        r: Coordenada(s) radial(is) (m)
+        M: Massa(s) central(is) (kg)
+        out: Tupla opcional (g_00, g_11, g_22, r_s) de buffers; entradas
+             None são alocadas
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Tupla (g_00, g_11, g_22, r_s); r_s tem a forma de M e as demais
+        a forma de broadcast de (r, M)
+    """
+    if out is None:
+        out = (None, None, None, None)
+    if len(out) != 4:
+        raise ValueError("out deve ser uma tupla com 4 buffers (g_00, g_11, g_22, r_s)")
+
+    dtype = _resolver_dtype(dtype, next((o for o in out if o is not None), None))
+    r = np.asarray(r, dtype=dtype)
+    M = np.asarray(M, dtype=dtype)
+    forma = np.broadcast_shapes(r.shape, M.shape)
+
+    g_00 = _preparar_saida(out[0], forma, dtype)
+    g_11 = _preparar_saida(out[1], forma, dtype)
+    g_22 = _preparar_saida(out[2], forma, dtype)
+    r_s = _preparar_saida(out[3], M.shape, dtype)
+
+    # Raio de Schwarzschild: ((2G) · M) / c²
+    K = constantes.atual()
+    np.multiply(2 * K.G, M, out=r_s)
+    np.divide(r_s, K.c2, out=r_s)
+
+    # 1 - r_s/r, compartilhado por g_00 e g_11
+    np.divide(r_s, r, out=g_11)
+    np.subtract(1, g_11, out=g_11)
+    np.negative(g_11, out=g_00)
+    np.divide(1, g_11, out=g_11)
+
+    np.multiply(r, r, out=g_22)
+
+    return (_resultado(g_00, out[0]), _resultado(g_11, out[1]),
+            _resultado(g_22, out[2]), _resultado(r_s, out[3]))
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            7. TEORIA QUÂNTICA DE CAMPOS EM ESPAÇO CURVO                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def temperatura_hawking(M, out=None, dtype=None):
+    """
+    Temperatura de radiação de Hawking
+    T_H = (ħc³) / (8πk_B GM)
+
+    Args:
+        M: Massa(s) do buraco negro (kg)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Temperatura (K)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    M = np.asarray(M, dtype=dtype)
+    res = _preparar_saida(out, M.shape, dtype)
+
+    K = constantes.atual()
+    np.multiply(8 * math.pi * K.k_B * K.G, M, out=res)
+    np.divide(K.hbar * K.c3, res, out=res)
+    return _resultado(res, out)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║            8. RELAÇÃO DE DISPERSÃO QUÂNTICA + RELATIVÍSTICA               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def energia_relativistica(p, m, out=None, dtype=None):
+    """
+    Relação de dispersão de Dirac
+    E² = (pc)² + (mc²)²
+
+    Args:
+        p: Momento(s) (kg·m/s)
+        m: Massa(s) (kg)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Energia (J), com a forma de broadcast de (p, m)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    p = np.asarray(p, dtype=dtype)
+    m = np.asarray(m, dtype=dtype)
+    res = _preparar_saida(out, np.broadcast_shapes(p.shape, m.shape), dtype)
+
+    K = constantes.atual()
+    np.multiply(p, K.c, out=res)
+    np.multiply(res, res, out=res)
+
+    # m escalar produz um escalar numpy, que não aceita out=
+    repouso = np.multiply(m, K.c2, dtype=dtype)
+    repouso = repouso * repouso
+
+    np.add(res, repouso, out=res)
+    np.sqrt(res, out=res)
+    return _resultado(res, out)
+
+
+def dispersao_relativistica(p, m, alpha=None, out=None, dtype=None):
+    """
+    Energia total, energia cinética e fator de Lorentz, estáveis em toda
+    a faixa de momentos
+
+    E = hypot(pc, mc²)        sem elevar ao quadrado: não transborda
+    K = pc · pc / (E + mc²)   igual a E - mc², sem cancelamento para p ≪ mc
+    γ = E / (mc²)
+
+    Com `alpha` (ex.: GUP3D().alpha), usa a dispersão modificada pelo GUP,
+    pc → pc · f, com f = 1 + α (p / m_P c)² = 1 + α ℓ_P² p² / ħ².
+
+    Args:
+        p: Momento(s) (kg·m/s)
+        m: Massa(s) (kg); m = 0 dá γ = inf
+        alpha: Parâmetro(s) α do GUP, opcional
+        out: Tupla opcional de buffers (E, K, γ)
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Tuple (E, K, γ) - energias em J, com a forma de broadcast de
+        (p, m, alpha)
+    """
+    if out is None:
+        out = (None, None, None)
+    dtype = _resolver_dtype(dtype, next((o for o in out if o is not None), None))
+    p = np.asarray(p, dtype=dtype)
+    m = np.asarray(m, dtype=dtype)
+    formas = [p.shape, m.shape]
+    if alpha is not None:
+        alpha = np.asarray(alpha, dtype=dtype)
+        formas.append(alpha.shape)
+    forma = np.broadcast_shapes(*formas)
+    E, cinetica, gama = (_preparar_saida(o, forma, dtype) for o in out)
+
+    K = constantes.atual()
+    # pc, no buffer de K
+    np.abs(p, out=cinetica)
+    np.multiply(cinetica, K.c, out=cinetica)
+
+    if alpha is not None:
+        # f = 1 + α (p / m_P c)², no buffer de γ
+        np.divide(p, K.m_P * K.c, out=gama)
+        np.multiply(gama, gama, out=gama)
+        np.multiply(gama, alpha, out=gama)
+        np.add(gama, 1, out=gama)
+        np.multiply(cinetica, gama, out=cinetica)
+
+    # m escalar produz um escalar numpy, que não aceita out=
+    repouso = np.multiply(m, K.c2, dtype=dtype)
+    np.hypot(cinetica, repouso, out=E)
+
+    # K = pc · (pc / (E + mc²)); p = m = 0 dá K = nan
+    np.add(E, repouso, out=gama)
+    with np.errstate(invalid='ignore'):
+        np.divide(cinetica, gama, out=gama)
+    np.multiply(cinetica, gama, out=cinetica)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(E, repouso, out=gama)
+    return tuple(_resultado(r, o) for r, o in zip((E, cinetica, gama), out))
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                9. ENTROPIA BEKENSTEIN-HAWKING                             ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def entropia_bekenstein_hawking(M, out=None, dtype=None):
+    """
+    Entropia de um buraco negro
+    S = (A k_B c³) / (4 ħ G) onde A = 4πr_s²
+
+    Args:
+        M: Massa(s) do buraco negro (kg)
+        out: Buffer de saída opcional
+        dtype: Tipo de ponto flutuante do cálculo
+
+    Returns:
+        Entropia (J/K)
+    """
+    dtype = _resolver_dtype(dtype, out)
+    M = np.asarray(M, dtype=dtype)
+    res = _preparar_saida(out, M.shape, dtype)
+
+    K = constantes.atual()
+    if _precisao_reduzida(dtype):
+        # S = (4πG k_B / ħc) · M², coeficiente em float64: em float32,
+        # A · k_B sai da faixa para buracos negros pequenos
+        np.multiply(4 * math.pi * K.G * K.k_B / (K.hbar * K.c), M, out=res)
+        np.multiply(res, M, out=res)
+        return _resultado(res, out)
+
+    # r_s = ((2G) · M) / c²
+    np.multiply(2 * K.G, M, out=res)
+    np.divide(res, K.c2, out=res)
+
+    # A = (4π) · r_s²
+    np.multiply(res, res, out=res)
+    np.multiply(4 * math.pi, res, out=res)
+
+    # S = ((A · k_B) · c³) / ((4ħ) · G)
+    np.multiply(res, K.k_B, out=res)
+    np.multiply(res, K.c3, out=res)
+    np.divide(res, 4 * K.hbar * K.G, out=res)
+    return _resultado(res, out)
+
+
+# Instrumentação opcional (perfil.py); sem a variável, nenhum custo (nem a
+# importação do perfil); o valor (tabela, 1, 0, ...) é interpretado lá
+if os.environ.get('PERFIL_KERNELS'):
+    import perfil
+    perfil.ao_importar(__name__)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CAMPO FRACO: DESVIOS DA MÉTRICA DE SCHWARZSCHILD COM ERRO CERTIFICADO
+=====================================================================
+
+Longe do horizonte (ex.: 1 UA do Sol, r/r_s ~ 5·10⁷) g₀₀ = -(1 - r_s/r)
+fica a ~10⁻⁸ de -1: em float64, formar 1 - r_s/r deixa só ~8 dígitos
+significativos no desvio, que é a parte física do resultado. Aqui a
+métrica é representada pelos desvios
+
+    h₀₀ = g₀₀ + 1 = ε,                 ε = r_s/r
+    h₁₁ = g₁₁ - 1 = ε/(1 - ε)
+
+calculados sem cancelamento, com erro relativo de poucos ulps.
+
+Uma TabelaCampoFraco vale para uma faixa r/r_s ∈ [x_min, x_max] escolhida
+pelo usuário e guarda o limite certificado do erro relativo de h₀₀ e h₁₁
+(análise de pior caso com γ_k = ku/(1-ku), u = 2⁻⁵³), em relação ao valor
+exato para as mesmas entradas float64 (r, M e constantes). O limite de
+h₁₁ cresce com o condicionamento 1/(1 - ε_max), ε_max = 1/x_min.
+
+As tabelas não dependem das constantes físicas (só de ε) e podem ser
+gravadas em disco (JSON) e recarregadas.
+
+Desempenho: para arrays grandes o custo é dominado pelo número de
+passadas na memória. A avaliação faz três (ε, 1 - ε e a divisão), contra
+cinco de schwarzschild_metric, que também calcula g₂₂ = r²; com M
+escalar, a verificação de faixa lê só r (r.min() e, com x_max finito,
+r.max()). Uma série em ε não ajuda: ε(1 + ε) já custa uma passada a mais
+que ε/(1 - ε). Medido com 10⁷ raios e M escalar, contra
+schwarzschild_metric(r, M, out=...) com buffers pré-alocados: ~1.2-1.3x
+mais rápido com a verificação de faixa (~1.4x com x_max infinito, uma
+passada de leitura a menos) e ~1.6x sem ela.
+
+Uso:
+    tabela = tabela_campo_fraco(1e6, 1e12)
+    h_00, h_11 = tabela.avaliar(r, M)
+"""
+
+import os
+import json
+import math
+import argparse
+from fractions import Fraction
+from functools import lru_cache
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import schwarzschild_metric
+from renderizacao import Resultado
+
+# Arredondamento unitário do float64
+U = 2.0**-53
+
+VERSAO_TABELA = 2
+
+
+def _gama(k):
+    """γ_k = ku / (1 - ku) (Higham): limite de k arredondamentos"""
+    return k * U / (1 - k * U)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                            TABELAS                                        ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class TabelaCampoFraco:
+    """Avaliação certificada de h₀₀ e h₁₁ numa faixa de r/r_s"""
+
+    def __init__(self, x_min, x_max=math.inf):
+        """
+        Args:
+            x_min: Menor r/r_s da faixa (> 1)
+            x_max: Maior r/r_s da faixa
+        """
+        if not 1 < x_min <= x_max:
+            raise ValueError("a faixa deve ter 1 < x_min ≤ x_max")
+        self.x_min, self.x_max = float(x_min), float(x_max)
+        self.eps_max = 1 / self.x_min
+
+        # ε = ((2G·M)/c²)/r: três arredondamentos
+        erro_eps = _gama(3)
+        self.erro_h00 = erro_eps
+        condicionamento = 1 / (1 - self.eps_max)   # ε · (dh₁₁/dε) / h₁₁
+        # 1 - ε e a divisão; termos de segunda ordem em u cobertos por um fator de folga
+        self.erro_h11 = (_gama(2) + condicionamento * erro_eps) * (1 + 1e-6)
+
+    def __repr__(self):
+        return (f"TabelaCampoFraco(r/r_s ∈ [{self.x_min:g}, {self.x_max:g}], "
+                f"erro ≤ {self.erro_h00:.2e} / {self.erro_h11:.2e})")
+
+    def _fora_da_faixa(self):
+        return ValueError(f"r/r_s fora da faixa da tabela [{self.x_min:g}, {self.x_max:g}]")
+
+    def avaliar(self, r, M, out=None, verificar=True):
+        """
+        Desvios h₀₀ = g₀₀ + 1 e h₁₁ = g₁₁ - 1
+
+        Args:
+            r: Coordenada(s) radial(is) (m)
+            M: Massa(s) central(is) (kg)
+            out: Tupla opcional de buffers (h_00, h_11)
+            verificar: Confere se r/r_s está na faixa da tabela (uma ou
+                       duas passadas de leitura); fora dela o limite não vale
+
+        Returns:
+            Tuple (h_00, h_11) com a forma de broadcast de (r, M); erro
+            relativo ≤ erro_h00 e erro_h11
+        """
+        r = np.asarray(r, dtype=np.float64)
+        M = np.asarray(M, dtype=np.float64)
+        forma = np.broadcast_shapes(r.shape, M.shape)
+        h_00, h_11 = out if out is not None else (np.empty(forma), np.empty(forma))
+
+        # ε = r_s/r, com r_s na mesma ordem de operações de schwarzschild_metric
+        K = constantes.atual()
+        r_s = np.divide(np.multiply(2 * K.G, M), K.c2)
+
+        verificar = verificar and r.size > 0
+        if verificar and M.ndim == 0:
+            # M escalar: a faixa vira limites em r, conferidos sem passadas sobre ε
+            if r.min() < self.x_min * r_s or (math.isfinite(self.x_max) and r.max() > self.x_max * r_s):
+                raise self._fora_da_faixa()
+        np.divide(r_s, r, out=h_00)
+        if verificar and M.ndim > 0:
+            if h_00.max() > self.eps_max or h_00.min() < 1 / self.x_max:
+                raise self._fora_da_faixa()
+
+        np.subtract(1.0, h_00, out=h_11)
+        np.divide(h_00, h_11, out=h_11)
+        return h_00, h_11
+
+    def para_dict(self):
+        return {
+            'versao': VERSAO_TABELA,
+            'x_min': self.x_min,
+            'x_max': self.x_max,
+            'erro_h00': self.erro_h00,
+            'erro_h11': self.erro_h11,
+        }
+
+    def salvar(self, caminho):
+        """Grava a tabela em JSON"""
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.para_dict(), arquivo, indent=2)
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Lê uma tabela gravada por salvar()
+
+        A tabela é reconstruída a partir da faixa, e os limites gravados
+        são conferidos com os recalculados.
+        """
+        with open(caminho, encoding='utf-8') as arquivo:
+            dados = json.load(arquivo)
+        if dados.get('versao') != VERSAO_TABELA:
+            raise ValueError(f"{caminho}: versão de tabela incompatível")
+        tabela = cls(dados['x_min'], dados['x_max'])
+        if tabela.para_dict() != dados:
+            raise ValueError(f"{caminho}: tabela não confere com a faixa gravada")
+        return tabela
+
+
+@lru_cache(maxsize=None)
+def _tabela_em_memoria(x_min, x_max):
+    return TabelaCampoFraco(x_min, x_max)
+
+
+def tabela_campo_fraco(x_min, x_max=math.inf, diretorio_cache=None):
+    """
+    Tabela para a faixa r/r_s ∈ [x_min, x_max], em cache na memória e,
+    opcionalmente, em disco
+
+    Args:
+        x_min, x_max: Como em TabelaCampoFraco
+        diretorio_cache: Diretório dos arquivos JSON (None: só memória)
+
+    Returns:
+        TabelaCampoFraco
+    """
+    chave = (float(x_min), float(x_max))
+    if diretorio_cache is None:
+        return _tabela_em_memoria(*chave)
+
+    caminho = os.path.join(diretorio_cache,
+                           "campo_fraco_{:.17g}_{:.17g}.json".format(*chave))
+    if os.path.exists(caminho):
+        return TabelaCampoFraco.carregar(caminho)
+    tabela = _tabela_em_memoria(*chave)
+    os.makedirs(diretorio_cache, exist_ok=True)
+    tabela.salvar(caminho)
+    return tabela
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                           VERIFICAÇÃO                                     ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class ResultadoCampoFraco(Resultado):
+    """Erros observados de uma tabela contra a aritmética racional exata"""
+    titulo = "CAMPO FRACO: TABELA COM ERRO CERTIFICADO"
+
+    tabela: str
+    amostras: int
+    erro_h00: float
+    erro_h11: float
+    limite_h00: float
+    limite_h11: float
+    erro_direto_h00: float   # (g₀₀ + 1) a partir de schwarzschild_metric
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"{self.tabela}; {self.amostras} raios contra frações exatas\n"
+        yield "{:>28} | {:>12} | {:>12}".format("", "h₀₀", "h₁₁")
+        yield "-" * 58
+        yield "{:>28} | {:>12.3e} | {:>12.3e}".format("erro relativo máximo", self.erro_h00, self.erro_h11)
+        yield "{:>28} | {:>12.3e} | {:>12.3e}".format("limite certificado", self.limite_h00, self.limite_h11)
+        yield "{:>28} | {:>12.3e} |".format("g₀₀ + 1 direto", self.erro_direto_h00)
+
+
+def verificar_tabela(tabela, r, M):
+    """
+    Compara a tabela com os valores exatos (frações) para as mesmas
+    entradas float64 e com o desvio g₀₀ + 1 formado a partir de
+    schwarzschild_metric
+
+    Args:
+        tabela: TabelaCampoFraco
+        r: Raios (m) dentro da faixa da tabela
+        M: Massa central (kg), escalar
+
+    Returns:
+        ResultadoCampoFraco
+    """
+    r = np.asarray(r, dtype=np.float64)
+    h_00, h_11 = tabela.avaliar(r, M)
+    g_00 = schwarzschild_metric(r, M)[0]
+
+    K = constantes.atual()
+    r_s = Fraction(2 * K.G) * Fraction(M) / Fraction(K.c2)
+    erro_h00 = erro_h11 = erro_direto = 0.0
+    for r_i, a, b, g in zip(r.tolist(), h_00.tolist(), h_11.tolist(), g_00.tolist()):
+        eps = r_s / Fraction(r_i)
+        exato_h11 = eps / (1 - eps)
+        erro_h00 = max(erro_h00, float(abs(Fraction(a) - eps) / eps))
+        erro_h11 = max(erro_h11, float(abs(Fraction(b) - exato_h11) / exato_h11))
+        erro_direto = max(erro_direto, float(abs(Fraction(g) + 1 - eps) / eps))
+
+    return ResultadoCampoFraco(repr(tabela), r.size, erro_h00, erro_h11,
+                               tabela.erro_h00, tabela.erro_h11, erro_direto)
+
+
+def main():
+    """Verifica tabelas do entorno do horizonte até além de 1 UA do Sol"""
+    parser = argparse.ArgumentParser(description="Tabelas de campo fraco com erro certificado")
+    parser.add_argument('--faixas', type=float, nargs='+', default=[2.0, 1e3, 1e7, 1e9],
+                        help="x_min de cada tabela (r/r_s); cada faixa cobre 6 décadas")
+    parser.add_argument('--amostras', type=int, default=2000)
+    parser.add_argument('--cache', default=None, help="diretório de cache em disco")
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    K = constantes.atual()
+    r_s = 2 * K.G * K.M_sun / K.c2
+    rng = np.random.default_rng(0)
+    resultados = []
+    for x_min in args.faixas:
+        tabela = tabela_campo_fraco(x_min, x_min * 1e6, diretorio_cache=args.cache)
+        # Margem relativa para que os arredondamentos de r_s não saiam da faixa
+        x = x_min * 10**rng.uniform(1e-12, 6 - 1e-12, args.amostras)
+        resultados.append(verificar_tabela(tabela, r_s * x, K.M_sun))
+    renderizacao.renderizar(resultados, args.formato)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CAMPO DE SCHWARZSCHILD: MÉTRICA SOBRE GRADES 3D EM DISCO
+========================================================
+
+Avalia as componentes diagonais da métrica de Schwarzschild
+
+    ds² = g_tt dt² + g_rr dr² + g_θθ dθ² + g_φφ dφ²
+    g_tt = -(1 - r_s/r),  g_rr = 1/(1 - r_s/r),  g_θθ = r²,  g_φφ = r² sin²θ
+
+sobre grades cartesianas (x, y, z) ou esféricas (r, θ, φ). As componentes
+são sempre as da base esférica no ponto da grade (onde a métrica é
+diagonal), guardadas como 4 floats por ponto em vez da matriz 4x4.
+
+Os resultados são gravados diretamente em arquivos .npy mapeados em
+memória, fatia por fatia, de modo que grades maiores que a RAM podem ser
+produzidas. Uma chamada repetida com a mesma grade e a mesma massa
+reaproveita os arquivos sem recalcular.
+
+Pontos em r ≤ r_s não levantam ValueError (como em calculos_verdadeiros.py):
+são marcados em `horizonte.npy` e recebem NaN nas componentes.
+
+Arquivos no diretório de saída:
+    metrica.npy     (n₀, n₁, n₂, 4)   (g_tt, g_rr, g_θθ, g_φφ)
+    horizonte.npy   (n₀, n₁, n₂)      True para r ≤ r_s
+    eixo_0.npy, eixo_1.npy, eixo_2.npy
+    campo.json                        massa, coordenadas, r_s e estado
+"""
+
+import os
+import json
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+import calculos_vetorizados
+
+COMPONENTES = ('g_tt', 'g_rr', 'g_thth', 'g_phph')
+COORDENADAS = ('cartesianas', 'esfericas')
+
+# Pontos por fatia processada: ~2²² pontos ≈ 170 MB de temporários em float64
+PONTOS_POR_FATIA = 2**22
+
+
+def _fatia_coordenadas(eixos, coordenadas, i0, i1, j0, j1):
+    """Calcula r e sin²θ para o bloco [i0:i1, j0:j1, :] da grade"""
+    a = eixos[0][i0:i1, None, None]
+    b = eixos[1][None, j0:j1, None]
+    d = eixos[2][None, None, :]
+    forma = (i1 - i0, j1 - j0, eixos[2].size)
+
+    if coordenadas == 'cartesianas':
+        rho = np.hypot(a, b)
+        r = np.hypot(rho, d)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sen2_theta = np.square(rho / r)
+        return r, np.broadcast_to(sen2_theta, forma)
+
+    r = np.broadcast_to(a, forma)
+    sen2_theta = np.broadcast_to(np.square(np.sin(b)), forma)
+    return r, sen2_theta
+
+
+def _metadados(M, coordenadas, dtype, r_s):
+    return {
+        'M': float(M),
+        'coordenadas': coordenadas,
+        'dtype': np.dtype(dtype).name,
+        'r_s': float(r_s),
+        'completo': False,
+    }
+
+
+def _campo_existente(diretorio, eixos, metadados):
+    """True se o diretório já contém exatamente este campo, completo"""
+    caminho = os.path.join(diretorio, 'campo.json')
+    if not os.path.exists(caminho):
+        return False
+
+    with open(caminho) as arquivo:
+        anterior = json.load(arquivo)
+    if not anterior.get('completo'):
+        return False
+    if {k: v for k, v in anterior.items() if k != 'completo'} != \
+       {k: v for k, v in metadados.items() if k != 'completo'}:
+        return False
+
+    return all(
+        np.array_equal(np.load(os.path.join(diretorio, f'eixo_{k}.npy')), eixo)
+        for k, eixo in enumerate(eixos)
+    )
+
+
+def carregar_campo(diretorio):
+    """
+    Abre um campo já calculado em modo somente leitura
+
+    Returns:
+        dict: 'metrica' (n₀, n₁, n₂, 4), 'horizonte' (n₀, n₁, n₂),
+              'eixos' e os metadados de campo.json
+    """
+    with open(os.path.join(diretorio, 'campo.json')) as arquivo:
+        campo = json.load(arquivo)
+
+    campo['metrica'] = np.load(os.path.join(diretorio, 'metrica.npy'), mmap_mode='r')
+    campo['horizonte'] = np.load(os.path.join(diretorio, 'horizonte.npy'), mmap_mode='r')
+    campo['eixos'] = tuple(np.load(os.path.join(diretorio, f'eixo_{k}.npy')) for k in range(3))
+    return campo
+
+
+def avaliar_campo_schwarzschild(eixos, M, diretorio, coordenadas='cartesianas',
+                                dtype=np.float64, pontos_por_fatia=PONTOS_POR_FATIA):
+    """
+    Avalia a métrica de Schwarzschild sobre uma grade 3D e grava em disco
+
+    Args:
+        eixos: Tupla de 3 arrays 1D - (x, y, z) em metros, ou (r, θ, φ)
+               com r em metros e ângulos em radianos
+        M: Massa central (kg)
+        diretorio: Diretório de saída
+        coordenadas: 'cartesianas' ou 'esfericas'
+        dtype: Tipo de armazenamento (float64 ou float32)
+        pontos_por_fatia: Pontos calculados por vez (limita a memória);
+                          deve comportar ao menos uma linha do último eixo
+
+    Returns:
+        dict: Campo aberto com carregar_campo()
+    """
+    if coordenadas not in COORDENADAS:
+        raise ValueError(f"coordenadas deve ser uma de {COORDENADAS}")
+    eixos = tuple(np.ascontiguousarray(eixo, dtype=np.float64).ravel() for eixo in eixos)
+    if len(eixos) != 3:
+        raise ValueError("eixos deve conter exatamente 3 arrays")
+    if eixos[2].size > pontos_por_fatia:
+        raise ValueError(f"pontos_por_fatia ({pontos_por_fatia}) menor que uma linha "
+                         f"do último eixo ({eixos[2].size} pontos)")
+
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+    metadados = _metadados(M, coordenadas, dtype, r_s)
+
+    if _campo_existente(diretorio, eixos, metadados):
+        return carregar_campo(diretorio)
+
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_metadados = os.path.join(diretorio, 'campo.json')
+    if os.path.exists(caminho_metadados):
+        os.remove(caminho_metadados)
+
+    forma = tuple(eixo.size for eixo in eixos)
+    for k, eixo in enumerate(eixos):
+        np.save(os.path.join(diretorio, f'eixo_{k}.npy'), eixo)
+
+    metrica = open_memmap(os.path.join(diretorio, 'metrica.npy'), mode='w+',
+                          dtype=dtype, shape=forma + (len(COMPONENTES),))
+    horizonte = open_memmap(os.path.join(diretorio, 'horizonte.npy'), mode='w+',
+                            dtype=np.bool_, shape=forma)
+
+    # Fatias de planos inteiros (n₁ × n₂) quando cabem; senão, o plano
+    # também é dividido ao longo do segundo eixo
+    colunas = min(forma[1], pontos_por_fatia // forma[2])
+    linhas = max(1, pontos_por_fatia // (colunas * forma[2]))
+    fatias = [
+        (i0, min(i0 + linhas, forma[0]), j0, min(j0 + colunas, forma[1]))
+        for i0 in range(0, forma[0], linhas)
+        for j0 in range(0, forma[1], colunas)
+    ]
+
+    for i0, i1, j0, j1 in fatias:
+        r, sen2_theta = _fatia_coordenadas(eixos, coordenadas, i0, i1, j0, j1)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            g_tt, g_rr, g_thth, _ = calculos_vetorizados.schwarzschild_metric(r, M)
+            g_phph = g_thth * sen2_theta
+
+        dentro = r <= r_s
+        for k, componente in enumerate((g_tt, g_rr, g_thth, g_phph)):
+            componente[dentro] = np.nan
+            metrica[i0:i1, j0:j1, :, k] = componente
+        horizonte[i0:i1, j0:j1] = dentro
+
+    metrica.flush()
+    horizonte.flush()
+    del metrica, horizonte
+
+    # Campo marcado como completo só depois de todas as fatias gravadas
+    metadados['completo'] = True
+    with open(caminho_metadados, 'w') as arquivo:
+        json.dump(metadados, arquivo, indent=2)
+
+    return carregar_campo(diretorio)
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CATÁLOGO DE BURACOS NEGROS: RAIO, TEMPERATURA E ENTROPIA EM FLUXO
+=================================================================
+
+Processa catálogos de massas (10⁸+ linhas) lidos de CSV, binário bruto ou
+.npy, bloco a bloco, e grava uma coluna .npy por grandeza:
+
+    log10_M               log₁₀ da massa (kg)
+    log10_r_s             r_s = 2GM/c²                      (m)
+    log10_T_H             T_H = ħc³ / (8πk_B GM)            (K)
+    log10_S               S = A k_B c³ / (4ħG), A = 4πr_s²  (J/K)
+    log10_microestados    log₁₀ Ω = S / (k_B ln 10)
+
+Todas as grandezas são leis de potência em M, então são calculadas como
+log₁₀(grandeza) = log₁₀(coeficiente) + expoente · log₁₀ M. Nenhum valor
+intermediário como M² ou Ω = e^(S/k_B) é formado, e massas dadas já em
+log₁₀ (log10_massa=True) podem ser arbitrariamente grandes. A única
+coluna fora do espaço log é log10_microestados, que é finita até
+M ~ 10¹⁴⁶ kg.
+
+Binários e .npy são lidos por mapeamento em memória; CSV é lido em blocos
+de linhas. As colunas de saída são .npy mapeados, preenchidos bloco a
+bloco, e `catalogo.json` só é marcado como completo no final.
+
+Uso:
+    python catalogo_buracos_negros.py massas.csv DIRETORIO [--coluna massa] [--unidade-msun]
+"""
+
+import os
+import json
+import math
+import argparse
+from itertools import islice
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+import constantes
+
+COLUNAS = ('log10_M', 'log10_r_s', 'log10_T_H', 'log10_S', 'log10_microestados')
+
+FORMATOS = ('auto', 'csv', 'binario', 'npy')
+
+# Linhas por bloco: ~2²⁰ linhas ≈ 40 MB de colunas de saída por bloco
+LINHAS_POR_BLOCO = 2**20
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                     GRANDEZAS EM ESPAÇO LOGARÍTMICO                       ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@constantes.memorizar('hbar', 'c', 'c2', 'c3', 'G', 'k_B')
+def _coeficientes_log10():
+    """Coeficientes em log₁₀: grandeza = 10^(coeficiente + expoente · log₁₀ M)"""
+    K = constantes.atual()
+    return (
+        math.log10(2 * K.G / K.c2),                                 # r_s
+        math.log10(K.hbar * K.c3 / (8 * math.pi * K.k_B * K.G)),    # T_H
+        math.log10(4 * math.pi * K.k_B * K.G / (K.hbar * K.c)),     # S
+        math.log10(K.k_B * math.log(10)),                           # k_B ln 10
+    )
+
+
+def propriedades_log10(log10_M, out=None):
+    """
+    Calcula r_s, T_H, S e log₁₀ Ω a partir de log₁₀ M
+
+    Args:
+        log10_M: log₁₀ das massas (kg), array 1D
+        out: dict opcional {coluna: buffer} para as colunas de COLUNAS
+             exceto 'log10_M'
+
+    Returns:
+        dict: Uma entrada por coluna de COLUNAS
+    """
+    log10_M = np.asarray(log10_M, dtype=np.float64)
+    log10_r_s, log10_T_H, log10_S, log10_k_B_ln10 = _coeficientes_log10()
+    out = dict(out or {})
+    for coluna in COLUNAS[1:]:
+        if coluna not in out:
+            out[coluna] = np.empty_like(log10_M)
+
+    np.add(log10_M, log10_r_s, out=out['log10_r_s'])
+    np.subtract(log10_T_H, log10_M, out=out['log10_T_H'])
+
+    # S ∝ M²: 2·log₁₀ M, sem formar M²
+    np.multiply(log10_M, 2.0, out=out['log10_S'])
+    np.add(out['log10_S'], log10_S, out=out['log10_S'])
+
+    # log₁₀ Ω = S/(k_B ln 10) = 10^(log₁₀ S - log₁₀(k_B ln 10))
+    with np.errstate(over='ignore'):
+        np.subtract(out['log10_S'], log10_k_B_ln10, out=out['log10_microestados'])
+        np.power(10.0, out['log10_microestados'], out=out['log10_microestados'])
+
+    out['log10_M'] = log10_M
+    return out
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                          LEITURA EM BLOCOS                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _detectar_formato(caminho):
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == '.npy':
+        return 'npy'
+    if extensao in ('.csv', '.txt', '.tsv'):
+        return 'csv'
+    return 'binario'
+
+
+def _abrir_csv(caminho, coluna, delimitador, cabecalho):
+    """
+    Abre o CSV e resolve cabeçalho e índice da coluna
+
+    Returns:
+        Tuple (arquivo, indice_coluna, linhas_cabecalho)
+    """
+    arquivo = open(caminho)
+    primeira = arquivo.readline()
+    campos = [campo.strip() for campo in primeira.split(delimitador)]
+
+    if cabecalho is None:
+        try:
+            float(campos[coluna if isinstance(coluna, int) else 0])
+            cabecalho = False
+        except ValueError:
+            cabecalho = True
+
+    if isinstance(coluna, str):
+        if not cabecalho or coluna not in campos:
+            arquivo.close()
+            raise ValueError(f"Coluna '{coluna}' não encontrada no cabeçalho de {caminho}")
+        coluna = campos.index(coluna)
+
+    if not cabecalho:
+        arquivo.seek(0)
+    return arquivo, coluna, int(cabecalho)
+
+
+def contar_linhas_csv(caminho, cabecalho_linhas=0):
+    """Conta as linhas de dados não vazias de um CSV (uma passada, sem parsing)"""
+    with open(caminho) as arquivo:
+        total = sum(1 for linha in arquivo if linha.strip())
+    return total - cabecalho_linhas
+
+
+def ler_blocos_csv(arquivo, coluna, delimitador=',', linhas_por_bloco=LINHAS_POR_BLOCO):
+    """
+    Lê uma coluna numérica de um CSV já aberto, em blocos
+
+    Yields:
+        Arrays float64 com até linhas_por_bloco valores
+    """
+    while True:
+        linhas = [linha for linha in islice(arquivo, linhas_por_bloco) if linha.strip()]
+        if not linhas:
+            return
+        yield np.loadtxt(linhas, delimiter=delimitador, usecols=coluna,
+                         dtype=np.float64, ndmin=1)
+
+
+def abrir_massas(caminho, formato='auto', dtype='<f8', deslocamento=0):
+    """
+    Mapeia em memória um catálogo binário bruto ou .npy
+
+    Args:
+        caminho: Arquivo de massas
+        formato: 'binario', 'npy' ou 'auto' (pela extensão)
+        dtype: Tipo dos valores no binário bruto
+        deslocamento: Bytes de cabeçalho a pular no binário bruto
+
+    Returns:
+        Array 1D mapeado (somente leitura)
+    """
+    if formato == 'auto':
+        formato = _detectar_formato(caminho)
+    if formato == 'npy':
+        return np.load(caminho, mmap_mode='r').ravel()
+    if formato == 'binario':
+        return np.memmap(caminho, dtype=dtype, mode='r', offset=deslocamento)
+    raise ValueError(f"Formato '{formato}' não pode ser mapeado em memória")
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        PROCESSAMENTO DO CATÁLOGO                          ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def carregar_catalogo(diretorio):
+    """
+    Abre as colunas de um catálogo processado em modo somente leitura
+
+    Returns:
+        dict: Uma coluna mapeada por nome em COLUNAS, mais os metadados
+              de catalogo.json
+    """
+    with open(os.path.join(diretorio, 'catalogo.json')) as arquivo:
+        catalogo = json.load(arquivo)
+
+    for coluna in COLUNAS:
+        catalogo[coluna] = np.load(os.path.join(diretorio, f'{coluna}.npy'), mmap_mode='r')
+    return catalogo
+
+
+def processar_catalogo(entrada, diretorio, formato='auto', coluna=0, delimitador=',',
+                       cabecalho=None, dtype='<f8', deslocamento=0, unidade=1.0,
+                       log10_massa=False, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """
+    Calcula r_s, T_H, S e log₁₀ Ω de um catálogo de massas, em fluxo
+
+    Args:
+        entrada: Arquivo CSV, binário bruto ou .npy com as massas
+        diretorio: Diretório de saída (uma coluna .npy por grandeza)
+        formato: 'csv', 'binario', 'npy' ou 'auto' (pela extensão)
+        coluna: Índice ou nome (pelo cabeçalho) da coluna de massas no CSV
+        delimitador: Separador do CSV
+        cabecalho: True/False, ou None para detectar pela primeira linha
+        dtype: Tipo dos valores no binário bruto
+        deslocamento: Bytes de cabeçalho a pular no binário bruto
+        unidade: Massa de uma unidade do catálogo em kg (ex.: M_sun)
+        log10_massa: True se o catálogo já contém log₁₀ das massas
+        linhas_por_bloco: Linhas processadas por vez (limita a memória)
+
+    Returns:
+        dict: Catálogo aberto com carregar_catalogo()
+
+    Massas não positivas resultam em NaN/-inf nas colunas de saída.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {FORMATOS}")
+    if formato == 'auto':
+        formato = _detectar_formato(entrada)
+
+    if formato == 'csv':
+        arquivo, coluna, linhas_cabecalho = _abrir_csv(entrada, coluna, delimitador, cabecalho)
+        n = contar_linhas_csv(entrada, linhas_cabecalho)
+        blocos = ler_blocos_csv(arquivo, coluna, delimitador, linhas_por_bloco)
+    else:
+        massas = abrir_massas(entrada, formato, dtype, deslocamento)
+        arquivo = None
+        n = massas.size
+        blocos = (massas[i0:i0 + linhas_por_bloco] for i0 in range(0, n, linhas_por_bloco))
+
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_metadados = os.path.join(diretorio, 'catalogo.json')
+    if os.path.exists(caminho_metadados):
+        os.remove(caminho_metadados)
+
+    saida = {
+        nome: open_memmap(os.path.join(diretorio, f'{nome}.npy'), mode='w+',
+                          dtype=np.float64, shape=(n,))
+        for nome in COLUNAS
+    }
+    log10_unidade = math.log10(unidade)
+
+    try:
+        i0 = 0
+        for bloco in blocos:
+            i1 = i0 + bloco.size
+            if i1 > n:
+                raise ValueError(f"{entrada} tem mais linhas válidas que as {n} contadas")
+
+            log10_M = saida['log10_M'][i0:i1]
+            if log10_massa:
+                np.add(bloco, log10_unidade, out=log10_M)
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    np.log10(bloco, out=log10_M)
+                np.add(log10_M, log10_unidade, out=log10_M)
+
+            propriedades_log10(log10_M, out={nome: saida[nome][i0:i1] for nome in COLUNAS[1:]})
+            i0 = i1
+    finally:
+        if arquivo is not None:
+            arquivo.close()
+
+    if i0 != n:
+        raise ValueError(f"{entrada}: {i0} valores lidos, {n} esperados")
+
+    for coluna_saida in saida.values():
+        coluna_saida.flush()
+    del saida
+
+    # Catálogo marcado como completo só depois de todos os blocos gravados
+    with open(caminho_metadados, 'w') as arquivo_metadados:
+        json.dump({
+            'entrada': os.path.abspath(entrada),
+            'formato': formato,
+            'linhas': n,
+            'unidade_kg': float(unidade),
+            'completo': True,
+        }, arquivo_metadados, indent=2)
+
+    return carregar_catalogo(diretorio)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Processa um catálogo e resume as faixas de cada grandeza"""
+    parser = argparse.ArgumentParser(description="Catálogo de buracos negros em fluxo")
+    parser.add_argument('entrada')
+    parser.add_argument('diretorio')
+    parser.add_argument('--formato', choices=FORMATOS, default='auto')
+    parser.add_argument('--coluna', default='0', help="índice ou nome da coluna de massas")
+    parser.add_argument('--delimitador', default=',')
+    parser.add_argument('--dtype', default='<f8', help="tipo do binário bruto")
+    parser.add_argument('--unidade-msun', action='store_true', help="massas em M_sun")
+    parser.add_argument('--log10', action='store_true', help="massas já em log₁₀")
+    args = parser.parse_args()
+
+    coluna = int(args.coluna) if args.coluna.isdigit() else args.coluna
+    catalogo = processar_catalogo(args.entrada, args.diretorio, formato=args.formato,
+                                  coluna=coluna, delimitador=args.delimitador, dtype=args.dtype,
+                                  unidade=constantes.atual().M_sun if args.unidade_msun else 1.0,
+                                  log10_massa=args.log10)
+
+    print(f"Buracos negros processados: {catalogo['linhas']}")
+    for nome in COLUNAS:
+        valores = catalogo[nome]
+        print(f"{nome:20s} {np.nanmin(valores):12.4e} a {np.nanmax(valores):12.4e}")
+
+
+if __name__ == "__main__":
+    main()
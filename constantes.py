@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CONSTANTES FÍSICAS COMPARTILHADAS
+=================================
+
+Fonte única das constantes usadas por todos os módulos Python.
+
+- Constantes de base (ħ, h, c, G, k_B, ε₀) dos ajustes CODATA 2014, 2018
+  e 2022, selecionáveis em tempo de execução. O padrão é CODATA 2018,
+  o conjunto usado originalmente pelos scripts.
+- Grandezas derivadas (escalas de Planck, κ = 8πG/c⁴, σ de
+  Stefan-Boltzmann) calculadas na primeira leitura e guardadas em cache.
+- Potências pré-calculadas que os kernels reutilizam em vez de refazer a
+  cada chamada (c², c³, c⁴, c⁵, ħ², ℓ_P², ℓ_P⁴). As potências das
+  constantes de base são calculadas em aritmética exata e arredondadas
+  uma única vez.
+
+Uso:
+    import constantes
+
+    K = constantes.atual()
+    E = K.hbar * K.c3 / ...
+
+    with constantes.codata(2014):
+        ...                     # kernels usam CODATA 2014 neste bloco
+
+    constantes.usar_codata(2022)
+
+    # Processos filhos com o mesmo conjunto (CODATA e alterações)
+    ProcessPoolExecutor(initializer=constantes.restaurar, initargs=constantes.estado())
+
+Ler `constantes.hbar` (ou qualquer outro nome) devolve o valor do
+conjunto ativo no momento da leitura.
+
+As derivadas formam um grafo de dependências. alterar(G=...) (ou o
+bloco `with constantes.variacao(G=...)`) muda constantes de base e
+descarta só os nós afetados: ℓ_P, m_P, κ e r_s do Sol são recalculados,
+mas c³ ou σ continuam em cache. Outros módulos registram seus próprios
+nós com @derivada e resultados em cache com @memorizar.
+"""
+
+import math
+from contextlib import contextmanager
+from functools import wraps
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         CONJUNTOS CODATA                                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+CODATA = {
+    2014: {
+        'hbar': 1.054571800e-34,      # J·s (Constante de Planck reduzida)
+        'h': 6.626070040e-34,         # J·s (Constante de Planck)
+        'c': 299792458.0,             # m/s (exato por definição)
+        'G': 6.67408e-11,             # m³/(kg·s²)
+        'k_B': 1.38064852e-23,        # J/K
+        'epsilon_0': 8.854187817e-12, # F/m
+    },
+    2018: {
+        'hbar': 1.054571817e-34,
+        'h': 6.62607015e-34,          # exato desde a redefinição do SI
+        'c': 299792458.0,
+        'G': 6.67430e-11,
+        'k_B': 1.380649e-23,          # exato desde a redefinição do SI
+        'epsilon_0': 8.8541878128e-12,
+    },
+    2022: {
+        'hbar': 1.054571817e-34,
+        'h': 6.62607015e-34,
+        'c': 299792458.0,
+        'G': 6.67430e-11,
+        'k_B': 1.380649e-23,
+        'epsilon_0': 8.8541878188e-12,
+    },
+}
+
+CODATA_PADRAO = 2018
+
+# Constante astronômica: não faz parte dos ajustes CODATA. É uma constante
+# de base (alterável); leia sempre constantes.atual().M_sun ou
+# constantes.M_sun, nunca uma cópia feita na importação.
+_M_SUN_PADRAO = 1.98892e+30     # kg (Massa do Sol)
+
+
+def _potencia(x, n):
+    """x**n calculado exatamente e arredondado uma vez para float"""
+    # A divisão de inteiros do Python é corretamente arredondada
+    numerador, denominador = float(x).as_integer_ratio()
+    return numerador**n / denominador**n
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                      GRAFO DE DEPENDÊNCIAS                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# Constantes de base: os únicos nós que podem ser alterados diretamente
+BASE = ('hbar', 'h', 'c', 'G', 'k_B', 'epsilon_0', 'M_sun')
+
+# nome -> (função(K), dependências diretas)
+_DERIVADAS = {}
+
+# nome -> nós que dependem diretamente dele
+_DEPENDENTES = {}
+
+# Um objeto Constantes por ano, criado na primeira seleção: voltar a um
+# conjunto já usado reaproveita as derivadas em cache
+_conjuntos = {}
+_ativo = None
+
+
+def derivada(*dependencias, nome=None):
+    """
+    Decorador que registra uma grandeza derivada no grafo
+
+    A função recebe o conjunto de constantes e só pode ler os nós listados
+    em `dependencias` (constantes de base ou derivadas já registradas).
+    O valor é calculado na primeira leitura de `K.nome` e fica em cache
+    até uma das dependências mudar.
+
+    Args:
+        dependencias: Nomes dos nós lidos pela função
+        nome: Nome do nó (padrão: nome da função)
+    """
+    def registrar(funcao):
+        chave = nome or funcao.__name__
+        if chave in BASE:
+            raise ValueError(f"'{chave}' é uma constante de base")
+        for dependencia in dependencias:
+            if dependencia not in BASE and dependencia not in _DERIVADAS:
+                raise ValueError(f"Dependência desconhecida '{dependencia}' de '{chave}'")
+
+        # Registrar de novo substitui o nó e descarta os valores em cache
+        if chave in _DERIVADAS:
+            for dependencia in _DERIVADAS[chave][1]:
+                _DEPENDENTES[dependencia].discard(chave)
+        _DERIVADAS[chave] = (funcao, dependencias)
+        for dependencia in dependencias:
+            _DEPENDENTES.setdefault(dependencia, set()).add(chave)
+        for conjunto in _conjuntos.values():
+            conjunto._invalidar((chave,))
+        return funcao
+
+    return registrar
+
+
+def afetados(nomes):
+    """Todos os nós derivados que dependem, direta ou indiretamente, de `nomes`"""
+    pendentes = list(nomes)
+    vistos = set()
+    while pendentes:
+        for dependente in _DEPENDENTES.get(pendentes.pop(), ()):
+            if dependente not in vistos:
+                vistos.add(dependente)
+                pendentes.append(dependente)
+    return vistos
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    CONSTANTES DE BASE E DERIVADAS                         ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class Constantes:
+    """
+    Um conjunto CODATA com grandezas derivadas calculadas sob demanda
+
+    As constantes de base são atributos comuns. As derivadas são
+    calculadas na primeira leitura e guardadas no próprio objeto, de modo
+    que as leituras seguintes são atributos comuns, sem custo adicional.
+    alterar() muda constantes de base e descarta só as derivadas que
+    dependem delas.
+    """
+
+    def __init__(self, ano):
+        if ano not in CODATA:
+            raise ValueError(f"CODATA {ano} indisponível; use um de {sorted(CODATA)}")
+        self.ano = ano
+        self.M_sun = _M_SUN_PADRAO
+        for nome, valor in CODATA[ano].items():
+            setattr(self, nome, valor)
+
+    def __repr__(self):
+        return f"Constantes(CODATA {self.ano})"
+
+    def __getattr__(self, nome):
+        # Só chamado quando o nome não está em cache no objeto
+        if nome not in _DERIVADAS:
+            raise AttributeError(f"'Constantes' não tem a grandeza '{nome}'")
+        funcao, _ = _DERIVADAS[nome]
+        valor = funcao(self)
+        self.__dict__[nome] = valor
+        return valor
+
+    def _invalidar(self, nomes):
+        descartados = set()
+        for nome in nomes:
+            if self.__dict__.pop(nome, None) is not None:
+                descartados.add(nome)
+        return descartados
+
+    def alterar(self, **valores):
+        """
+        Altera constantes de base e invalida as derivadas afetadas
+
+        Args:
+            **valores: Novas constantes de base, ex.: alterar(G=6.7e-11)
+
+        Returns:
+            set: Derivadas que estavam em cache e foram descartadas
+        """
+        for nome in valores:
+            if nome not in BASE:
+                raise ValueError(f"'{nome}' não é uma constante de base; use uma de {BASE}")
+        for nome, valor in valores.items():
+            setattr(self, nome, float(valor))
+        return self._invalidar(afetados(valores))
+
+    def em_cache(self):
+        """Nomes das derivadas calculadas e em cache neste conjunto"""
+        return {nome for nome in self.__dict__ if nome in _DERIVADAS}
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                       GRANDEZAS DERIVADAS                                 ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+# Potências das constantes de base
+@derivada('c', nome='c2')
+def _c2(K):
+    return _potencia(K.c, 2)
+
+
+@derivada('c', nome='c3')
+def _c3(K):
+    return _potencia(K.c, 3)
+
+
+@derivada('c', nome='c4')
+def _c4(K):
+    return _potencia(K.c, 4)
+
+
+@derivada('c', nome='c5')
+def _c5(K):
+    return _potencia(K.c, 5)
+
+
+@derivada('hbar', nome='hbar2')
+def _hbar2(K):
+    return _potencia(K.hbar, 2)
+
+
+# Escalas de Planck
+@derivada('hbar', 'G', 'c3', nome='l_P2')
+def _l_P2(K):
+    """ℓ_P² = ħG/c³, sem passar pela raiz"""
+    return K.hbar * K.G / K.c3
+
+
+@derivada('l_P2', nome='l_P4')
+def _l_P4(K):
+    return K.l_P2 * K.l_P2
+
+
+@derivada('l_P2', nome='l_P')
+def _l_P(K):
+    """Comprimento de Planck"""
+    return math.sqrt(K.l_P2)
+
+
+@derivada('hbar', 'c', 'G', nome='m_P')
+def _m_P(K):
+    """Massa de Planck"""
+    return math.sqrt(K.hbar * K.c / K.G)
+
+
+@derivada('hbar', 'G', 'c5', nome='t_P')
+def _t_P(K):
+    """Tempo de Planck"""
+    return math.sqrt(K.hbar * K.G / K.c5)
+
+
+@derivada('m_P', 'c2', nome='E_P')
+def _E_P(K):
+    """Energia de Planck E_P = m_P c²"""
+    return K.m_P * K.c2
+
+
+# Acoplamentos e raios
+@derivada('G', 'c4', nome='kappa')
+def _kappa(K):
+    """Acoplamento de Einstein κ = 8πG/c⁴"""
+    return 8 * math.pi * K.G / K.c4
+
+
+@derivada('k_B', 'hbar', 'c2', nome='sigma_SB')
+def _sigma_SB(K):
+    """Stefan-Boltzmann σ = π² k_B⁴ / (60 ħ³ c²)"""
+    return math.pi**2 * _potencia(K.k_B, 4) / (60 * _potencia(K.hbar, 3) * K.c2)
+
+
+@derivada('G', 'M_sun', 'c2', nome='r_s_sun')
+def _r_s_sun(K):
+    """Raio de Schwarzschild do Sol 2GM_sun/c²"""
+    return 2 * K.G * K.M_sun / K.c2
+
+
+# Nomes legíveis como atributos do módulo (e dos módulos legados)
+NOMES = ('hbar', 'h', 'c', 'G', 'k_B', 'epsilon_0', 'M_sun',
+         'l_P', 'm_P', 't_P', 'E_P', 'kappa', 'sigma_SB', 'r_s_sun',
+         'c2', 'c3', 'c4', 'c5', 'hbar2', 'l_P2', 'l_P4')
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                       SELEÇÃO DO CONJUNTO ATIVO                           ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _conjunto(ano):
+    if ano not in _conjuntos:
+        _conjuntos[ano] = Constantes(ano)
+    return _conjuntos[ano]
+
+
+def atual():
+    """Conjunto de constantes ativo"""
+    if _ativo is None:
+        usar_codata(CODATA_PADRAO)
+    return _ativo
+
+
+def usar_codata(ano):
+    """
+    Seleciona o conjunto CODATA usado por todos os kernels
+
+    Args:
+        ano: 2014, 2018 ou 2022
+
+    Returns:
+        Ano do conjunto que estava ativo antes (None na primeira seleção)
+    """
+    global _ativo
+    anterior = _ativo.ano if _ativo is not None else None
+    _ativo = _conjunto(ano)
+    return anterior
+
+
+@contextmanager
+def codata(ano):
+    """Seleciona um conjunto CODATA só dentro de um bloco with"""
+    anterior = usar_codata(ano)
+    try:
+        yield _ativo
+    finally:
+        usar_codata(anterior if anterior is not None else CODATA_PADRAO)
+
+
+def alterar(**valores):
+    """
+    Altera constantes de base do conjunto ativo (estudos "e se")
+
+    Só as derivadas e os resultados memorizados que dependem das
+    constantes alteradas são descartados; os demais continuam em cache.
+
+    Returns:
+        set: Nós que estavam em cache e foram descartados
+    """
+    return atual().alterar(**valores)
+
+
+@contextmanager
+def variacao(**valores):
+    """Altera constantes de base só dentro de um bloco with"""
+    K = atual()
+    originais = {nome: getattr(K, nome) for nome in valores}
+    K.alterar(**valores)
+    try:
+        yield K
+    finally:
+        K.alterar(**originais)
+
+
+def estado():
+    """
+    Ano e constantes de base do conjunto ativo, para reproduzi-lo em outro
+    processo (ex.: initargs de um ProcessPoolExecutor)
+
+    Returns:
+        Tuple (ano, base) - argumentos de restaurar()
+    """
+    K = atual()
+    return K.ano, {nome: getattr(K, nome) for nome in BASE}
+
+
+def restaurar(ano, base):
+    """
+    Ativa o conjunto CODATA `ano` com as constantes de base `base`
+
+    Inverso de estado(); serve de initializer dos pools de processos:
+        ProcessPoolExecutor(initializer=constantes.restaurar,
+                            initargs=constantes.estado())
+    """
+    usar_codata(ano)
+    alterar(**base)
+
+
+def memorizar(*dependencias):
+    """
+    Decorador que memoriza resultados no grafo de dependências
+
+    Os resultados ficam numa tabela por conjunto de constantes, indexada
+    pelos argumentos, que é descartada quando qualquer nó listado muda.
+    A função só pode depender das constantes listadas; chamadas com
+    argumentos não hasheáveis (arrays) são calculadas sem cache.
+
+    Args:
+        dependencias: Nós lidos pela função, ex.: ('G', 'c2')
+    """
+    def decorador(funcao):
+        nome = f"memo:{funcao.__module__}.{funcao.__qualname__}"
+        derivada(*dependencias, nome=nome)(lambda K: {})
+
+        @wraps(funcao)
+        def memorizada(*args, **kwargs):
+            chave = (args, tuple(sorted(kwargs.items())))
+            try:
+                tabela = getattr(atual(), nome)
+                return tabela[chave]
+            except TypeError:
+                return funcao(*args, **kwargs)
+            except KeyError:
+                tabela[chave] = resultado = funcao(*args, **kwargs)
+                return resultado
+
+        memorizada.no = nome
+        return memorizada
+
+    return decorador
+
+
+def exportar(modulo, nome):
+    """
+    Implementação de __getattr__ de módulo para os módulos legados
+
+    Permite `from CalculosVerdadeirosPython import hbar` e similares,
+    sempre com o valor do conjunto ativo.
+    """
+    if nome in NOMES:
+        return getattr(atual(), nome)
+    raise AttributeError(f"module '{modulo}' has no attribute '{nome}'")
+
+
+def __getattr__(nome):
+    return exportar(__name__, nome)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ESPECTRO DE EMISSÃO DE HAWKING: POTÊNCIA E FLUXO DE PARTÍCULAS
+==============================================================
+
+temperatura_hawking devolve só T_H. Aqui o buraco negro é tratado, como
+em evaporacao_hawking.py, como um corpo negro de área A = 4πr_s² à
+temperatura T_H, com um fator de corpo cinza Γ opcional. Por unidade de
+frequência angular ω, com x = ħω / (k_B T_H):
+
+    dP/dω = A ħω³ / (4π²c²) · Γ / (eˣ - 1)
+    dṄ/dω = A ω²  / (4π²c²) · Γ / (eˣ - 1)
+
+e os totais
+
+    P = A (k_B T_H)⁴ / (4π²c²ħ³) ∫ x³ Γ / (eˣ - 1) dx   (∫ = π⁴/15 com Γ = 1: σ A T_H⁴)
+    Ṅ = A (k_B T_H)³ / (4π²c²ħ³) ∫ x² Γ / (eˣ - 1) dx   (∫ = 2ζ(3) com Γ = 1)
+
+Os espectros são avaliados por broadcasting sobre (massas, frequências),
+sem laço em Python. As integrais usam quadratura de Gauss-Laguerre na
+variável adimensional x, igual para todas as massas: nós, pesos e os
+fatores de Planck nos nós são calculados uma vez por número de nós
+(lru_cache) e reaproveitados em todo o lote e em chamadas seguintes (não
+dependem das constantes físicas).
+
+Fator de corpo cinza Γ: None (corpo negro), um número (ex.:
+CORPO_CINZA_GEOMETRICO = 27/16, seção de choque de óptica geométrica
+27πG²M²/c⁴ sobre 4πr_s²) ou uma função Γ(x, M) vetorizada (ex.: ajustes
+tabelados por espécie).
+
+Uso:
+    P, N = totais_hawking(massas)
+    dP, dN = espectro_hawking(massas, omegas, corpo_cinza=CORPO_CINZA_GEOMETRICO)
+"""
+
+import math
+import argparse
+from functools import lru_cache
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import temperatura_hawking
+from renderizacao import Resultado
+
+# Limite de altas frequências (óptica geométrica): σ = 27πG²M²/c⁴ = (27/16) · 4πr_s²
+CORPO_CINZA_GEOMETRICO = 27 / 16
+
+# Nós de Gauss-Laguerre padrão: erro relativo < 1e-13 para Γ suave
+NOS_QUADRATURA = 64
+
+# Pico de x³/(eˣ - 1) (lei de Wien em ω)
+X_PICO_POTENCIA = 2.821439372122079
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    QUADRATURA REUTILIZÁVEL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@lru_cache(maxsize=None)
+def quadratura_planck(nos=NOS_QUADRATURA):
+    """
+    Nós e pesos de Gauss-Laguerre com os fatores de Planck já aplicados
+
+    ∫₀^∞ xᵏ g(x) / (eˣ - 1) dx = ∫₀^∞ e⁻ˣ [xᵏ / (1 - e⁻ˣ)] g(x) dx
+                               ≈ Σ pesos_k · g(x_i)
+
+    Args:
+        nos: Número de nós
+
+    Returns:
+        Tuple (x, pesos_potencia, pesos_numero) - pesos para k = 3 e k = 2;
+        arrays somente leitura, compartilhados entre chamadas
+    """
+    x, w = np.polynomial.laguerre.laggauss(nos)
+    planck = w / -np.expm1(-x)
+    pesos_potencia = planck * x * x * x
+    pesos_numero = planck * x * x
+    for a in (x, pesos_potencia, pesos_numero):
+        a.flags.writeable = False
+    return x, pesos_potencia, pesos_numero
+
+
+def _corpo_cinza(corpo_cinza, x, M):
+    """Γ(x, M) avaliado com a forma de broadcast de (x, M)"""
+    if corpo_cinza is None:
+        return 1.0
+    if callable(corpo_cinza):
+        return corpo_cinza(x, M)
+    return corpo_cinza
+
+
+def _prefatores(M):
+    """T_H, A / (4π²c²) e k_B T_H / ħ para cada massa"""
+    K = constantes.atual()
+    T_H = temperatura_hawking(M)
+    r_s = 2 * K.G * M / K.c2
+    area = 4 * math.pi * r_s * r_s
+    return T_H, area / (4 * math.pi**2 * K.c2), K.k_B * T_H / K.hbar
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                      ESPECTROS E TOTAIS                                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def espectro_hawking(M, omega, corpo_cinza=None, out=None):
+    """
+    Potência e fluxo de partículas por unidade de frequência angular
+
+    Args:
+        M: Massas (kg), forma (B,) ou escalar
+        omega: Frequências angulares (rad/s), forma (F,) ou escalar
+        corpo_cinza: None, número ou função Γ(x, M) (ver módulo)
+        out: Tupla opcional de buffers (dP/dω, dṄ/dω), forma (B, F)
+
+    Returns:
+        Tuple (dP/dω em J, dṄ/dω adimensional) de forma (B, F)
+    """
+    M = np.atleast_1d(np.asarray(M, dtype=np.float64))[:, None]
+    omega = np.atleast_1d(np.asarray(omega, dtype=np.float64))[None, :]
+    forma = (M.shape[0], omega.shape[1])
+    potencia, numero = out if out is not None else (np.empty(forma), np.empty(forma))
+
+    _, geometria, omega_T = _prefatores(M)
+    hbar = constantes.atual().hbar
+
+    # dṄ/dω = A ω² / (4π²c²) · Γ / (eˣ - 1)
+    x = omega / omega_T
+    with np.errstate(over='ignore'):
+        np.expm1(x, out=numero)
+    np.divide(geometria * (omega * omega), numero, out=numero)
+    numero *= _corpo_cinza(corpo_cinza, x, M)
+
+    # dP/dω = ħω · dṄ/dω
+    np.multiply(numero, hbar * omega, out=potencia)
+    return potencia, numero
+
+
+def totais_hawking(M, corpo_cinza=None, nos=NOS_QUADRATURA):
+    """
+    Potência total e taxa de emissão de partículas por quadratura
+
+    Os nós são os mesmos para todas as massas (variável x = ħω/k_B T_H):
+    com Γ constante a integral é calculada uma vez; com Γ(x, M), Γ é
+    avaliado numa única chamada sobre a grade (massas, nós).
+
+    Args:
+        M: Massas (kg), escalar ou array
+        corpo_cinza: None, número ou função Γ(x, M)
+        nos: Número de nós de Gauss-Laguerre
+
+    Returns:
+        Tuple (P em W, Ṅ em partículas/s) com a forma de M
+    """
+    M = np.asarray(M, dtype=np.float64)
+    x, pesos_potencia, pesos_numero = quadratura_planck(nos)
+    _, geometria, omega_T = _prefatores(M)
+
+    if callable(corpo_cinza):
+        gama = corpo_cinza(x, M[..., None])
+        integral_potencia = gama @ pesos_potencia
+        integral_numero = gama @ pesos_numero
+    else:
+        fator = 1.0 if corpo_cinza is None else corpo_cinza
+        integral_potencia = fator * pesos_potencia.sum()
+        integral_numero = fator * pesos_numero.sum()
+
+    # ∫ dω (…) = (k_B T/ħ)^(k+1) ∫ dx (…); ħω³ dω → ħ (k_B T/ħ)⁴ x³ dx
+    hbar = constantes.atual().hbar
+    omega_T3 = omega_T * omega_T * omega_T
+    P = geometria * hbar * omega_T3 * omega_T * integral_potencia
+    N = geometria * omega_T3 * integral_numero
+    return P, N
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class LinhaHawking:
+    """Totais de emissão de uma massa"""
+    M: float
+    T_H: float
+    potencia: float
+    taxa_particulas: float
+    omega_pico: float
+    razao_stefan_boltzmann: float   # P(Γ = 1) / σ A T_H⁴
+
+
+@dataclass
+class ResultadoEspectroHawking(Resultado):
+    """Potência e fluxo de partículas de Hawking para um lote de massas"""
+    titulo = "ESPECTRO DE EMISSÃO DE HAWKING"
+
+    corpo_cinza: str
+    nos: int
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Corpo cinza: {self.corpo_cinza}; quadratura de Gauss-Laguerre com {self.nos} nós\n"
+        yield "{:>12} | {:>11} | {:>11} | {:>11} | {:>11} | {:>9}".format(
+            "M (kg)", "T_H (K)", "P (W)", "Ṅ (1/s)", "ω pico", "P/σAT⁴")
+        yield "-" * 80
+        for l in self.linhas:
+            yield "{:>12.4e} | {:>11.4e} | {:>11.4e} | {:>11.4e} | {:>11.4e} | {:>9.6f}".format(
+                l.M, l.T_H, l.potencia, l.taxa_particulas, l.omega_pico, l.razao_stefan_boltzmann)
+
+
+def resumo_hawking(M, corpo_cinza=None, nos=NOS_QUADRATURA):
+    """
+    Totais por massa e verificação da quadratura contra σ A T_H⁴
+
+    Returns:
+        ResultadoEspectroHawking
+    """
+    M = np.atleast_1d(np.asarray(M, dtype=np.float64))
+    K = constantes.atual()
+    T_H, geometria, omega_T = _prefatores(M)
+    P, N = totais_hawking(M, corpo_cinza, nos)
+    P_corpo_negro, _ = totais_hawking(M, None, nos)
+    stefan_boltzmann = K.sigma_SB * geometria * 4 * math.pi**2 * K.c2 * T_H**4
+
+    nome = ("nenhum (corpo negro)" if corpo_cinza is None else
+            getattr(corpo_cinza, '__name__', None) or f"Γ = {corpo_cinza:g}")
+    linhas = [LinhaHawking(*valores) for valores in zip(
+        M, T_H, P, N, X_PICO_POTENCIA * omega_T, P_corpo_negro / stefan_boltzmann)]
+    return ResultadoEspectroHawking(nome, nos, linhas)
+
+
+def main():
+    """Totais de emissão de 10¹⁰ kg a 10 M☉"""
+    parser = argparse.ArgumentParser(description="Espectro de emissão de Hawking")
+    parser.add_argument('--massas', type=float, nargs='+', default=None,
+                        help="massas em kg (padrão: 10¹⁰, 10¹², 10²⁰ kg, 1 e 10 M☉)")
+    parser.add_argument('--geometrico', action='store_true',
+                        help="fator de corpo cinza 27/16 (óptica geométrica)")
+    parser.add_argument('--nos', type=int, default=NOS_QUADRATURA)
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    M_sun = constantes.atual().M_sun
+    massas = args.massas or [1e10, 1e12, 1e20, M_sun, 10 * M_sun]
+    corpo_cinza = CORPO_CINZA_GEOMETRICO if args.geometrico else None
+    renderizacao.renderizar([resumo_hawking(massas, corpo_cinza, args.nos)], args.formato)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ESPECTRO DO POÇO INFINITO EM FLUXO: ATÉ n ~ 10⁹ COM MEMÓRIA CONSTANTE
+=====================================================================
+
+teste_schrodinger imprime só n = 1..5. Aqui o espectro E_n = n²π²ħ²/(2mL²)
+é gerado em blocos de níveis consecutivos para várias larguras L e massas m
+ao mesmo tempo, sem materializar o array completo:
+
+- blocos_espectro(): gerador de blocos (n0, n1, E), com E de forma
+  (n1 - n0, P) para as P combinações (L, m); o buffer é reaproveitado de um
+  bloco para o outro (copie o que precisar guardar);
+- EstatisticasEspectro: estatísticas acumuladas em uma única passada, com
+  memória que não depende de n_max:
+    * histograma dos espaçamentos ΔE_n = E_{n+1} - E_n;
+    * densidade de estados acumulada N(E) = #{n : E_n ≤ E} numa grade de
+      energias;
+    * somas parciais da função de partição Z(T) = Σ exp(-E_n / k_B T),
+      com o limite superior da cauda ainda não somada.
+
+Como E_n cresce com n, os espaçamentos também crescem: histograma e N(E)
+saem de buscas binárias das bordas em cada bloco (O(G log bloco)), e um
+bloco cujo primeiro termo exp(-E/k_B T) já é zero encerra a soma de Z
+para aquela temperatura.
+
+Uso:
+    resumo = varrer_espectro(10**9, L=[1e-9, 2e-9], m=9.1093837e-31,
+                             temperaturas=[300, 3000])
+    python espectro_poco.py --n-max 1e9 --L 1e-9 2e-9 --T 300 3000
+"""
+
+import math
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import autoenergias_poco_infinito
+from renderizacao import Resultado
+
+# Energias por bloco (níveis × combinações L, m): 2²⁰ ≈ 8 MiB em float64
+TAMANHO_BLOCO = 2**20
+
+ELETRON_VOLT = 1.602176634e-19  # J, exato no SI 2019
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        GERADOR DE BLOCOS                                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _combinacoes(L, m):
+    """Broadcast de L e m para arrays 1D de mesma forma (P,)"""
+    L, m = np.broadcast_arrays(np.asarray(L, dtype=np.float64), np.asarray(m, dtype=np.float64))
+    if L.ndim > 1:
+        raise ValueError("L e m devem ser escalares ou arrays 1D")
+    return np.atleast_1d(L).copy(), np.atleast_1d(m).copy()
+
+
+def blocos_espectro(n_max, L, m, n_min=1, tamanho_bloco=TAMANHO_BLOCO, dtype=None):
+    """
+    Gera o espectro do poço infinito em blocos de níveis consecutivos
+
+    Args:
+        n_max: Último número quântico (inclusive)
+        L: Largura(s) do poço (m), escalar ou 1D
+        m: Massa(s) da partícula (kg), escalar ou 1D (broadcast com L)
+        n_min: Primeiro número quântico
+        tamanho_bloco: Energias por bloco (níveis × combinações)
+        dtype: Tipo de ponto flutuante (float32 só representa n exatamente
+               até 2²⁴)
+
+    Yields:
+        Tuple (n0, n1, E) - níveis n0..n1-1 e E de forma (n1 - n0, P);
+        E é uma visão de um buffer reaproveitado no bloco seguinte
+    """
+    L, m = _combinacoes(L, m)
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    n_min, n_max = int(n_min), int(n_max)
+    if n_min < 1:
+        raise ValueError("n_min deve ser ≥ 1")
+
+    linhas = max(1, min(n_max - n_min + 1, tamanho_bloco // L.size))
+    base = np.arange(linhas, dtype=dtype)
+    n = np.empty((linhas, 1), dtype=dtype)
+    E = np.empty((linhas, L.size), dtype=dtype)
+
+    for n0 in range(n_min, n_max + 1, linhas):
+        k = min(linhas, n_max + 1 - n0)
+        np.add(base[:k, None], n0, out=n[:k])
+        yield n0, n0 + k, autoenergias_poco_infinito(n[:k], L, m, out=E[:k])
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    ESTATÍSTICAS EM UMA PASSADA                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class ResumoEspectro(Resultado):
+    """Estatísticas acumuladas do espectro, por combinação (L, m)"""
+    titulo = "ESPECTRO DO POÇO INFINITO (EM FLUXO)"
+
+    n_min: int
+    n_max: int
+    niveis: int
+    L: np.ndarray
+    m: np.ndarray
+    E_1: np.ndarray
+    E_ultimo: np.ndarray
+    limites_espacamento: np.ndarray
+    histograma_espacamento: np.ndarray   # (P, G + 1); último: acima do limite
+    energias_dos: np.ndarray
+    contagem_acumulada: np.ndarray       # (P, G): N(E) na grade
+    desvio_dos: int                      # máx |N(E) - N analítico|
+    temperaturas: np.ndarray
+    Z: np.ndarray                        # (T, P): soma parcial
+    cauda_Z: np.ndarray                  # (T, P): limite superior do restante
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Níveis: n = {self.n_min} .. {self.n_max} ({self.niveis:,} por combinação)\n"
+        for j in range(self.L.size):
+            yield f"L = {self.L[j]:.3e} m, m = {self.m[j]:.4e} kg"
+            yield (f"  E_1 = {self.E_1[j] / ELETRON_VOLT:.6e} eV, "
+                   f"E_{self.n_max} = {self.E_ultimo[j] / ELETRON_VOLT:.6e} eV")
+            ocupados = np.count_nonzero(self.histograma_espacamento[j])
+            yield f"  Espaçamentos: {self.niveis - 1:,} em {ocupados} baldes ocupados"
+            for T, Z, cauda in zip(self.temperaturas, self.Z[:, j], self.cauda_Z[:, j]):
+                yield f"  Z({T:g} K) = {Z:.10e}  (cauda ≤ {cauda:.3e})"
+        yield f"\nN(E) acumulada vs. max{{n : E_n ≤ E}}: desvio máximo de {self.desvio_dos} nível(is)"
+
+
+class EstatisticasEspectro:
+    """
+    Acumula, bloco a bloco, histograma de espaçamentos, N(E) e Z(T)
+
+    A memória é O(P · (G + T)) e não depende do número de níveis. Os
+    blocos devem chegar em ordem crescente de n e sem lacunas, como em
+    blocos_espectro().
+    """
+
+    def __init__(self, L, m, n_max, n_min=1, temperaturas=(), limites_espacamento=None,
+                 energias_dos=None, baldes=64):
+        """
+        Args:
+            L, m: As mesmas larguras e massas passadas a blocos_espectro()
+            n_max, n_min: Faixa de níveis (para as grades padrão e a cauda de Z)
+            temperaturas: Temperaturas de Z(T) (K)
+            limites_espacamento: Limites superiores dos baldes de ΔE (J);
+                                 padrão: `baldes` limites logarítmicos entre
+                                 o menor e o maior espaçamento
+            energias_dos: Energias (J) onde N(E) é acumulada; padrão:
+                          `baldes` energias logarítmicas entre E_n_min e E_n_max
+            baldes: Tamanho das grades padrão
+        """
+        self.L, self.m = _combinacoes(L, m)
+        self.n_min, self.n_max = int(n_min), int(n_max)
+        self.E_1 = autoenergias_poco_infinito(1.0, self.L, self.m)
+
+        if limites_espacamento is None:
+            menor = (2 * self.n_min + 1) * self.E_1.min()
+            maior = (2 * self.n_max - 1) * self.E_1.max()
+            limites_espacamento = np.geomspace(menor, max(maior, menor), baldes)
+        if energias_dos is None:
+            menor = self.n_min**2 * self.E_1.min()
+            maior = float(self.n_max)**2 * self.E_1.max()
+            energias_dos = np.geomspace(menor, maior, baldes)
+        self.limites_espacamento = np.asarray(limites_espacamento, dtype=np.float64)
+        self.energias_dos = np.asarray(energias_dos, dtype=np.float64)
+        self.temperaturas = np.atleast_1d(np.asarray(temperaturas, dtype=np.float64))
+
+        P = self.L.size
+        self.niveis = 0
+        self.histograma_espacamento = np.zeros((P, self.limites_espacamento.size + 1), dtype=np.int64)
+        self.contagem_acumulada = np.zeros((P, self.energias_dos.size), dtype=np.int64)
+        self.Z = np.zeros((self.temperaturas.size, P))
+        self.E_ultimo = np.full(P, np.nan)
+        self._beta = 1 / (constantes.atual().k_B * self.temperaturas)
+        self._z_ativa = np.ones(self.temperaturas.size, dtype=bool)
+        self._espacamentos = None
+        self._termos = None
+
+    def _rascunho(self, forma):
+        """Buffers de trabalho, realocados só se o bloco crescer"""
+        if self._espacamentos is None or self._espacamentos.shape[0] < forma[0]:
+            self._espacamentos = np.empty(forma)
+            self._termos = np.empty(forma)
+        return self._espacamentos[:forma[0]], self._termos[:forma[0]]
+
+    def atualizar(self, E):
+        """
+        Acrescenta um bloco de energias consecutivas
+
+        Args:
+            E: Energias (J) de forma (níveis, P), continuação do bloco anterior
+        """
+        k, P = E.shape
+        espacamentos, termos = self._rascunho(E.shape)
+
+        # ΔE: o primeiro espaçamento liga este bloco ao anterior
+        inicio = 0 if self.niveis else 1
+        np.subtract(E[1:], E[:-1], out=espacamentos[1:])
+        espacamentos[0] = E[0] - self.E_ultimo
+
+        for j in range(P):
+            # Espaçamentos e energias crescem com n: contagens por busca binária
+            ate_limite = np.searchsorted(espacamentos[inicio:, j], self.limites_espacamento, side='right')
+            self.histograma_espacamento[j] += np.diff(ate_limite, prepend=0, append=k - inicio)
+            self.contagem_acumulada[j] += np.searchsorted(E[:, j], self.energias_dos, side='right')
+
+        for t in np.flatnonzero(self._z_ativa):
+            np.multiply(E, -self._beta[t], out=termos)
+            np.exp(termos, out=termos)
+            if not termos[0].any():
+                # exp(-βE) já é zero no início do bloco: nada mais a somar
+                self._z_ativa[t] = False
+                continue
+            self.Z[t] += termos.sum(axis=0)
+
+        self.E_ultimo[:] = E[-1]
+        self.niveis += k
+
+    def cauda_Z(self):
+        """
+        Limite superior de Σ_{n > último} exp(-β n² E_1)
+
+        A soma é limitada pela integral ∫_N^∞ exp(-β E_1 x²) dx
+        = ½ √(π / (β E_1)) erfc(N √(β E_1)), com N o último nível somado.
+        """
+        x = self._beta[:, None] * self.E_1[None, :]
+        N = self.n_min - 1 + self.niveis
+        erfc = np.vectorize(math.erfc, otypes=[np.float64])
+        return 0.5 * np.sqrt(np.pi / x) * erfc(N * np.sqrt(x))
+
+    def resumo(self):
+        """Registro ResumoEspectro com o estado atual"""
+        # Referência: o maior n inteiro com E_n ≤ E, restrito à faixa somada.
+        # ⌊√(E/E_1)⌋ é só o palpite: com E sobre um nível (ex.: E = n_max² E_1),
+        # o arredondamento de E/E_1 o deixa um nível abaixo ou acima
+        ultimo = self.n_min - 1 + self.niveis
+        E = self.energias_dos[None, :]
+        L, m = self.L[:, None], self.m[:, None]
+        analitico = np.floor(np.sqrt(E / self.E_1[:, None]))
+        analitico += autoenergias_poco_infinito(analitico + 1, L, m) <= E
+        analitico -= autoenergias_poco_infinito(analitico, L, m) > E
+        analitico = np.clip(analitico, self.n_min - 1, ultimo) - (self.n_min - 1)
+        desvio = int(np.abs(self.contagem_acumulada - analitico).max()) if self.niveis else 0
+
+        return ResumoEspectro(
+            n_min=self.n_min,
+            n_max=ultimo,
+            niveis=self.niveis,
+            L=self.L,
+            m=self.m,
+            E_1=self.E_1,
+            E_ultimo=self.E_ultimo.copy(),
+            limites_espacamento=self.limites_espacamento,
+            histograma_espacamento=self.histograma_espacamento.copy(),
+            energias_dos=self.energias_dos,
+            contagem_acumulada=self.contagem_acumulada.copy(),
+            desvio_dos=desvio,
+            temperaturas=self.temperaturas,
+            Z=self.Z.copy(),
+            cauda_Z=self.cauda_Z(),
+        )
+
+
+def varrer_espectro(n_max, L, m, temperaturas=(), n_min=1, tamanho_bloco=TAMANHO_BLOCO,
+                    consumidor=None, **opcoes):
+    """
+    Percorre o espectro uma vez, acumulando as estatísticas
+
+    Args:
+        n_max, L, m, n_min, tamanho_bloco: Como em blocos_espectro()
+        temperaturas: Temperaturas de Z(T) (K)
+        consumidor: Função opcional consumidor(n0, n1, E) chamada a cada bloco
+        **opcoes: limites_espacamento, energias_dos e baldes de
+                  EstatisticasEspectro
+
+    Returns:
+        ResumoEspectro
+    """
+    estatisticas = EstatisticasEspectro(L, m, n_max, n_min, temperaturas, **opcoes)
+    for n0, n1, E in blocos_espectro(n_max, L, m, n_min, tamanho_bloco):
+        estatisticas.atualizar(E)
+        if consumidor is not None:
+            consumidor(n0, n1, E)
+    return estatisticas.resumo()
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Espectro de um elétron em poços de 1 nm (padrão) até n_max"""
+    parser = argparse.ArgumentParser(description="Espectro do poço infinito em fluxo")
+    parser.add_argument('--n-max', type=float, default=1e7)
+    parser.add_argument('--L', type=float, nargs='+', default=[1e-9])
+    parser.add_argument('--m', type=float, nargs='+', default=[9.1093837015e-31])
+    parser.add_argument('--T', type=float, nargs='*', default=[300.0])
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    resumo = varrer_espectro(int(args.n_max), args.L, args.m, args.T)
+    renderizacao.renderizar([resumo], args.formato)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EVAPORAÇÃO DE HAWKING: EVOLUÇÃO TEMPORAL DE POPULAÇÕES
+======================================================
+
+Evolui a massa de muitos buracos negros (ex.: 10⁷ buracos negros
+primordiais) sob a emissão de Hawking.
+
+Um corpo negro de área A = 4πr_s² à temperatura T_H = ħc³/(8πk_B GM)
+perde massa a uma taxa
+
+    dM/dt = -σ A T_H⁴ / c² = -K / M²,   K = ħc⁴ / (15360 π G²)
+
+Com fator de emissão constante a solução é analítica:
+
+    M(t) = M₀ (1 - t/τ)^(1/3),   τ = M₀³ / (3K)
+
+e é usada diretamente. Com um fator de emissão dependente da massa
+f(M) (número de espécies emitidas, fatores de corpo cinza), dM/dt =
+-f(M) K/M² é integrada na variável y = M³, onde dy/dt = -3K f(M) varia
+lentamente: passos de ponto médio com Δy ≤ eta·y, e o trecho final
+(y < fim·y₀) concluído analiticamente com f congelado.
+
+Tempos em segundos, massas em kg.
+"""
+
+import math
+
+import numpy as np
+
+import constantes
+import calculos_vetorizados
+
+# Massas avaliadas por vez: blocos grandes no caminho analítico, e blocos
+# que cabem no cache no adaptativo (~1.7x mais rápido que um bloco único)
+MASSAS_POR_BLOCO = 2**20
+MASSAS_POR_BLOCO_ADAPTATIVO = 2**14
+
+
+@constantes.derivada('hbar', 'c4', 'G', nome='K_evaporacao')
+def _k_evaporacao(K):
+    return K.hbar * K.c4 / (15360 * math.pi * K.G * K.G)
+
+
+def constante_evaporacao():
+    """K = ħc⁴ / (15360 π G²), com dM/dt = -K / M²"""
+    return constantes.atual().K_evaporacao
+
+
+def taxa_perda_massa(M):
+    """
+    Taxa de perda de massa por radiação de Hawking (corpo negro)
+    dM/dt = -σ (4πr_s²) T_H⁴ / c²
+
+    Args:
+        M: Massa(s) do buraco negro (kg)
+
+    Returns:
+        dM/dt (kg/s), negativo
+    """
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+    T_H = calculos_vetorizados.temperatura_hawking(M)
+    K = constantes.atual()
+    return -K.sigma_SB * 4 * math.pi * r_s * r_s * T_H**4 / K.c2
+
+
+def tempo_vida(M0):
+    """
+    Tempo de vida de buracos negros com emissão de corpo negro
+    τ = M₀³ / (3K) = 5120 π G² M₀³ / (ħc⁴)
+
+    Args:
+        M0: Massa(s) inicial(is) (kg)
+
+    Returns:
+        Tempo até a evaporação completa (s)
+    """
+    M0 = np.asarray(M0, dtype=np.float64)
+    return M0 * M0 * M0 / (3 * constante_evaporacao())
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         EVOLUÇÃO ANALÍTICA                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _historico_analitico(M0, tempos, massas, tau):
+    for i0 in range(0, M0.size, MASSAS_POR_BLOCO):
+        i1 = i0 + MASSAS_POR_BLOCO
+        m0 = M0[i0:i1, None]
+        t = tempos[None, :]
+        # (1 - t/τ) em vez de M₀³ - 3Kt: precisão relativa mantida perto do fim
+        fracao = np.maximum(1 - t / tau[i0:i1, None], 0.0)
+        np.multiply(m0, np.cbrt(fracao), out=massas[i0:i1])
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                   EVOLUÇÃO ADAPTATIVA COM f(M)                            ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _taxa_y(y, fator_emissao):
+    """dy/dt = -3K f(M) com y = M³"""
+    return 3 * constante_evaporacao() * fator_emissao(np.cbrt(y))
+
+
+def _concluir_analiticamente(y, t, proxima, idx, tempos, massas, tau, taxa):
+    """Preenche as amostras restantes com f congelado e fixa o tempo de vida"""
+    tau[idx] = t + y / taxa
+    for j in range(tempos.size):
+        pendentes = proxima <= j
+        if not pendentes.any():
+            continue
+        restante = np.maximum(y[pendentes] - taxa[pendentes] * (tempos[j] - t[pendentes]), 0.0)
+        massas[idx[pendentes], j] = np.cbrt(restante)
+
+
+def _historico_adaptativo(M0, tempos, massas, tau, fator_emissao, eta, fim, max_passos):
+    n = M0.size
+    y0 = M0 * M0 * M0
+    y = y0.copy()
+    t = np.zeros(n)
+
+    # Amostras em t = 0 recebem a massa inicial
+    k0 = np.searchsorted(tempos, 0.0, side='right')
+    massas[:, :k0] = M0[:, None]
+    proxima = np.full(n, k0, dtype=np.intp)
+
+    ativos = np.arange(n)
+    for _ in range(max_passos):
+        if ativos.size == 0:
+            return
+
+        ya, ta = y[ativos], t[ativos]
+        taxa = _taxa_y(ya, fator_emissao)
+
+        # Trecho final: conclusão analítica com f(M) congelado
+        final = ya < fim * y0[ativos]
+        if final.any():
+            _concluir_analiticamente(ya[final], ta[final], proxima[ativos[final]],
+                                     ativos[final], tempos, massas, tau, taxa[final])
+            manter = ~final
+            ativos, ya, ta, taxa = ativos[manter], ya[manter], ta[manter], taxa[manter]
+            if ativos.size == 0:
+                return
+
+        # Passo limitado por Δy ≤ eta·y e pela próxima amostra pedida
+        pa = proxima[ativos]
+        tem_amostra = pa < tempos.size
+        alvo = np.where(tem_amostra, tempos[np.minimum(pa, tempos.size - 1)], np.inf)
+        dt = eta * ya / taxa
+        atingiu = alvo - ta <= dt
+        dt = np.where(atingiu, alvo - ta, dt)
+
+        # Ponto médio em y
+        y_meio = np.maximum(ya - 0.5 * dt * taxa, 0.0)
+        y_novo = ya - dt * _taxa_y(y_meio, fator_emissao)
+        t_novo = np.where(atingiu, alvo, ta + dt)
+
+        y[ativos] = np.maximum(y_novo, 0.0)
+        t[ativos] = t_novo
+
+        # Registro das amostras atingidas
+        if atingiu.any():
+            quem = ativos[atingiu]
+            massas[quem, proxima[quem]] = np.cbrt(y[quem])
+            proxima[quem] += 1
+
+    raise RuntimeError(f"{ativos.size} massas não concluíram a evaporação em {max_passos} passos")
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        INTERFACE PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def evoluir_populacao(M0, tempos, fator_emissao=None, eta=1e-2, fim=1e-6, max_passos=10**5):
+    """
+    Evolui uma população de buracos negros pela evaporação de Hawking
+
+    Args:
+        M0: Massas iniciais (kg), array 1D
+        tempos: Instantes de amostragem (s), crescentes e ≥ 0
+        fator_emissao: Função vetorizada f(M) que multiplica a taxa de
+                       corpo negro (None: f = 1, solução analítica)
+        eta: Variação relativa máxima de y = M³ por passo adaptativo
+        fim: Fração de y₀ abaixo da qual a evaporação é concluída
+             analiticamente com f(M) congelado
+        max_passos: Limite de passos do caminho adaptativo, por massa
+
+    Returns:
+        dict:
+            'massas': (N, T) massas em cada tempo pedido (0 após evaporar)
+            'tempo_vida': (N,) tempo até a evaporação completa (s)
+            'evaporado': (N, T) máscara tempos ≥ tempo de vida
+    """
+    M0 = np.ascontiguousarray(M0, dtype=np.float64).ravel()
+    tempos = np.ascontiguousarray(tempos, dtype=np.float64).ravel()
+    if np.any(np.diff(tempos) < 0) or np.any(tempos < 0):
+        raise ValueError("tempos devem ser crescentes e não negativos")
+    if np.any(~(M0 > 0)):
+        raise ValueError("massas iniciais devem ser positivas")
+
+    massas = np.empty((M0.size, tempos.size))
+
+    if fator_emissao is None:
+        tau = tempo_vida(M0)
+        _historico_analitico(M0, tempos, massas, tau)
+    else:
+        tau = np.empty(M0.size)
+        for i0 in range(0, M0.size, MASSAS_POR_BLOCO_ADAPTATIVO):
+            i1 = i0 + MASSAS_POR_BLOCO_ADAPTATIVO
+            _historico_adaptativo(M0[i0:i1], tempos, massas[i0:i1], tau[i0:i1],
+                                  fator_emissao, eta, fim, max_passos)
+
+    return {
+        'massas': massas,
+        'tempo_vida': tau,
+        'evaporado': tempos[None, :] >= tau[:, None],
+    }
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EXECUÇÃO EM BLOCOS COM ORÇAMENTO DE MEMÓRIA
+===========================================
+
+Avalia kernels vetorizados sobre entradas grandes demais para uma única
+chamada (ex.: 10⁹ pontos de Schwarzschild ou uma grade α × ΔP do GUP):
+
+1. estima os bytes que cada kernel precisa por elemento (saídas e
+   temporários internos);
+2. divide as entradas em blocos que cabem no orçamento de memória;
+3. aloca os buffers de trabalho uma única vez e os reaproveita em todos
+   os blocos;
+4. informa, ao final, o pico de memória residente do processo.
+
+Kernels disponíveis (KERNELS): schwarzschild_metric,
+tensor_stress_energy_dust (formato empacotado), temperatura_hawking,
+entropia_bekenstein_hawking e os métodos de GUP3D, avaliados com
+GUP3DEnsemble. Os métodos de grade do GUP (comutador_canonico_3d e
+comutador_espacial_com_ordem) são divididos nos dois eixos, α e momento.
+
+Destino dos resultados:
+- saidas=None e consumidor=None: arrays completos são alocados e
+  devolvidos (precisam caber na RAM);
+- saidas={nome: array}: os blocos são escritos diretamente nesses arrays,
+  que podem ser memmaps (np.lib.format.open_memmap) maiores que a RAM;
+- consumidor=funcao(linhas, colunas, blocos): cada bloco é entregue à
+  função e o buffer é reaproveitado no bloco seguinte (copie o que
+  precisar guardar).
+
+Uso:
+    saidas, relatorio = executar_em_blocos('schwarzschild_metric', r, M,
+                                           orcamento_bytes=512 * 2**20)
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import calculos_vetorizados
+from GUP_3D_Corrigido import GUP3DEnsemble
+from renderizacao import Resultado
+
+ORCAMENTO_PADRAO = 256 * 2**20  # 256 MiB
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                      DESCRIÇÃO DOS KERNELS                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class KernelEmBlocos:
+    """
+    Descrição de um kernel para execução em blocos
+
+    Atributos:
+        entradas: ((nome, dimensoes_extras), ...) divididas por linha
+        saidas_linha: ((nome, dimensoes_extras, dtype), ...) com uma linha
+                      por elemento de entrada
+        saidas_celula: ((nome, dtype), ...) de forma (linhas, grade)
+        rascunho: ((nome, dimensoes_extras), ...) buffers float64 por linha
+        temporarios_linha, temporarios_celula: float64 alocados dentro do
+                      kernel por linha / por célula (só para a estimativa)
+        calcular: funcao(entradas, grade, destino, rascunho), escrevendo
+                  em destino
+    """
+
+    def __init__(self, entradas, calcular, saidas_linha=(), saidas_celula=(), rascunho=(),
+                 temporarios_linha=0, temporarios_celula=0):
+        self.entradas = entradas
+        self.calcular = calcular
+        self.saidas_linha = saidas_linha
+        self.saidas_celula = saidas_celula
+        self.rascunho = rascunho
+        self.temporarios_linha = temporarios_linha
+        self.temporarios_celula = temporarios_celula
+
+    @property
+    def usa_grade(self):
+        return bool(self.saidas_celula)
+
+    def bytes_por_linha(self, incluir_saidas, conversoes=0):
+        """
+        Bytes por elemento de entrada: rascunho, temporários, cópias de
+        `conversoes` float64 das entradas e, opcionalmente, saídas
+        """
+        total = 8 * (self.temporarios_linha + conversoes)
+        total += sum(8 * int(np.prod(extra)) for _, extra in self.rascunho)
+        if incluir_saidas:
+            total += sum(np.dtype(dt).itemsize * int(np.prod(extra))
+                         for _, extra, dt in self.saidas_linha)
+        return total
+
+    def bytes_por_celula(self, incluir_saidas):
+        """Bytes por célula da grade linha × momento"""
+        total = 8 * self.temporarios_celula
+        if incluir_saidas:
+            total += sum(np.dtype(dt).itemsize for _, dt in self.saidas_celula)
+        return total
+
+
+def _schwarzschild(e, grade, d, r):
+    calculos_vetorizados.schwarzschild_metric(e['r'], e['M'], out=(d['g_00'], d['g_11'], d['g_22'], d['r_s']))
+
+
+def _tensor(e, grade, d, r):
+    calculos_vetorizados.tensor_stress_energy_dust(e['rho'], e['u'], empacotado=True,
+                                                   out=d['T'], rascunho=r['rho_u'])
+
+
+def _hawking(e, grade, d, r):
+    calculos_vetorizados.temperatura_hawking(e['M'], out=d['T_H'])
+
+
+def _bekenstein(e, grade, d, r):
+    calculos_vetorizados.entropia_bekenstein_hawking(e['M'], out=d['S'])
+
+
+def _gup_canonico(e, grade, d, r):
+    _, g = GUP3DEnsemble(e['alpha']).comutador_canonico_3d(grade, out=d['f'])
+    d['g'][...] = g[:, 0]
+
+
+def _gup_espacial(e, grade, d, r):
+    resultado = GUP3DEnsemble(e['alpha']).comutador_espacial_com_ordem(
+        grade, out=(d['O_termo'], d['razao'], d['regime_valido']))
+    d['termo_principal'][...] = resultado['termo_principal'][:, 0]
+
+
+def _gup_incerteza(e, grade, d, r):
+    d['Delta_X_min'][...] = GUP3DEnsemble(e['alpha']).incerteza_posicao_minima()
+
+
+def _gup_jacobi(e, grade, d, r):
+    resultado = GUP3DEnsemble(e['alpha'], e['beta']).verificacao_Jacobi()
+    for nome in ('Jacobi_identidade', 'beta_esperado', 'diferenca'):
+        d[nome][...] = resultado[nome]
+
+
+_F8 = np.float64
+
+KERNELS = {
+    'schwarzschild_metric': KernelEmBlocos(
+        entradas=(('r', ()), ('M', ())), calcular=_schwarzschild,
+        saidas_linha=(('g_00', (), _F8), ('g_11', (), _F8), ('g_22', (), _F8), ('r_s', (), _F8))),
+    'tensor_stress_energy_dust': KernelEmBlocos(
+        entradas=(('rho', ()), ('u', (4,))), calcular=_tensor,
+        saidas_linha=(('T', (len(calculos_vetorizados.INDICES_EMPACOTADOS),), _F8),),
+        rascunho=(('rho_u', (4,)),)),
+    'temperatura_hawking': KernelEmBlocos(
+        entradas=(('M', ()),), calcular=_hawking, saidas_linha=(('T_H', (), _F8),)),
+    'entropia_bekenstein_hawking': KernelEmBlocos(
+        entradas=(('M', ()),), calcular=_bekenstein, saidas_linha=(('S', (), _F8),)),
+    'GUP3D.comutador_canonico_3d': KernelEmBlocos(
+        entradas=(('alpha', ()),), calcular=_gup_canonico,
+        saidas_linha=(('g', (), _F8),), saidas_celula=(('f', _F8),),
+        temporarios_linha=2),
+    'GUP3D.comutador_espacial_com_ordem': KernelEmBlocos(
+        entradas=(('alpha', ()),), calcular=_gup_espacial,
+        saidas_linha=(('termo_principal', (), _F8),),
+        saidas_celula=(('O_termo', _F8), ('razao', _F8), ('regime_valido', np.bool_)),
+        temporarios_linha=4),
+    'GUP3D.incerteza_posicao_minima': KernelEmBlocos(
+        entradas=(('alpha', ()),), calcular=_gup_incerteza,
+        saidas_linha=(('Delta_X_min', (), _F8),), temporarios_linha=2),
+    'GUP3D.verificacao_Jacobi': KernelEmBlocos(
+        entradas=(('alpha', ()), ('beta', ())), calcular=_gup_jacobi,
+        saidas_linha=(('Jacobi_identidade', (), np.bool_), ('beta_esperado', (), _F8),
+                      ('diferenca', (), _F8)),
+        temporarios_linha=8),
+}
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                              RELATÓRIO                                    ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def pico_memoria_residente():
+    """Pico de memória residente do processo até agora (bytes; None sem `resource`)"""
+    if resource is None:
+        return None
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    fator = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * fator
+
+
+@dataclass
+class RelatorioBlocos(Resultado):
+    """Resumo de uma execução em blocos"""
+    titulo = "EXECUÇÃO EM BLOCOS"
+
+    kernel: str
+    elementos: int
+    blocos: int
+    forma_bloco: tuple
+    bytes_por_elemento: int
+    orcamento_bytes: int
+    bytes_trabalho: int
+    tempo_s: float
+    pico_rss_inicial_bytes: object
+    pico_rss_bytes: object
+
+    def linhas_console(self):
+        mib = 2**20
+        yield "\n" + "="*80
+        yield f"{self.titulo}: {self.kernel}"
+        yield "="*80
+        yield f"Elementos:                {self.elementos:,}"
+        yield f"Blocos:                   {self.blocos} de forma {self.forma_bloco}"
+        yield f"Estimativa por elemento:  {self.bytes_por_elemento} B"
+        yield f"Orçamento / trabalho:     {self.orcamento_bytes / mib:.1f} MiB / {self.bytes_trabalho / mib:.1f} MiB"
+        yield f"Tempo:                    {self.tempo_s:.3f} s"
+        if self.pico_rss_bytes is not None:
+            yield (f"Pico de memória residente: {self.pico_rss_bytes / mib:.1f} MiB "
+                   f"(antes: {self.pico_rss_inicial_bytes / mib:.1f} MiB)")
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                              EXECUÇÃO                                     ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _preparar_entradas(kernel, entradas):
+    """
+    Faz broadcasting das entradas para (n,) + dimensões extras, sem cópia
+
+    Returns:
+        Tuple (n, entradas, conversoes) - conversoes é o número de float64
+        por linha que os kernels copiam para entradas de outro dtype
+    """
+    if len(entradas) != len(kernel.entradas):
+        nomes = ', '.join(nome for nome, _ in kernel.entradas)
+        raise TypeError(f"o kernel espera as entradas ({nomes})")
+
+    arrays = [np.asarray(e) for e in entradas]
+    n = np.broadcast_shapes(*[a.shape[:a.ndim - len(extra)] if a.ndim >= len(extra) else ()
+                              for a, (_, extra) in zip(arrays, kernel.entradas)])
+    if len(n) > 1:
+        raise ValueError("as entradas devem ser escalares ou arrays 1D (mais dimensões extras)")
+    n = n[0] if n else 1
+
+    preparadas, conversoes = {}, 0
+    for a, (nome, extra) in zip(arrays, kernel.entradas):
+        preparadas[nome] = np.broadcast_to(a, (n,) + extra)
+        if a.ndim and a.dtype != np.float64:
+            conversoes += int(np.prod(extra))
+    return n, preparadas, conversoes
+
+
+def _dimensionar(kernel, n, m, orcamento_bytes, incluir_saidas, conversoes):
+    """
+    Forma do bloco dentro do orçamento
+
+    Returns:
+        Tuple (linhas, colunas, bytes_por_elemento)
+    """
+    por_linha = kernel.bytes_por_linha(incluir_saidas, conversoes)
+    por_celula = kernel.bytes_por_celula(incluir_saidas)
+    colunas = m
+    if kernel.usa_grade and por_celula:
+        colunas = min(m, max(1, orcamento_bytes // por_celula))
+    linhas = orcamento_bytes // max(1, por_linha + colunas * por_celula)
+    linhas = max(1, min(n, linhas))
+    return int(linhas), int(max(1, colunas)), -(-(por_linha + m * por_celula) // max(1, m))
+
+
+def executar_em_blocos(kernel, *entradas, grade=None, orcamento_bytes=ORCAMENTO_PADRAO,
+                       saidas=None, consumidor=None):
+    """
+    Avalia um kernel de KERNELS em blocos que cabem no orçamento de memória
+
+    Args:
+        kernel: Nome em KERNELS (ex.: 'schwarzschild_metric')
+        *entradas: Entradas do kernel, escalares ou arrays 1D (u do tensor:
+                   (n, 4)); podem ser memmaps
+        grade: Momentos (P² ou ΔP, 1D) dos métodos de grade do GUP
+        orcamento_bytes: Memória de trabalho máxima (buffers e temporários)
+        saidas: Dicionário opcional {nome: array de destino}
+        consumidor: Função opcional consumidor(linhas, colunas, blocos)
+                    chamada a cada bloco; blocos é {nome: visão do buffer}
+
+    Returns:
+        Tuple (saidas, RelatorioBlocos) - saidas é None com consumidor
+    """
+    if kernel not in KERNELS:
+        raise ValueError(f"kernel desconhecido: {kernel!r} (use um de {sorted(KERNELS)})")
+    if saidas is not None and consumidor is not None:
+        raise ValueError("use saidas= ou consumidor=, não os dois")
+    k = KERNELS[kernel]
+
+    n, entradas, conversoes = _preparar_entradas(k, entradas)
+    if k.usa_grade:
+        if grade is None:
+            raise ValueError(f"{kernel} precisa de grade= (momentos)")
+        grade = np.ascontiguousarray(grade, dtype=np.float64).ravel()
+        m = grade.size
+    else:
+        m = 1
+
+    # Saídas do bloco contam no orçamento, exceto quando os arrays completos
+    # são alocados aqui (memmaps de saidas= também trazem páginas para a RAM)
+    buffers_proprios = consumidor is not None
+    linhas, colunas, por_elemento = _dimensionar(k, n, m, orcamento_bytes,
+                                                 consumidor is not None or saidas is not None,
+                                                 conversoes)
+
+    formas_linha = {nome: (extra, dt) for nome, extra, dt in k.saidas_linha}
+    formas_celula = dict(k.saidas_celula)
+
+    if consumidor is None and saidas is None:
+        saidas = {nome: np.empty((n,) + extra, dtype=dt) for nome, (extra, dt) in formas_linha.items()}
+        saidas.update({nome: np.empty((n, m), dtype=dt) for nome, dt in formas_celula.items()})
+    if saidas is not None:
+        esperadas = {**{nome: (n,) + extra for nome, (extra, _) in formas_linha.items()},
+                     **{nome: (n, m) for nome in formas_celula}}
+        for nome, forma in esperadas.items():
+            if nome not in saidas or saidas[nome].shape != forma:
+                raise ValueError(f"saidas['{nome}'] deve ter forma {forma}")
+
+    # Buffers de trabalho: alocados uma vez, reaproveitados em todos os blocos
+    rascunho = {nome: np.empty((linhas,) + extra) for nome, extra in k.rascunho}
+    proprios = {}
+    if buffers_proprios:
+        proprios = {nome: np.empty((linhas,) + extra, dtype=dt) for nome, (extra, dt) in formas_linha.items()}
+        proprios.update({nome: np.empty((linhas, colunas), dtype=dt) for nome, dt in formas_celula.items()})
+    bytes_trabalho = sum(b.nbytes for b in (*rascunho.values(), *proprios.values()))
+
+    rss_inicial = pico_memoria_residente()
+    t0 = time.perf_counter()
+    blocos = 0
+    for i0 in range(0, n, linhas):
+        i1 = min(n, i0 + linhas)
+        bloco_entradas = {nome: e[i0:i1] for nome, e in entradas.items()}
+        bloco_rascunho = {nome: b[:i1 - i0] for nome, b in rascunho.items()}
+
+        for j0 in range(0, m, colunas):
+            j1 = min(m, j0 + colunas)
+            if buffers_proprios:
+                destino = {nome: proprios[nome][:i1 - i0] for nome in formas_linha}
+                destino.update({nome: proprios[nome][:i1 - i0, :j1 - j0] for nome in formas_celula})
+            else:
+                destino = {nome: saidas[nome][i0:i1] for nome in formas_linha}
+                destino.update({nome: saidas[nome][i0:i1, j0:j1] for nome in formas_celula})
+
+            k.calcular(bloco_entradas, grade[j0:j1] if k.usa_grade else None, destino, bloco_rascunho)
+            blocos += 1
+            if consumidor is not None:
+                consumidor(slice(i0, i1), slice(j0, j1), destino)
+
+    relatorio = RelatorioBlocos(
+        kernel=kernel,
+        elementos=n * m,
+        blocos=blocos,
+        forma_bloco=(linhas, colunas) if k.usa_grade else (linhas,),
+        bytes_por_elemento=por_elemento,
+        orcamento_bytes=orcamento_bytes,
+        bytes_trabalho=bytes_trabalho,
+        tempo_s=time.perf_counter() - t0,
+        pico_rss_inicial_bytes=rss_inicial,
+        pico_rss_bytes=pico_memoria_residente(),
+    )
+    return saidas, relatorio
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EXECUTOR DE SEÇÕES COM MEDIDA DE TEMPO E MEMÓRIA
+================================================
+
+Executa as seções de um relatório (ex.: SECOES de CalculosVerdadeirosPython
+e de GUP_3D_Corrigido) como tarefas independentes:
+
+- 'sequencial': no processo atual, uma após a outra
+- 'threads': em um ThreadPoolExecutor
+- 'processos': em um ProcessPoolExecutor; cada processo recebe o conjunto
+  de constantes ativo (CODATA e alterações) do processo principal
+
+Para cada seção são medidos o tempo de parede, o tempo de CPU da thread
+que a executou e o pico de memória alocada (tracemalloc, acima da memória
+já alocada no início da seção). Em modo 'threads' o tracemalloc é um só
+para todas as threads: o pico vale desde o início da execução e inclui as
+seções que rodam ao mesmo tempo, sendo um limite superior.
+
+Os resultados voltam sempre na ordem das seções, qualquer que seja a
+ordem de conclusão. Com PERFIL_KERNELS ativa, as métricas de perfil.py
+acumuladas nos processos do pool voltam com cada seção e são somadas às
+do processo principal.
+
+As medidas são opcionais: com medir=False as seções são chamadas
+diretamente, sem tracemalloc (que deixa as alocações bem mais lentas).
+
+Uso:
+    resultados, tempos = executar(SECOES, modo='processos', trabalhadores=4, medir=True)
+    renderizacao.renderizar(resultados + [tempos])
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import constantes
+from renderizacao import Resultado
+
+MODOS = ('sequencial', 'threads', 'processos')
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                          REGISTROS DE TEMPO                               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class TempoSecao:
+    """Medidas de uma seção"""
+    secao: str
+    parede_s: float
+    cpu_s: float
+    memoria_pico_bytes: int
+
+
+@dataclass
+class RelatorioTempos(Resultado):
+    """Tempos e memória de todas as seções de uma execução"""
+    titulo = "TEMPOS POR SEÇÃO"
+
+    modo: str
+    trabalhadores: int
+    parede_total_s: float
+    secoes: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Modo: {self.modo} ({self.trabalhadores} trabalhador(es))\n"
+        yield "{:<36} | {:>12} | {:>12} | {:>12}".format(
+            "Seção", "Parede (ms)", "CPU (ms)", "Pico (KiB)")
+        yield "-" * 80
+        for t in self.secoes:
+            yield "{:<36} | {:>12.3f} | {:>12.3f} | {:>12.1f}".format(
+                t.secao, t.parede_s * 1e3, t.cpu_s * 1e3, t.memoria_pico_bytes / 1024)
+        yield "-" * 80
+        yield f"Tempo de parede total: {self.parede_total_s * 1e3:.3f} ms"
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                              EXECUÇÃO                                     ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _executar_medindo(secao, reiniciar_pico=True):
+    """
+    Executa uma seção e mede tempo de parede, CPU e pico de memória
+
+    Roda na thread ou no processo do pool; em processos, precisa ser uma
+    função de módulo para ser serializada.
+
+    Args:
+        secao: Função sem argumentos
+        reiniciar_pico: Zera o pico do tracemalloc no início (False em
+                        threads, para não apagar o pico das outras seções)
+
+    Returns:
+        Tuple (resultado, TempoSecao)
+    """
+    medir_memoria = not tracemalloc.is_tracing()
+    if medir_memoria:
+        tracemalloc.start()
+    inicio_memoria = tracemalloc.get_traced_memory()[0]
+    if reiniciar_pico:
+        tracemalloc.reset_peak()
+
+    t0, c0 = time.perf_counter(), time.thread_time()
+    resultado = secao()
+    parede, cpu = time.perf_counter() - t0, time.thread_time() - c0
+
+    pico = tracemalloc.get_traced_memory()[1] - inicio_memoria
+    if medir_memoria:
+        tracemalloc.stop()
+
+    return resultado, TempoSecao(secao.__name__, parede, cpu, max(pico, 0))
+
+
+def _iniciar_processo(ano, base):
+    """Reproduz no processo do pool o conjunto de constantes do principal"""
+    constantes.restaurar(ano, base)
+    # Com fork, o processo herda as métricas já acumuladas pelo principal
+    perfil = sys.modules.get('perfil')
+    if perfil is not None:
+        perfil.reiniciar()
+
+
+def _executar_direto(secao):
+    """Executa uma seção sem medir (função de módulo: serializável)"""
+    return secao(), None
+
+
+def _executar_em_processo(secao, medir):
+    """
+    Executa uma seção no processo do pool e devolve também as métricas de
+    perfil.py acumuladas nela, que o atexit do processo nunca relataria
+
+    Returns:
+        Tuple (resultado, TempoSecao ou None, métricas ou None)
+    """
+    resultado, tempo = _executar_medindo(secao) if medir else _executar_direto(secao)
+    perfil = sys.modules.get('perfil')
+    estado = None
+    if perfil is not None and perfil.ativo():
+        estado = perfil.exportar_metricas()
+        perfil.reiniciar()
+    return resultado, tempo, estado
+
+
+def _incorporar_perfil(estados):
+    """Soma às métricas deste processo as devolvidas pelos processos do pool"""
+    for estado in estados:
+        if estado:
+            import perfil
+            perfil.incorporar(estado)
+
+
+def executar(secoes, modo='sequencial', trabalhadores=None, medir=False):
+    """
+    Executa seções independentes e, opcionalmente, mede cada uma
+
+    Args:
+        secoes: Funções sem argumentos que devolvem registros de resultado
+                (em 'processos', funções de módulo)
+        modo: 'sequencial', 'threads' ou 'processos'
+        trabalhadores: Tamanho do pool (padrão: min(núcleos, seções))
+        medir: Mede tempo e memória de cada seção (liga o tracemalloc)
+
+    Returns:
+        Tuple (resultados, RelatorioTempos ou None) - resultados na ordem
+        de `secoes`; None quando medir=False
+    """
+    if modo not in MODOS:
+        raise ValueError(f"modo desconhecido: {modo!r} (use {', '.join(MODOS)})")
+    secoes = list(secoes)
+    trabalhadores = 1 if modo == 'sequencial' else (
+        trabalhadores or min(os.cpu_count() or 1, len(secoes)) or 1)
+
+    t0 = time.perf_counter()
+    if modo == 'sequencial':
+        if not medir:
+            return [secao() for secao in secoes], None
+        medidas = [_executar_medindo(secao) for secao in secoes]
+    else:
+        if modo == 'threads':
+            pool = ThreadPoolExecutor(max_workers=trabalhadores)
+            tarefa, argumentos = (_executar_medindo, (False,)) if medir else (_executar_direto, ())
+        else:
+            pool = ProcessPoolExecutor(max_workers=trabalhadores, initializer=_iniciar_processo,
+                                       initargs=constantes.estado())
+            tarefa, argumentos = _executar_em_processo, (medir,)
+
+        # Um único tracemalloc para todas as threads; cada processo liga o seu
+        ligado_aqui = medir and modo == 'threads' and not tracemalloc.is_tracing()
+        if ligado_aqui:
+            tracemalloc.start()
+        if medir and modo == 'threads':
+            tracemalloc.reset_peak()
+        try:
+            with pool:
+                futuros = [pool.submit(tarefa, secao, *argumentos) for secao in secoes]
+                # Coleta na ordem de submissão: saída determinística
+                medidas = [futuro.result() for futuro in futuros]
+        finally:
+            if ligado_aqui:
+                tracemalloc.stop()
+
+        if modo == 'processos':
+            _incorporar_perfil(estado for _, _, estado in medidas)
+            medidas = [(resultado, tempo) for resultado, tempo, _ in medidas]
+
+    if not medir:
+        return [resultado for resultado, _ in medidas], None
+    parede_total = time.perf_counter() - t0
+
+    resultados = [resultado for resultado, _ in medidas]
+    tempos = RelatorioTempos(modo, trabalhadores, parede_total, [tempo for _, tempo in medidas])
+    return resultados, tempos
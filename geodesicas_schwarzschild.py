@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GEODÉSICAS DE SCHWARZSCHILD: INTEGRAÇÃO EM LOTE
+===============================================
+
+Integra milhares de órbitas equatoriais independentes (tipo tempo ou
+nulas) ao mesmo tempo, com o estado de todas guardado em arrays.
+
+Usa a equação de Binet na variável adimensional ũ = r_s/r, com φ como
+parâmetro de evolução:
+
+    d²ũ/dφ² = -ũ + ε K/2 + (3/2) ũ²
+
+    ε = 1 (tipo tempo), K = r_s² c²/h²   (h = r² dφ/dτ)
+    ε = 0 (nula)
+
+e a quantidade conservada
+
+    Q = (dũ/dφ)² + (1 - ũ)(ε K + ũ²) = r_s² E²/(c² h²)
+
+cuja deriva relativa é reportada como diagnóstico da integração.
+
+O passo é adaptativo e individual por órbita (Dormand-Prince 5(4)).
+Perélios (máximos de ũ), captura (ũ = 1, horizonte) e escape (ũ = 0,
+infinito) são localizados por interpolação de Hermite dentro do passo.
+"""
+
+import math
+import numpy as np
+
+import constantes
+import calculos_vetorizados
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                   COEFICIENTES DE DORMAND-PRINCE 5(4)                     ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+_B5 = _A[6] + (0,)
+_B4 = (5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40)
+_E = tuple(b5 - b4 for b5, b4 in zip(_B5, _B4))
+
+
+def _derivada(y, eK):
+    """Lado direito da equação de Binet para o estado y = (ũ, w)"""
+    u, w = y
+    return np.stack((w, -u + 0.5 * eK + 1.5 * u * u))
+
+
+def quantidade_conservada(u, w, K, temporal=True):
+    """
+    Q = w² + (1 - ũ)(εK + ũ²), constante ao longo da geodésica
+
+    Args:
+        u: ũ = r_s/r
+        w: dũ/dφ
+        K: r_s² c²/h² (ignorado para geodésicas nulas)
+        temporal: True para tipo tempo (ε = 1), False para nulas (ε = 0)
+    """
+    eK = K if temporal else 0.0
+    return w * w + (1 - u) * (eK + u * u)
+
+
+def _raiz_hermite(y0, y1, d0, d1, h, iteracoes=60):
+    """
+    Fração s ∈ [0, 1] do passo onde o polinômio de Hermite cúbico
+    (valores y0, y1 e derivadas d0, d1) cruza zero, por bisseção
+    """
+    baixo = np.zeros_like(y0)
+    alto = np.ones_like(y0)
+    sinal0 = np.sign(y0)
+
+    for _ in range(iteracoes):
+        s = 0.5 * (baixo + alto)
+        s2 = s * s
+        s3 = s2 * s
+        p = ((2*s3 - 3*s2 + 1) * y0 + (s3 - 2*s2 + s) * h * d0
+             + (-2*s3 + 3*s2) * y1 + (s3 - s2) * h * d1)
+        mesmo_lado = np.sign(p) == sinal0
+        baixo = np.where(mesmo_lado, s, baixo)
+        alto = np.where(mesmo_lado, alto, s)
+
+    return 0.5 * (baixo + alto)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         INTEGRADOR EM LOTE                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def integrar_geodesicas(u0, w0, K, phi_final, temporal=True, perielios=0,
+                        rtol=1e-12, atol=0.0, passo_inicial=1e-3, max_iteracoes=10**6):
+    """
+    Integra N geodésicas equatoriais de Schwarzschild em paralelo
+
+    Cada órbita para ao atingir φ = phi_final, ao cruzar o horizonte
+    (ũ = 1), ao escapar para o infinito (ũ = 0) ou, se perielios > 0,
+    ao completar esse número de perélios.
+
+    Args:
+        u0: Array (N,) de ũ = r_s/r iniciais
+        w0: Array (N,) de dũ/dφ iniciais
+        K: Array (N,) de r_s² c²/h² (ignorado se temporal=False)
+        phi_final: Ângulo máximo de integração (rad), escalar ou (N,)
+        temporal: True para tipo tempo, False para geodésicas nulas
+        perielios: Número de perélios a registrar por órbita
+        rtol, atol: Tolerâncias do controle de passo; a relativa usa como
+                    escala mínima max(|ũ₀|, |w₀|) de cada órbita
+        passo_inicial: Primeiro passo em φ (rad)
+        max_iteracoes: Limite de iterações do laço em lote
+
+    Returns:
+        dict:
+            'u', 'w', 'phi': estado final (N,)
+            'capturada', 'escapou': máscaras (N,)
+            'phi_perielio': (N, perielios), NaN se não atingido
+            'deriva': máx. |Q - Q₀|/|Q₀| nos passos aceitos (N,)
+            'passos': passos aceitos por órbita (N,)
+    """
+    u = np.array(u0, dtype=np.float64).ravel()
+    n = u.size
+    w = np.broadcast_to(np.asarray(w0, dtype=np.float64), (n,)).copy()
+    K = np.broadcast_to(np.asarray(K, dtype=np.float64), (n,)).copy()
+    phi_final = np.broadcast_to(np.asarray(phi_final, dtype=np.float64), (n,))
+
+    eK = K if temporal else np.zeros(n)
+    Q0 = quantidade_conservada(u, w, K, temporal)
+    escala_Q = np.maximum(np.abs(Q0), np.finfo(np.float64).tiny)
+    escala_y = np.maximum(np.maximum(np.abs(u), np.abs(w)), np.finfo(np.float64).tiny)
+
+    phi = np.zeros(n)
+    h = np.full(n, float(passo_inicial))
+    deriva = np.zeros(n)
+    passos = np.zeros(n, dtype=np.int64)
+    capturada = np.zeros(n, dtype=bool)
+    escapou = np.zeros(n, dtype=bool)
+    phi_perielio = np.full((n, perielios), np.nan)
+    n_perielios = np.zeros(n, dtype=np.int64)
+    ativa = phi < phi_final
+
+    for _ in range(max_iteracoes):
+        idx = np.flatnonzero(ativa)
+        if idx.size == 0:
+            break
+
+        y = np.stack((u[idx], w[idx]))
+        eKa = eK[idx]
+        ha = np.minimum(h[idx], phi_final[idx] - phi[idx])
+
+        # Estágios de Dormand-Prince
+        k = [_derivada(y, eKa)]
+        for linha in _A[1:]:
+            incremento = sum(a * ki for a, ki in zip(linha, k) if a)
+            k.append(_derivada(y + ha * incremento, eKa))
+
+        y_novo = y + ha * sum(b * ki for b, ki in zip(_B5, k) if b)
+        erro = ha * sum(e * ki for e, ki in zip(_E, k) if e)
+
+        tolerancia = atol + rtol * np.maximum(np.maximum(np.abs(y), np.abs(y_novo)), escala_y[idx])
+        norma = np.max(np.abs(erro) / tolerancia, axis=0)
+        aceito = norma <= 1
+
+        fator = 0.9 * np.power(np.maximum(norma, 1e-10), -0.2)
+        h[idx] = ha * np.clip(fator, 0.2, 5.0)
+
+        if not aceito.any():
+            continue
+
+        ia = idx[aceito]
+        y0a = y[:, aceito]
+        y1a = y_novo[:, aceito]
+        hh = ha[aceito]
+        d0 = k[0][:, aceito]
+        d1 = k[6][:, aceito]
+
+        # Perélio: w passa de positivo para não positivo (máximo de ũ)
+        if perielios:
+            cruza = (y0a[1] > 0) & (y1a[1] <= 0) & (n_perielios[ia] < perielios)
+            if cruza.any():
+                s = _raiz_hermite(y0a[1, cruza], y1a[1, cruza], d0[1, cruza], d1[1, cruza], hh[cruza])
+                orbitas = ia[cruza]
+                phi_perielio[orbitas, n_perielios[orbitas]] = phi[orbitas] + s * hh[cruza]
+                n_perielios[orbitas] += 1
+
+        # Horizonte (ũ = 1) e infinito (ũ = 0): para no cruzamento
+        for limite, mascara_saida in ((1.0, capturada), (0.0, escapou)):
+            cruza = np.sign(y0a[0] - limite) * np.sign(y1a[0] - limite) < 0
+            if cruza.any():
+                s = _raiz_hermite(y0a[0, cruza] - limite, y1a[0, cruza] - limite,
+                                  d0[0, cruza], d1[0, cruza], hh[cruza])
+                y1a[0, cruza] = limite
+                y1a[1, cruza] = y0a[1, cruza] + s * (y1a[1, cruza] - y0a[1, cruza])
+                hh = hh.copy()
+                hh[cruza] = s * hh[cruza]
+                mascara_saida[ia[cruza]] = True
+
+        u[ia] = y1a[0]
+        w[ia] = y1a[1]
+        phi[ia] += hh
+        passos[ia] += 1
+
+        Q = quantidade_conservada(u[ia], w[ia], K[ia], temporal)
+        encerrou = capturada[ia] | escapou[ia]
+        deriva[ia] = np.where(encerrou, deriva[ia],
+                              np.maximum(deriva[ia], np.abs(Q - Q0[ia]) / escala_Q[ia]))
+
+        ativa[ia] = ~encerrou & (phi[ia] < phi_final[ia])
+        if perielios:
+            ativa[ia] &= n_perielios[ia] < perielios
+
+    return {
+        'u': u,
+        'w': w,
+        'phi': phi,
+        'capturada': capturada,
+        'escapou': escapou,
+        'phi_perielio': phi_perielio,
+        'deriva': deriva,
+        'passos': passos,
+    }
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                     CONDIÇÕES INICIAIS E APLICAÇÕES                       ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def condicoes_orbita_ligada(a, e, M=None):
+    """
+    Condições iniciais no periélio para órbitas ligadas tipo tempo
+
+    O momento angular é escolhido de forma exata (relatividade geral) para
+    que periélio e afélio sejam r_p = a(1-e) e r_a = a(1+e).
+
+    Args:
+        a: Semieixo(s) maior(es) (m)
+        e: Excentricidade(s)
+        M: Massa central (kg), padrão M_sun do conjunto ativo
+
+    Returns:
+        Tuple (u0, w0, K) - arrays prontos para integrar_geodesicas
+    """
+    if M is None:
+        M = constantes.atual().M_sun
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+    a = np.asarray(a, dtype=np.float64)
+    e = np.asarray(e, dtype=np.float64)
+
+    u1 = r_s / (a * (1 - e))
+    u2 = r_s / (a * (1 + e))
+
+    # Q igual nos dois pontos de retorno ⟹ K = (ũ₁+ũ₂) - (ũ₁² + ũ₁ũ₂ + ũ₂²)
+    K = (u1 + u2) - (u1 * u1 + u1 * u2 + u2 * u2)
+
+    u0, K = np.broadcast_arrays(u1, K)
+    return u0.ravel(), np.zeros(u0.size), K.ravel()
+
+
+def condicoes_raio_nulo(r0, b, M, entrando=True):
+    """
+    Condições iniciais para geodésicas nulas com parâmetro de impacto b
+
+    Args:
+        r0: Raio(s) inicial(is) (m)
+        b: Parâmetro(s) de impacto (m)
+        M: Massa central (kg)
+        entrando: True se o raio se aproxima do centro (dũ/dφ > 0)
+
+    Returns:
+        Tuple (u0, w0) - arrays prontos para integrar_geodesicas(temporal=False)
+    """
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+    u0, b, entrando = np.broadcast_arrays(r_s / np.asarray(r0, dtype=np.float64),
+                                          np.asarray(b, dtype=np.float64),
+                                          np.asarray(entrando))
+
+    # Q = (r_s/b)² fixa |w|; pontos proibidos (Q < potencial) ficam com w = 0
+    w2 = (r_s / b)**2 - (1 - u0) * u0 * u0
+    w0 = np.sqrt(np.maximum(w2, 0.0))
+    w0 = np.where(entrando, w0, -w0)
+    return u0.ravel(), w0.ravel()
+
+
+def tabela_precessao(a, e, M=None, orbitas=1, rtol=1e-12):
+    """
+    Tabela de precessão do periélio para órbitas ao redor de M
+
+    Args:
+        a: Semieixos maiores (m)
+        e: Excentricidades
+        M: Massa central (kg), padrão M_sun do conjunto ativo
+        orbitas: Número de órbitas integradas (a precessão é a média)
+        rtol: Tolerância relativa do integrador
+
+    Returns:
+        dict:
+            'precessao': Δφ por órbita (rad), integração numérica
+            'precessao_analitica': 3π r_s / (a(1-e²)) = 6πGM/(c² a(1-e²))
+            'deriva': deriva relativa de Q em cada órbita
+            'passos': passos aceitos por órbita
+    """
+    if M is None:
+        M = constantes.atual().M_sun
+    u0, w0, K = condicoes_orbita_ligada(a, e, M)
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+
+    resultado = integrar_geodesicas(u0, w0, K, phi_final=2 * math.pi * (orbitas + 1),
+                                    perielios=orbitas, rtol=rtol)
+
+    phi_n = resultado['phi_perielio'][:, orbitas - 1]
+    a, e = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(e, dtype=np.float64))
+
+    return {
+        'precessao': (phi_n - 2 * math.pi * orbitas) / orbitas,
+        'precessao_analitica': (3 * math.pi * r_s / (a * (1 - e * e))).ravel(),
+        'deriva': resultado['deriva'],
+        'passos': resultado['passos'],
+    }
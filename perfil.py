@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+INSTRUMENTAÇÃO DOS KERNELS: CHAMADAS, TEMPO E HISTOGRAMAS DE LATÊNCIA
+====================================================================
+
+Conta chamadas, soma o tempo e monta um histograma de latência de cada
+kernel (incerteza_heisenberg, schwarzschild_metric, GUP3D.comutador_canonico_3d,
+...), sem profiler externo.
+
+A instrumentação troca os atributos dos módulos e classes por versões
+cronometradas e, ao ser desligada, devolve os objetos originais: desligada,
+não há nenhum invólucro no caminho das chamadas e os kernels rodam na
+velocidade original.
+
+Ativação:
+- Variável de ambiente: PERFIL_KERNELS=tabela (ou =1, =true) ou
+  PERFIL_KERNELS=prometheus instrumenta os módulos de kernels quando são
+  importados e imprime o relatório em stderr ao final do processo
+  (ou no arquivo PERFIL_KERNELS_ARQUIVO); =0, =false, =off ou vazia
+  deixam a instrumentação desligada
+- Gerenciador de contexto:
+      with perfil.perfilar() as p:
+          main()
+      print(p.tabela())
+
+Nomes já importados com `from modulo import kernel` antes da ativação
+continuam apontando para o original; chamadas via módulo, dentro do
+próprio módulo e métodos de classe são sempre instrumentadas.
+
+Só o processo principal imprime o relatório: processos filhos criados por
+fork terminam sem rodar o atexit, e os criados por spawn ou forkserver
+(que reimportam os módulos de kernels) não o registram. As métricas de um
+ProcessPoolExecutor só aparecem no relatório quando o pool as devolve com
+exportar_metricas() e o processo principal as soma com incorporar(), como
+faz executor_secoes em modo 'processos'. Nos demais pools de processos
+(varredura_gup, sombra_buraco_negro, amostragem_termica) o relatório cobre
+apenas o processo principal.
+"""
+
+import os
+import sys
+import time
+import atexit
+import bisect
+import importlib
+import functools
+import threading
+import warnings
+import multiprocessing
+from contextlib import contextmanager
+
+VARIAVEL_AMBIENTE = 'PERFIL_KERNELS'
+VARIAVEL_ARQUIVO = 'PERFIL_KERNELS_ARQUIVO'
+
+# Valores de PERFIL_KERNELS -> formato do relatório (None: desligado)
+VALORES_AMBIENTE = {
+    'tabela': 'tabela', '1': 'tabela', 'true': 'tabela', 'sim': 'tabela', 'on': 'tabela',
+    'prometheus': 'prometheus',
+    '': None, '0': None, 'false': None, 'nao': None, 'não': None, 'off': None,
+}
+
+# Kernels instrumentados: módulo -> nomes (Classe.metodo para métodos)
+KERNELS = {
+    'calculos_verdadeiros': (
+        'incerteza_heisenberg', 'autoenergias_poco_infinito', 'energia_oscilador_harmonico',
+        'tensor_stress_energy_dust', 'schwarzschild_metric', 'temperatura_hawking',
+        'energia_relativistica', 'entropia_bekenstein_hawking',
+    ),
+    'CalculosVerdadeirosPython': (
+        'incerteza_heisenberg', 'autoenergias_poco_infinito', 'energia_oscilador_harmonico',
+        'tensor_stress_energy_dust', 'schwarzschild_metric', 'temperatura_hawking',
+        'energia_relativistica', 'entropia_bekenstein_hawking',
+    ),
+    'calculos_vetorizados': (
+        'incerteza_heisenberg', 'autoenergias_poco_infinito', 'energia_oscilador_harmonico',
+        'tensor_stress_energy_dust', 'schwarzschild_metric', 'temperatura_hawking',
+        'energia_relativistica', 'dispersao_relativistica', 'entropia_bekenstein_hawking',
+    ),
+    'GUP_3D_Corrigido': (
+        'GUP3D.comutador_canonico_3d', 'GUP3D.incerteza_posicao_minima',
+        'GUP3D.parametro_alpha_para_Planck', 'GUP3D.comutador_espacial_com_ordem',
+        'GUP3D.verificacao_Jacobi',
+        'GUP3DEnsemble.comutador_canonico_3d', 'GUP3DEnsemble.incerteza_posicao_minima',
+        'GUP3DEnsemble.comutador_espacial_com_ordem', 'GUP3DEnsemble.verificacao_Jacobi',
+    ),
+}
+
+# Limites superiores dos baldes do histograma (s): 1, 2.5 e 5 por década,
+# de 100 ns a 10 s
+LIMITES_S = tuple(m * 10.0**e for e in range(-7, 2) for m in (1, 2.5, 5))[:-2]
+_LIMITES_NS = tuple(limite * 1e9 for limite in LIMITES_S)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                              MÉTRICAS                                     ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class Metrica:
+    """Chamadas, tempo acumulado e histograma de latência de um kernel"""
+
+    def __init__(self, nome):
+        self.nome = nome
+        self._trava = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        self.chamadas = 0
+        self.total_ns = 0
+        self.baldes = [0] * (len(_LIMITES_NS) + 1)  # último: acima de 10 s
+
+    def registrar(self, duracao_ns):
+        indice = bisect.bisect_left(_LIMITES_NS, duracao_ns)
+        with self._trava:
+            self.chamadas += 1
+            self.total_ns += duracao_ns
+            self.baldes[indice] += 1
+
+    def quantil(self, q):
+        """Limite superior do balde que contém o quantil q (s)"""
+        alvo = q * self.chamadas
+        acumulado = 0
+        for limite, n in zip(LIMITES_S + (float('inf'),), self.baldes):
+            acumulado += n
+            if acumulado >= alvo and acumulado > 0:
+                return limite
+        return float('nan')
+
+
+# Métricas por nome qualificado ("modulo.kernel")
+_METRICAS = {}
+
+# Atributos trocados: (objeto, nome, original)
+_TROCADOS = []
+
+
+def _metrica(nome):
+    if nome not in _METRICAS:
+        _METRICAS[nome] = Metrica(nome)
+    return _METRICAS[nome]
+
+
+def metricas():
+    """Métricas com pelo menos uma chamada, da maior para a menor soma de tempo"""
+    return sorted((m for m in _METRICAS.values() if m.chamadas),
+                  key=lambda m: m.total_ns, reverse=True)
+
+
+def reiniciar():
+    """Zera todas as métricas (os kernels instrumentados continuam ligados a elas)"""
+    for metrica in _METRICAS.values():
+        metrica.zerar()
+
+
+def exportar_metricas():
+    """
+    Estado das métricas com chamadas, serializável para outro processo
+
+    Returns:
+        Dict nome -> (chamadas, total_ns, baldes)
+    """
+    estado = {}
+    for nome, m in _METRICAS.items():
+        with m._trava:
+            if m.chamadas:
+                estado[nome] = (m.chamadas, m.total_ns, list(m.baldes))
+    return estado
+
+
+def incorporar(estado):
+    """Soma às métricas deste processo um estado de exportar_metricas()"""
+    for nome, (chamadas, total_ns, baldes) in estado.items():
+        m = _metrica(nome)
+        with m._trava:
+            m.chamadas += chamadas
+            m.total_ns += total_ns
+            m.baldes = [a + b for a, b in zip(m.baldes, baldes)]
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                      INSTRUMENTAÇÃO DOS MÓDULOS                           ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _cronometrar(funcao, metrica):
+    relogio = time.perf_counter_ns
+
+    @functools.wraps(funcao)
+    def cronometrada(*args, **kwargs):
+        t0 = relogio()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            metrica.registrar(relogio() - t0)
+
+    cronometrada._perfil_metrica = metrica
+    return cronometrada
+
+
+def instrumentar_modulo(modulo):
+    """
+    Troca os kernels de um módulo (e de suas classes) por versões cronometradas
+
+    Args:
+        modulo: Objeto módulo; o nome vem do arquivo, para que scripts
+                executados como __main__ também sejam reconhecidos
+    """
+    nome_modulo = os.path.splitext(os.path.basename(modulo.__file__))[0]
+    for nome in KERNELS.get(nome_modulo, ()):
+        objeto = modulo
+        *classes, atributo = nome.split('.')
+        for classe in classes:
+            objeto = getattr(objeto, classe)
+
+        original = objeto.__dict__[atributo]
+        if hasattr(original, '_perfil_metrica'):
+            continue
+        metrica = _metrica(f"{nome_modulo}.{nome}")
+        setattr(objeto, atributo, _cronometrar(original, metrica))
+        _TROCADOS.append((objeto, atributo, original))
+
+
+def ativar():
+    """Instrumenta todos os módulos de KERNELS (importando-os se preciso)"""
+    for nome_modulo in KERNELS:
+        instrumentar_modulo(importlib.import_module(nome_modulo))
+    # Scripts em execução como __main__ também têm seus kernels trocados
+    principal = sys.modules.get('__main__')
+    if getattr(principal, '__file__', None):
+        instrumentar_modulo(principal)
+
+
+def desativar():
+    """Devolve os kernels originais; as métricas são preservadas"""
+    while _TROCADOS:
+        objeto, atributo, original = _TROCADOS.pop()
+        setattr(objeto, atributo, original)
+
+
+def ativo():
+    """True se algum kernel está instrumentado"""
+    return bool(_TROCADOS)
+
+
+@contextmanager
+def perfilar(reiniciar_metricas=True):
+    """
+    Instrumenta os kernels só dentro de um bloco with
+
+    Yields:
+        O próprio módulo perfil, para tabela() e prometheus()
+    """
+    if reiniciar_metricas:
+        reiniciar()
+    ja_ativo = ativo()
+    ativar()
+    try:
+        yield sys.modules[__name__]
+    finally:
+        if not ja_ativo:
+            desativar()
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                              RELATÓRIOS                                   ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def tabela():
+    """Tabela em texto: chamadas, tempo total, média e quantis por kernel"""
+    linhas = ["{:<55} | {:>10} | {:>11} | {:>10} | {:>10} | {:>10}".format(
+        "Kernel", "Chamadas", "Total (ms)", "Média (μs)", "p50 ≤ (μs)", "p99 ≤ (μs)")]
+    linhas.append("-" * len(linhas[0]))
+    for m in metricas():
+        linhas.append("{:<55} | {:>10d} | {:>11.3f} | {:>10.3f} | {:>10.3g} | {:>10.3g}".format(
+            m.nome, m.chamadas, m.total_ns / 1e6, m.total_ns / m.chamadas / 1e3,
+            m.quantil(0.5) * 1e6, m.quantil(0.99) * 1e6))
+    return "\n".join(linhas) + "\n"
+
+
+def prometheus():
+    """Métricas no formato de texto de exposição do Prometheus"""
+    linhas = [
+        "# HELP kernel_chamadas_total Chamadas por kernel",
+        "# TYPE kernel_chamadas_total counter",
+    ]
+    todas = metricas()
+    for m in todas:
+        linhas.append(f'kernel_chamadas_total{{kernel="{m.nome}"}} {m.chamadas}')
+
+    linhas += [
+        "# HELP kernel_duracao_segundos Latência por chamada de kernel",
+        "# TYPE kernel_duracao_segundos histogram",
+    ]
+    for m in todas:
+        acumulado = 0
+        for limite, n in zip(LIMITES_S, m.baldes):
+            acumulado += n
+            linhas.append(f'kernel_duracao_segundos_bucket{{kernel="{m.nome}",le="{limite:g}"}} {acumulado}')
+        linhas.append(f'kernel_duracao_segundos_bucket{{kernel="{m.nome}",le="+Inf"}} {m.chamadas}')
+        linhas.append(f'kernel_duracao_segundos_sum{{kernel="{m.nome}"}} {m.total_ns / 1e9:.9g}')
+        linhas.append(f'kernel_duracao_segundos_count{{kernel="{m.nome}"}} {m.chamadas}')
+    return "\n".join(linhas) + "\n"
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    ATIVAÇÃO POR VARIÁVEL DE AMBIENTE                      ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+_relatorio_registrado = False
+
+
+def formato_ambiente():
+    """
+    Interpreta PERFIL_KERNELS
+
+    Returns:
+        'tabela', 'prometheus' ou None (instrumentação desligada); valores
+        desconhecidos emitem um aviso e desligam
+    """
+    valor = os.environ.get(VARIAVEL_AMBIENTE, '').strip().lower()
+    if valor in VALORES_AMBIENTE:
+        return VALORES_AMBIENTE[valor]
+    warnings.warn(f"{VARIAVEL_AMBIENTE}={valor!r} não reconhecido "
+                  f"(use tabela, 1, prometheus ou 0); perfil desligado", stacklevel=3)
+    return None
+
+
+def _relatorio_final():
+    texto = prometheus() if formato_ambiente() == 'prometheus' else tabela()
+    caminho = os.environ.get(VARIAVEL_ARQUIVO)
+    if caminho:
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+    else:
+        sys.stderr.write(texto)
+
+
+def ao_importar(nome_modulo):
+    """
+    Gancho chamado pelos módulos de kernels quando PERFIL_KERNELS está
+    definida: se o valor liga o perfil (formato_ambiente), instrumenta o
+    módulo e, no processo principal, agenda o relatório de saída
+    """
+    global _relatorio_registrado
+    if formato_ambiente() is None:
+        return
+    instrumentar_modulo(sys.modules[nome_modulo])
+    # Processos filhos (spawn reimporta os módulos) não imprimem relatório:
+    # suas métricas voltam ao principal por exportar_metricas()
+    if multiprocessing.parent_process() is not None:
+        return
+    if not _relatorio_registrado:
+        atexit.register(_relatorio_final)
+        _relatorio_registrado = True
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PROPAGADOR SPLIT-OPERATOR: PACOTES DE ONDA DEPENDENTES DO TEMPO
+===============================================================
+
+teste_heisenberg verifica Δx·Δp ≥ ħ/2 em dois pontos estáticos. Aqui a
+equação de Schrödinger dependente do tempo
+
+    iħ ∂ψ/∂t = [-ħ²/(2m) ∂²/∂x² + V(x)] ψ
+
+é integrada pelo método split-operator de Strang,
+
+    ψ(t + dt) = e^{-iV dt/2ħ} · F⁻¹ e^{-iħk² dt/2m} F · e^{-iV dt/2ħ} ψ(t),
+
+e, a cada passo, Δx e Δp do pacote são comparados com o mínimo
+Δp ≥ incerteza_heisenberg(Δx) = ħ/(2Δx).
+
+Desempenho:
+- as fases e^{-iV dt/2ħ} e e^{-iħk² dt/2m} são calculadas uma vez;
+- as FFTs são feitas no próprio buffer (numpy.fft com out=, NumPy ≥ 2.0;
+  o pocketfft guarda o plano de cada tamanho de grade);
+- entre passos sem medida, as duas meias fases do potencial viram uma só;
+- lote: vários pacotes (larguras e massas diferentes) evoluem como um
+  único array (B, N), com uma FFT por eixo para todos.
+
+Uso:
+    resultado = propagar_gaussianos(x, sigma=[0.5e-9, 1e-9], m=9.10938e-31,
+                                    dt=1e-16, passos=1000)
+    python propagador_split.py --passos 1000
+"""
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import incerteza_heisenberg
+from renderizacao import Resultado
+
+M_ELETRON = 9.10938e-31  # kg
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                          PROPAGADOR                                       ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class PropagadorSplit:
+    """
+    Evolução split-operator de um lote de B funções de onda numa grade comum
+
+    O estado fica em self.psi, de forma (B, N), e é atualizado no lugar.
+    """
+
+    def __init__(self, x, m, dt, V=None):
+        """
+        Args:
+            x: Grade uniforme (m), forma (N,); o domínio é periódico
+            m: Massa(s) (kg), escalar ou (B,)
+            dt: Passo de tempo (s)
+            V: Potencial (J): None (partícula livre), função V(x), array
+               (N,) ou (B, N)
+        """
+        K = constantes.atual()
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.dx = self.x[1] - self.x[0]
+        self.dt = dt
+        self.t = 0.0
+        N = self.x.size
+        m = np.asarray(m, dtype=np.float64).reshape(-1, 1)
+
+        # Momentos da grade na ordem da FFT
+        self.p = K.hbar * 2 * np.pi * np.fft.fftfreq(N, self.dx)
+        self._x2 = self.x * self.x
+        self._p2 = self.p * self.p
+
+        # Fases pré-calculadas
+        self.fase_T = np.exp(-1j * self._p2 * dt / (2 * K.hbar * m))
+        if V is None:
+            self.fase_V_meio = self.fase_V = None
+        else:
+            V = np.asarray(V(self.x) if callable(V) else V, dtype=np.float64)
+            self.fase_V_meio = np.exp(-1j * V * dt / (2 * K.hbar))
+            self.fase_V = self.fase_V_meio * self.fase_V_meio
+
+        self.psi = None
+        self._densidade = None
+        self._quadrado = None
+        self._espectro = None
+
+    def iniciar(self, psi):
+        """Define o estado inicial (copiado para o buffer de trabalho)"""
+        psi = np.atleast_2d(np.asarray(psi, dtype=np.complex128))
+        B = np.broadcast_shapes(psi.shape[:1], self.fase_T.shape[:1])[0]
+        self.psi = np.array(np.broadcast_to(psi, (B, self.x.size)))
+        # Buffers de medida, reaproveitados em todos os passos
+        self._densidade = np.empty(self.psi.shape)
+        self._quadrado = np.empty(self.psi.shape)
+        self._espectro = np.empty_like(self.psi)
+        self.t = 0.0
+
+    def _densidade_de(self, amplitude):
+        """|amplitude|² no buffer de densidade, sem temporários"""
+        np.multiply(amplitude.real, amplitude.real, out=self._densidade)
+        np.multiply(amplitude.imag, amplitude.imag, out=self._quadrado)
+        self._densidade += self._quadrado
+        return self._densidade
+
+    def incertezas(self):
+        """
+        Δx e Δp de cada pacote no estado atual
+
+        Returns:
+            Tuple (Δx, Δp) - arrays de forma (B,)
+        """
+        rho = self._densidade_de(self.psi)
+        norma = rho.sum(axis=1)
+        media_x = rho @ self.x / norma
+        var_x = rho @ self._x2 / norma - media_x * media_x
+
+        np.fft.fft(self.psi, axis=1, out=self._espectro)
+        rho = self._densidade_de(self._espectro)
+        norma = rho.sum(axis=1)
+        media_p = rho @ self.p / norma
+        var_p = rho @ self._p2 / norma - media_p * media_p
+
+        return np.sqrt(np.maximum(var_x, 0)), np.sqrt(np.maximum(var_p, 0))
+
+    def _cinetico(self):
+        psi = self.psi
+        np.fft.fft(psi, axis=1, out=psi)
+        psi *= self.fase_T
+        np.fft.ifft(psi, axis=1, out=psi)
+
+    def evoluir(self, passos, medir_a_cada=1):
+        """
+        Avança `passos` passos de dt, medindo Δx e Δp periodicamente
+
+        Args:
+            passos: Número de passos
+            medir_a_cada: Intervalo de passos entre medidas (1: todo passo)
+
+        Yields:
+            Tuple (t, Δx, Δp) após cada passo medido
+        """
+        com_potencial = self.fase_V is not None
+        if com_potencial:
+            self.psi *= self.fase_V_meio
+        for i in range(1, passos + 1):
+            self._cinetico()
+            self.t += self.dt
+            medir = i % medir_a_cada == 0 or i == passos
+            if com_potencial:
+                # Antes de medir, só meia fase completa o passo; a outra
+                # metade abre o passo seguinte depois da medida
+                self.psi *= self.fase_V_meio if medir else self.fase_V
+            if medir:
+                delta_x, delta_p = self.incertezas()
+                yield self.t, delta_x, delta_p
+                if com_potencial and i < passos:
+                    self.psi *= self.fase_V_meio
+
+
+def pacote_gaussiano(x, sigma, x0=0.0, p0=0.0):
+    """
+    Pacotes gaussianos de incerteza mínima
+
+    ψ(x) = (2πσ²)^(-1/4) exp(-(x - x0)²/(4σ²) + i p0 x/ħ),
+    com Δx = σ e Δp = ħ/(2σ)
+
+    Args:
+        x: Grade (m), forma (N,)
+        sigma, x0, p0: Largura (m), centro (m) e momento (kg·m/s); escalares
+                       ou (B,)
+
+    Returns:
+        Array complexo (B, N)
+    """
+    hbar = constantes.atual().hbar
+    sigma, x0, p0 = (np.asarray(v, dtype=np.float64).reshape(-1, 1) for v in (sigma, x0, p0))
+    deslocamento = x - x0
+    return ((2 * np.pi * sigma**2) ** -0.25
+            * np.exp(-deslocamento**2 / (4 * sigma**2) + 1j * p0 * x / hbar))
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    HEISENBERG AO LONGO DO TEMPO                           ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class ResultadoPropagacao(Resultado):
+    """Δx, Δp e a razão Δp / Δp_mín(Δx) ao longo da evolução, por pacote"""
+    titulo = "HEISENBERG DINÂMICO: PACOTES GAUSSIANOS (SPLIT-OPERATOR)"
+
+    sigma: np.ndarray
+    m: np.ndarray
+    t: np.ndarray          # (T,)
+    delta_x: np.ndarray    # (T, B)
+    delta_p: np.ndarray    # (T, B)
+    razao: np.ndarray      # (T, B): Δp / incerteza_heisenberg(Δx) ≥ 1
+    razao_minima: np.ndarray
+    erro_livre: object     # máx |Δx/Δx_analítico - 1| (partícula livre) ou None
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"Passos medidos: {self.t.size}, t final = {self.t[-1]:.3e} s\n"
+        yield "{:>12} | {:>12} | {:>14} | {:>14} | {:>10}".format(
+            "σ₀ (m)", "m (kg)", "Δx final (m)", "Δx·Δp / (ħ/2)", "Razão mín.")
+        yield "-" * 72
+        for j in range(self.sigma.size):
+            yield "{:>12.3e} | {:>12.4e} | {:>14.6e} | {:>14.6f} | {:>10.6f}".format(
+                self.sigma[j], self.m[j], self.delta_x[-1, j], self.razao[-1, j], self.razao_minima[j])
+        yield "-" * 72
+        respeitado = bool(np.all(self.razao_minima >= 1 - 1e-9))
+        yield f"Δx·Δp ≥ ħ/2 em todos os passos: {'✓' if respeitado else '✗'}"
+        if self.erro_livre is not None:
+            yield f"Δx(t) vs. σ₀√(1 + (ħt/2mσ₀²)²): erro relativo máximo {self.erro_livre:.2e}"
+
+
+def propagar_gaussianos(x, sigma, m, dt, passos, V=None, medir_a_cada=1, x0=0.0, p0=0.0):
+    """
+    Evolui um lote de pacotes gaussianos e registra Δx·Δp
+
+    Args:
+        x: Grade uniforme (m)
+        sigma, m: Larguras iniciais (m) e massas (kg), escalares ou (B,)
+        dt, passos: Passo de tempo (s) e número de passos
+        V: Potencial, como em PropagadorSplit (None: partícula livre)
+        medir_a_cada: Intervalo de passos entre medidas
+        x0, p0: Centro e momento iniciais
+
+    Returns:
+        ResultadoPropagacao
+    """
+    sigma, m = (np.atleast_1d(a) for a in np.broadcast_arrays(
+        np.asarray(sigma, dtype=np.float64), np.asarray(m, dtype=np.float64)))
+
+    propagador = PropagadorSplit(x, m, dt, V)
+    propagador.iniciar(pacote_gaussiano(x, sigma, x0, p0))
+
+    tempos, delta_x, delta_p = [], [], []
+    for t, dx, dp in propagador.evoluir(passos, medir_a_cada):
+        tempos.append(t)
+        delta_x.append(dx)
+        delta_p.append(dp)
+    tempos, delta_x, delta_p = np.array(tempos), np.array(delta_x), np.array(delta_p)
+
+    razao = delta_p / incerteza_heisenberg(delta_x)
+
+    erro_livre = None
+    if V is None:
+        hbar = constantes.atual().hbar
+        analitico = sigma * np.sqrt(1 + (hbar * tempos[:, None] / (2 * m * sigma**2))**2)
+        erro_livre = float(np.abs(delta_x / analitico - 1).max())
+
+    return ResultadoPropagacao(sigma, m, tempos, delta_x, delta_p, razao,
+                               razao.min(axis=0), erro_livre)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Elétrons livres com σ₀ = 0.5, 1 e 2 nm numa caixa periódica de 200 nm"""
+    parser = argparse.ArgumentParser(description="Propagador split-operator de pacotes gaussianos")
+    parser.add_argument('--pontos', type=int, default=4096)
+    parser.add_argument('--largura', type=float, default=200e-9)
+    parser.add_argument('--sigma', type=float, nargs='+', default=[0.5e-9, 1e-9, 2e-9])
+    parser.add_argument('--m', type=float, nargs='+', default=[M_ELETRON])
+    parser.add_argument('--dt', type=float, default=1e-16)
+    parser.add_argument('--passos', type=int, default=1000)
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    x = np.linspace(-args.largura / 2, args.largura / 2, args.pontos, endpoint=False)
+    resultado = propagar_gaussianos(x, args.sigma, args.m, args.dt, args.passos)
+    renderizacao.renderizar([resultado], args.formato)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RENDERIZAÇÃO DE RESULTADOS: CONSOLE, JSON E MARKDOWN
+====================================================
+
+As seções de CalculosVerdadeirosPython.py e GUP_3D_Corrigido.py só
+calculam: cada uma devolve um registro de resultado (dataclass derivada
+de Resultado) e não imprime nada. Este módulo transforma os registros
+em texto:
+
+- console: o relatório tradicional, gerado por Resultado.linhas_console()
+- json: uma lista com os campos de cada seção
+- markdown: um título por seção, campos escalares em tabela e listas de
+  registros como tabelas próprias
+
+A saída é acumulada em memória e escrita no destino em blocos de
+TAMANHO_BUFFER caracteres. Com o formato 'nenhum' nada é formatado: os
+registros ficam disponíveis para uso programático.
+
+Uso:
+    resultados = [teste_heisenberg(), teste_hawking()]
+    renderizacao.renderizar(resultados, 'markdown', arquivo)
+"""
+
+import sys
+import json
+import dataclasses
+
+import numpy as np
+
+FORMATOS = ('console', 'json', 'markdown', 'nenhum')
+
+# Caracteres acumulados antes de cada escrita no destino
+TAMANHO_BUFFER = 1 << 16
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        REGISTROS DE RESULTADO                             ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class Resultado:
+    """
+    Base dos registros de resultado
+
+    Subclasses são dataclasses com os valores calculados na seção e um
+    atributo de classe `titulo`. linhas_console() só é chamado pelo
+    renderizador de console.
+    """
+
+    titulo = ''
+
+    def linhas_console(self):
+        """Relatório em texto, uma linha por item (padrão: campo = valor)"""
+        yield "\n" + "=" * 80
+        yield self.titulo
+        yield "=" * 80
+        for nome, valor in campos(self):
+            yield f"{nome} = {_formatar(valor)}"
+
+
+def campos(resultado):
+    """Lista de (nome, valor) dos campos de um registro"""
+    return [(f.name, getattr(resultado, f.name)) for f in dataclasses.fields(resultado)]
+
+
+def para_json(valor):
+    """
+    Converte registros e tipos do NumPy em tipos serializáveis em JSON
+
+    Args:
+        valor: Registro, array, escalar numpy, sequência ou dicionário
+
+    Returns:
+        Estrutura equivalente só com dict, list, str, int, float, bool e None
+    """
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return {nome: para_json(v) for nome, v in campos(valor)}
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, dict):
+        return {str(k): para_json(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [para_json(v) for v in valor]
+    return valor
+
+
+def _formatar(valor):
+    """Texto de um valor escalar para tabelas"""
+    if isinstance(valor, (bool, np.bool_, int, np.integer, str)):
+        return str(valor)
+    if isinstance(valor, (float, np.floating)):
+        return f"{valor:.6e}"
+    if isinstance(valor, np.ndarray):
+        return np.array2string(valor, precision=6, separator=', ')
+    if isinstance(valor, (list, tuple)):
+        return ", ".join(_formatar(v) for v in valor)
+    return str(valor)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                           RENDERIZADORES                                  ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class Renderizador:
+    """
+    Base dos renderizadores: acumula o texto e escreve em blocos
+
+    Use como gerenciador de contexto (ou chame finalizar()) para garantir
+    que o último bloco seja escrito.
+    """
+
+    def __init__(self, destino=None, tamanho_buffer=TAMANHO_BUFFER):
+        """
+        Args:
+            destino: Arquivo de texto de saída (padrão: sys.stdout)
+            tamanho_buffer: Caracteres acumulados antes de cada escrita
+        """
+        self.destino = sys.stdout if destino is None else destino
+        self.tamanho_buffer = tamanho_buffer
+        self._partes = []
+        self._tamanho = 0
+
+    def _escrever(self, texto):
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        if self._tamanho >= self.tamanho_buffer:
+            self.descarregar()
+
+    def descarregar(self):
+        """Escreve o texto acumulado no destino"""
+        if self._partes:
+            self.destino.write(''.join(self._partes))
+            self._partes.clear()
+            self._tamanho = 0
+
+    def adicionar(self, resultado):
+        """Formata um registro de resultado"""
+        raise NotImplementedError
+
+    def finalizar(self):
+        """Escreve o que falta e esvazia o buffer do destino"""
+        self.descarregar()
+        self.destino.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.finalizar()
+
+
+class RenderizadorConsole(Renderizador):
+    """Relatório em texto, idêntico ao impresso antes pelas seções"""
+
+    def adicionar(self, resultado):
+        for linha in resultado.linhas_console():
+            self._escrever(linha)
+            self._escrever("\n")
+
+
+class RenderizadorJSON(Renderizador):
+    """Lista JSON com {'secao', 'titulo', 'dados'} por registro"""
+
+    def __init__(self, destino=None, tamanho_buffer=TAMANHO_BUFFER):
+        super().__init__(destino, tamanho_buffer)
+        self._secoes = []
+
+    def adicionar(self, resultado):
+        self._secoes.append({
+            'secao': type(resultado).__name__,
+            'titulo': resultado.titulo,
+            'dados': para_json(resultado),
+        })
+
+    def finalizar(self):
+        self._escrever(json.dumps(self._secoes, indent=2, ensure_ascii=False))
+        self._escrever("\n")
+        self._secoes = []
+        super().finalizar()
+
+
+class RenderizadorMarkdown(Renderizador):
+    """Uma seção Markdown por registro, com tabelas"""
+
+    def adicionar(self, resultado):
+        self._escrever(f"## {resultado.titulo}\n\n")
+
+        escalares, listas = [], []
+        for nome, valor in campos(resultado):
+            if isinstance(valor, (list, tuple)) and valor:
+                listas.append((nome, valor))
+            else:
+                escalares.append((nome, valor))
+
+        if escalares:
+            linhas = ["| Campo | Valor |", "|---|---|"]
+            linhas += [f"| {nome} | {_formatar(valor)} |".replace("\n", " ")
+                       for nome, valor in escalares]
+            self._escrever("\n".join(linhas) + "\n\n")
+
+        for nome, valores in listas:
+            self._lista(nome, valores)
+
+    def _lista(self, nome, valores):
+        """Lista de registros vira tabela; as demais, lista com marcadores"""
+        self._escrever(f"**{nome}**\n\n")
+        if dataclasses.is_dataclass(valores[0]):
+            colunas = [f.name for f in dataclasses.fields(valores[0])]
+            linhas = ["| " + " | ".join(colunas) + " |",
+                      "|" + "---|" * len(colunas)]
+            for item in valores:
+                linhas.append("| " + " | ".join(_formatar(v) for _, v in campos(item)) + " |")
+        else:
+            linhas = [f"- {_formatar(v)}" for v in valores]
+        self._escrever("\n".join(linhas) + "\n\n")
+
+
+RENDERIZADORES = {
+    'console': RenderizadorConsole,
+    'json': RenderizadorJSON,
+    'markdown': RenderizadorMarkdown,
+}
+
+
+def renderizar(resultados, formato='console', destino=None):
+    """
+    Formata uma sequência de registros de resultado
+
+    Args:
+        resultados: Registros (subclasses de Resultado)
+        formato: 'console', 'json', 'markdown' ou 'nenhum'
+        destino: Arquivo de texto de saída (padrão: sys.stdout)
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato desconhecido: {formato!r} (use {', '.join(FORMATOS)})")
+    if formato == 'nenhum':
+        return
+
+    with RENDERIZADORES[formato](destino) as renderizador:
+        for resultado in resultados:
+            renderizador.adicionar(resultado)
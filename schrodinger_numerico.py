@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EQUAÇÃO DE SCHRÖDINGER 1D NUMÉRICA: POTENCIAL V(x) ARBITRÁRIO
+=============================================================
+
+Além das formas fechadas (autoenergias_poco_infinito e
+energia_oscilador_harmonico), resolve
+
+    -ħ²/(2m) ψ''(x) + V(x) ψ(x) = E ψ(x),   ψ(x_min) = ψ(x_max) = 0
+
+por diferenças finitas de segunda ordem numa grade uniforme de N pontos
+internos. O hamiltoniano é tridiagonal e simétrico; apenas os k menores
+autopares são calculados, com memória O(N): ~250 MB para 10⁶ pontos e
+k = 5 autovetores.
+
+Precisão: os níveis baixos são ~N² vezes menores que a norma da matriz.
+Formada explicitamente, tridiag(-1, 2 + V/ε_h, -1) perde esses níveis no
+cancelamento de 2 - 1 - 1 e o erro de arredondamento cresce como ε·N².
+Por isso autoestados() não forma a matriz: fatora H - V_min = ε_h·RᵀR
+(LDLᵀ com R bidiagonal) a partir das margens de dominância diagonal,
+somando apenas termos positivos, e obtém os menores valores singulares de
+R por bisseção na matriz de Golub-Kahan (diagonal nula), que os determina
+com precisão relativa. O erro de arredondamento passa a ~ε·N, e o erro
+de discretização, que cai como h², domina até N ≈ 10⁵-10⁶.
+
+As verificações embutidas contra o poço infinito e o oscilador harmônico
+falham (RuntimeError) quando a ordem observada cai abaixo de ORDEM_MINIMA
+com o erro ainda acima do limite de arredondamento.
+
+Requer SciPy (importado só na primeira chamada).
+
+Uso:
+    E, x, psi = autoestados(lambda x: 0.5 * m * w**2 * x**2, -X, X, 10**6, m, k=5)
+    python schrodinger_numerico.py --tamanhos 1e3 1e4 1e5 1e6
+"""
+
+import sys
+import math
+import argparse
+from itertools import accumulate
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+from calculos_vetorizados import autoenergias_poco_infinito, energia_oscilador_harmonico
+from renderizacao import Resultado
+
+# Tolerância absoluta da bisseção (valores singulares de R, em unidades de
+# √(ħ²/(2mh²))); o padrão do LAPACK (ε·‖T‖) perde os níveis baixos em
+# grades grandes, e com 1e-300 só a tolerância relativa (~2ε) vale
+TOLERANCIA = 1e-300
+
+# Convergência: a ordem observada do nível fundamental deve ser ~2; abaixo
+# de ORDEM_MINIMA, a verificação falha se o erro relativo ainda estiver
+# acima de ARREDONDAMENTO_POR_PONTO·N (limite de arredondamento da
+# bisseção na forma fatorada, medido em ~ε·N/20 no poço infinito)
+ORDEM_MINIMA = 1.5
+ARREDONDAMENTO_POR_PONTO = 2 * np.finfo(np.float64).eps
+
+M_ELETRON = 9.10938e-31  # kg
+
+
+def _eigh_tridiagonal():
+    """scipy.linalg.eigh_tridiagonal, importado sob demanda"""
+    try:
+        from scipy.linalg import eigh_tridiagonal
+    except ImportError as erro:
+        raise ImportError("schrodinger_numerico requer SciPy (pip install scipy)") from erro
+    return eigh_tridiagonal
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                    HAMILTONIANO TRIDIAGONAL                               ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _potencial_na_grade(V, x_min, x_max, N, m):
+    """Grade interna, V/ε_h nos pontos e a escala ε_h = ħ²/(2mh²)"""
+    N = int(N)
+    h = (x_max - x_min) / (N + 1)
+    escala = constantes.atual().hbar2 / (2 * m * h * h)
+
+    x = np.linspace(x_min + h, x_max - h, N)
+    v = np.asarray(V(x) if callable(V) else V, dtype=np.float64)
+    if v.shape != (N,):
+        raise ValueError(f"V deve ter {N} valores, recebeu forma {v.shape}")
+    return x, v / escala, escala
+
+
+def hamiltoniano_tridiagonal(V, x_min, x_max, N, m):
+    """
+    Discretiza H = -ħ²/(2m) d²/dx² + V(x) com paredes rígidas
+
+    A matriz é adimensionalizada pela escala ε_h = ħ²/(2mh²), para que
+    seus elementos sejam O(1): H = ε_h · tridiag(-1, 2 + V/ε_h, -1).
+    Forma explícita, para inspeção; autoestados() usa fator_bidiagonal(),
+    que preserva os níveis baixos.
+
+    Args:
+        V: Função V(x) vetorizada (J) ou array com os N valores
+        x_min, x_max: Paredes (m); a grade tem N pontos internos
+        N: Número de pontos internos
+        m: Massa da partícula (kg)
+
+    Returns:
+        Tuple (x, diagonal, subdiagonal, escala) - H = escala · T(diagonal,
+        subdiagonal)
+    """
+    x, diagonal, escala = _potencial_na_grade(V, x_min, x_max, N, m)
+    diagonal += 2.0
+    subdiagonal = np.full(x.size - 1, -1.0)
+    return x, diagonal, subdiagonal, escala
+
+
+def fator_bidiagonal(V, x_min, x_max, N, m):
+    """
+    Fatora o hamiltoniano como H = ε_h · (RᵀR + deslocamento·I), com R
+    bidiagonal superior, sem formar a diagonal 2 + V/ε_h
+
+    Com w = V/ε_h - min(V/ε_h) ≥ 0, os pivôs d_i da LDLᵀ de
+    tridiag(-1, 2 + w, -1) são calculados pelas margens u_i = d_i - 1:
+
+        u_1 = 1 + w_1,   u_{i+1} = u_i / (1 + u_i) + w_{i+1}
+
+    só com termos positivos, logo com precisão relativa; R = D^½ Lᵀ tem
+    diagonal √d_i e superdiagonal -1/√d_i.
+
+    Args:
+        V, x_min, x_max, N, m: Como em hamiltoniano_tridiagonal()
+
+    Returns:
+        Tuple (x, diagonal, superdiagonal, deslocamento, escala)
+    """
+    x, v, escala = _potencial_na_grade(V, x_min, x_max, N, m)
+    deslocamento = float(v.min())
+    w = v - deslocamento
+
+    margens = np.fromiter(accumulate(w[1:], lambda u, w_i: u / (1.0 + u) + w_i,
+                                     initial=1.0 + w[0]),
+                          dtype=np.float64, count=w.size)
+    diagonal = np.sqrt(1.0 + margens)
+    superdiagonal = -1.0 / diagonal[:-1]
+    return x, diagonal, superdiagonal, deslocamento, escala
+
+
+def autoestados(V, x_min, x_max, N, m, k=5, autovetores=True, tol=TOLERANCIA):
+    """
+    Os k menores autopares de -ħ²/(2m) ψ'' + V ψ = E ψ
+
+    Args:
+        V, x_min, x_max, N, m: Como em hamiltoniano_tridiagonal()
+        k: Número de níveis (a partir do fundamental)
+        autovetores: Calcula também as funções de onda (N × k floats)
+        tol: Tolerância absoluta da bisseção, em unidades de √(ħ²/(2mh²))
+
+    Returns:
+        Tuple (E, x, psi) - E (J) de forma (k,), crescente; psi de forma
+        (N, k), normalizada com ∫|ψ|² dx = 1 (None sem autovetores)
+    """
+    eigh_tridiagonal = _eigh_tridiagonal()
+    x, diagonal, superdiagonal, deslocamento, escala = fator_bidiagonal(V, x_min, x_max, N, m)
+    N = x.size
+
+    # Matriz de Golub-Kahan de R (ordem 2N, diagonal nula), com
+    # subdiagonal (r_11, r_12, r_22, r_23, ...): autovalores ±σ_i(R), e os
+    # k menores σ ≥ 0 têm índices N, ..., N+k-1. Autovalores de H/ε_h: σ²
+    acoplamentos = np.empty(2 * N - 1)
+    acoplamentos[0::2] = diagonal
+    acoplamentos[1::2] = superdiagonal
+    resultado = eigh_tridiagonal(np.zeros(2 * N), acoplamentos, eigvals_only=not autovetores,
+                                 select='i', select_range=(N, N + k - 1), tol=tol)
+    if not autovetores:
+        return (resultado**2 + deslocamento) * escala, x, None
+
+    # Autovetor de Golub-Kahan: (v_1, u_1, v_2, u_2, ...)/√2, com v o vetor
+    # singular direito de R, isto é, o autovetor de H
+    valores, vetores = resultado
+    vetores = vetores[0::2]
+    h = x[1] - x[0] if N > 1 else x_max - x_min
+    vetores /= np.linalg.norm(vetores, axis=0) * math.sqrt(h)
+    return (valores**2 + deslocamento) * escala, x, vetores
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                  VERIFICAÇÕES DE CONVERGÊNCIA                             ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class LinhaConvergencia:
+    """Nível n numa grade de N pontos"""
+    N: int
+    n: int
+    E_numerico: float
+    E_analitico: float
+    erro_relativo: float
+
+
+@dataclass
+class ResultadoConvergencia(Resultado):
+    """Autovalores numéricos contra a forma fechada em grades crescentes"""
+    titulo = "CONVERGÊNCIA DO SOLVER DE SCHRÖDINGER"
+
+    potencial: str
+    parametros: str
+    linhas: list
+    ordem_observada: list   # log(erro_i/erro_i+1) / log(N_i+1/N_i), nível fundamental
+    falhas: list            # colapsos da ordem acima do limite de arredondamento
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield f"{self.titulo}: {self.potencial}"
+        yield "="*80
+        yield f"{self.parametros}\n"
+        yield "{:>10} | {:>3} | {:>20} | {:>20} | {:>10}".format(
+            "N", "n", "E numérico (J)", "E analítico (J)", "Erro rel.")
+        yield "-" * 75
+        for linha in self.linhas:
+            yield "{:>10} | {:>3} | {:>20.12e} | {:>20.12e} | {:>10.2e}".format(
+                linha.N, linha.n, linha.E_numerico, linha.E_analitico, linha.erro_relativo)
+        yield "-" * 75
+        ordens = ", ".join(f"{p:.2f}" for p in self.ordem_observada)
+        yield f"Ordem observada (nível fundamental): {ordens}  (esperado: 2 até o limite de arredondamento)"
+        for falha in self.falhas:
+            yield f"❌ {falha}"
+        if not self.falhas:
+            yield "✅ Convergência de segunda ordem até o limite de arredondamento (~ε·N)"
+
+
+def limite_arredondamento(N):
+    """Erro relativo de arredondamento admitido para os níveis baixos numa grade de N pontos"""
+    return ARREDONDAMENTO_POR_PONTO * N
+
+
+def _convergencia(potencial, parametros, resolver, analitico, tamanhos, exigir):
+    """Resolve em cada grade e compara os níveis com a forma fechada"""
+    linhas, erros = [], []
+    for N in tamanhos:
+        E, _, _ = resolver(int(N))
+        for n, (numerico, exato) in enumerate(zip(E, analitico)):
+            erro = abs(numerico / exato - 1)
+            linhas.append(LinhaConvergencia(int(N), n, numerico, exato, erro))
+        erros.append(abs(E[0] / analitico[0] - 1))
+
+    ordens = [math.log(erros[i] / erros[i + 1]) / math.log(tamanhos[i + 1] / tamanhos[i])
+              if erros[i] > 0 and erros[i + 1] > 0 else float('nan')
+              for i in range(len(erros) - 1)]
+
+    # A ordem só pode cair quando o erro já chegou ao arredondamento
+    falhas = [f"{potencial}: ordem {ordem:.2f} entre N = {int(tamanhos[i])} e "
+              f"N = {int(tamanhos[i + 1])}, com erro {erros[i + 1]:.2e} acima do "
+              f"limite de arredondamento {limite_arredondamento(tamanhos[i + 1]):.2e}"
+              for i, ordem in enumerate(ordens)
+              if not ordem >= ORDEM_MINIMA and erros[i + 1] > limite_arredondamento(tamanhos[i + 1])]
+
+    resultado = ResultadoConvergencia(potencial, parametros, linhas, ordens, falhas)
+    if exigir and falhas:
+        raise RuntimeError("; ".join(falhas))
+    return resultado
+
+
+def verificar_poco_infinito(tamanhos=(1e3, 1e4, 1e5), k=5, L=1e-9, m=M_ELETRON, exigir=True):
+    """
+    Poço infinito (V = 0 entre paredes em 0 e L) contra E_n = n²π²ħ²/(2mL²)
+
+    Args:
+        exigir: Levanta RuntimeError se a ordem observada colapsar
+
+    Returns:
+        ResultadoConvergencia
+    """
+    analitico = autoenergias_poco_infinito(np.arange(1, k + 1), L, m)
+    return _convergencia(
+        "POÇO INFINITO", f"L = {L:.3e} m, m = {m:.5e} kg, k = {k}",
+        lambda N: autoestados(np.zeros(N), 0.0, L, N, m, k, autovetores=False),
+        analitico, tamanhos, exigir)
+
+
+def verificar_oscilador(tamanhos=(1e3, 1e4, 1e5), k=5, omega=1e15, m=M_ELETRON, exigir=True):
+    """
+    Oscilador V = ½mω²x² contra E_n = ħω(n + ½)
+
+    As paredes ficam a (√(2k+1) + 8) comprimentos de oscilador √(ħ/mω),
+    além do ponto de retorno do nível k, onde ψ já é desprezível.
+
+    Args:
+        exigir: Levanta RuntimeError se a ordem observada colapsar
+
+    Returns:
+        ResultadoConvergencia
+    """
+    comprimento = math.sqrt(constantes.atual().hbar / (m * omega))
+    X = (math.sqrt(2 * k + 1) + 8) * comprimento
+    analitico = energia_oscilador_harmonico(np.arange(k), omega)
+    return _convergencia(
+        "OSCILADOR HARMÔNICO", f"ω = {omega:.3e} rad/s, m = {m:.5e} kg, paredes em ±{X:.3e} m, k = {k}",
+        lambda N: autoestados(lambda x: 0.5 * m * omega**2 * x * x, -X, X, N, m, k, autovetores=False),
+        analitico, tamanhos, exigir)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Verificações de convergência contra as formas fechadas (código de saída 1 se a ordem colapsar)"""
+    parser = argparse.ArgumentParser(description="Solver de Schrödinger 1D por diferenças finitas")
+    parser.add_argument('--tamanhos', type=float, nargs='+', default=[1e3, 1e4, 1e5])
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    tamanhos = [int(N) for N in args.tamanhos]
+    resultados = [verificar_poco_infinito(tamanhos, args.k, exigir=False),
+                  verificar_oscilador(tamanhos, args.k, exigir=False)]
+    renderizacao.renderizar(resultados, args.formato)
+
+    falhas = [falha for resultado in resultados for falha in resultado.falhas]
+    if falhas:
+        sys.exit("❌ " + "; ".join(falhas))
+
+
+if __name__ == "__main__":
+    main()
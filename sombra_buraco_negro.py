@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SOMBRA E LENTE GRAVITACIONAL: RENDERIZAÇÃO EM BLOCOS
+====================================================
+
+Renderiza a imagem de um buraco negro de Schwarzschild (sombra + lente
+gravitacional do fundo) vista por uma câmera estática a uma distância
+r_cam, traçando uma geodésica nula por pixel com o integrador em lote de
+geodesicas_schwarzschild.py.
+
+- Cada raio tem parâmetro de impacto b = r_cam sin α / √(1 - r_s/r_cam),
+  onde α é o ângulo entre o pixel e a direção do buraco negro.
+- Raios com b < b_crit = (3√3/2) r_s que partem em direção ao centro são
+  capturados (sombra) sem precisar de integração.
+- Os demais são integrados até escapar; o ângulo total percorrido dá o
+  ponto do céu de fundo (um tabuleiro em longitude/latitude) que o pixel vê.
+
+A imagem é dividida em blocos renderizados por um pool de processos. Cada
+processo grava seu bloco diretamente em um .npy mapeado em memória, de
+modo que a imagem é escrita incrementalmente e o tempo escala com o número
+de núcleos. Os processos recebem o conjunto de constantes ativo (CODATA e
+alterações) do processo principal. salvar_png() converte o .npy em PNG linha a linha.
+
+Uso:
+    python sombra_buraco_negro.py saida.npy [--largura 3840 --altura 2160]
+"""
+
+import os
+import math
+import zlib
+import struct
+import argparse
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+import constantes
+import calculos_vetorizados
+from geodesicas_schwarzschild import condicoes_raio_nulo, integrar_geodesicas
+
+# Parâmetro de impacto crítico (esfera de fótons), em unidades de r_s
+B_CRITICO = 1.5 * math.sqrt(3)
+
+TAMANHO_BLOCO = 128
+
+# Brilho das casas do tabuleiro do céu de fundo
+BRILHO_CEU = (70, 210)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                          TRAÇADO DE RAIOS                                 ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _direcoes_pixels(cena, i0, i1, j0, j1):
+    """Ângulo α ao eixo óptico e azimute ψ de cada pixel do bloco"""
+    largura, altura = cena['largura'], cena['altura']
+    escala = math.tan(cena['campo_visao'] / 2) / (largura / 2)
+
+    x = (np.arange(j0, j1) + 0.5 - largura / 2) * escala
+    y = (altura / 2 - np.arange(i0, i1) - 0.5) * escala
+    x, y = np.meshgrid(x, y)
+
+    return np.arctan(np.hypot(x, y)), np.arctan2(y, x)
+
+
+def renderizar_bloco(cena, i0, i1, j0, j1):
+    """
+    Renderiza os pixels [i0:i1, j0:j1] da imagem
+
+    Args:
+        cena: dict com 'M', 'r_cam', 'campo_visao', 'largura', 'altura',
+              'tamanho_casa' e 'rtol'
+        i0, i1, j0, j1: Limites do bloco (linhas, colunas)
+
+    Returns:
+        Array uint8 (i1-i0, j1-j0) em tons de cinza
+    """
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, cena['M'])
+    r_cam = cena['r_cam']
+
+    alpha, psi = _direcoes_pixels(cena, i0, i1, j0, j1)
+    alpha, psi = alpha.ravel(), psi.ravel()
+
+    b = r_cam * np.sin(alpha) / math.sqrt(1 - r_s / r_cam)
+    entrando = alpha < math.pi / 2
+    capturado = entrando & (b < B_CRITICO * r_s)
+
+    # Só os raios não capturados são integrados (inclui b = 0, onde w seria infinito)
+    tracar = np.flatnonzero(~capturado)
+    u0, w0 = condicoes_raio_nulo(r_cam, b[tracar], cena['M'], entrando[tracar])
+    resultado = integrar_geodesicas(u0, w0, 0.0, phi_final=6 * math.pi, temporal=False,
+                                    rtol=cena['rtol'], passo_inicial=1e-2)
+
+    # Raios que não escaparam (voltas na esfera de fótons) contam como sombra
+    capturado[tracar] = ~resultado['escapou']
+
+    # Direção final no céu: n = cos Δφ ê_cam + sin Δφ ê_⊥(ψ)
+    delta_phi = resultado['phi']
+    psi_t = psi[tracar]
+    n_cam = np.cos(delta_phi)
+    n_perp = np.sin(delta_phi)
+    n_x = n_perp * np.cos(psi_t)
+    n_y = n_perp * np.sin(psi_t)
+
+    longitude = np.arctan2(n_x, -n_cam)
+    latitude = np.arcsin(np.clip(n_y, -1, 1))
+    casa = cena['tamanho_casa']
+    paridade = (np.floor(longitude / casa) + np.floor(latitude / casa)) % 2
+
+    imagem = np.zeros(alpha.size, dtype=np.uint8)
+    imagem[tracar] = np.where(paridade == 0, BRILHO_CEU[0], BRILHO_CEU[1])
+    imagem[capturado] = 0
+    return imagem.reshape(i1 - i0, j1 - j0)
+
+
+def _renderizar_no_arquivo(caminho, cena, bloco):
+    """Executado no pool: renderiza um bloco e grava no .npy mapeado"""
+    i0, i1, j0, j1 = bloco
+    imagem = np.load(caminho, mmap_mode='r+')
+    imagem[i0:i1, j0:j1] = renderizar_bloco(cena, i0, i1, j0, j1)
+    imagem.flush()
+    return bloco
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        RENDERIZAÇÃO PARALELA                              ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def renderizar_sombra(caminho, M=None, distancia=30.0, campo_visao=math.radians(40),
+                      largura=3840, altura=2160, processos=None, tamanho_bloco=TAMANHO_BLOCO,
+                      tamanho_casa=math.radians(10), rtol=1e-8):
+    """
+    Renderiza a sombra de um buraco negro em um arquivo .npy
+
+    Args:
+        caminho: Arquivo .npy de saída (uint8, altura × largura)
+        M: Massa do buraco negro (kg), padrão 5 M_sun do conjunto ativo
+        distancia: Distância da câmera ao centro, em unidades de r_s
+        campo_visao: Campo de visão horizontal (rad)
+        largura, altura: Resolução da imagem em pixels
+        processos: Número de processos (padrão: todos os núcleos;
+                   1 renderiza no processo atual)
+        tamanho_bloco: Lado dos blocos quadrados, em pixels
+        tamanho_casa: Lado das casas do tabuleiro do céu (rad)
+        rtol: Tolerância relativa do integrador de geodésicas
+
+    Returns:
+        Array mapeado (somente leitura) com a imagem
+    """
+    if M is None:
+        M = 5 * constantes.atual().M_sun
+    _, _, _, r_s = calculos_vetorizados.schwarzschild_metric(1.0, M)
+    if distancia <= 1.5:
+        raise ValueError("A câmera deve estar fora da esfera de fótons (distancia > 1.5 r_s)")
+
+    cena = {
+        'M': M,
+        'r_cam': distancia * r_s,
+        'campo_visao': campo_visao,
+        'largura': largura,
+        'altura': altura,
+        'tamanho_casa': tamanho_casa,
+        'rtol': rtol,
+    }
+
+    open_memmap(caminho, mode='w+', dtype=np.uint8, shape=(altura, largura))
+    blocos = [
+        (i0, min(i0 + tamanho_bloco, altura), j0, min(j0 + tamanho_bloco, largura))
+        for i0 in range(0, altura, tamanho_bloco)
+        for j0 in range(0, largura, tamanho_bloco)
+    ]
+
+    processos = processos or os.cpu_count() or 1
+    if processos == 1:
+        for bloco in blocos:
+            _renderizar_no_arquivo(caminho, cena, bloco)
+    else:
+        with ProcessPoolExecutor(max_workers=processos, initializer=constantes.restaurar,
+                                 initargs=constantes.estado()) as pool:
+            fila = iter(blocos)
+            em_andamento = set()
+            while True:
+                for bloco in fila:
+                    em_andamento.add(pool.submit(_renderizar_no_arquivo, caminho, cena, bloco))
+                    if len(em_andamento) >= 2 * processos:
+                        break
+                if not em_andamento:
+                    break
+                prontos, em_andamento = wait(em_andamento, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    futuro.result()
+
+    return np.load(caminho, mmap_mode='r')
+
+
+def salvar_png(imagem, caminho_png, linhas_por_vez=64):
+    """
+    Grava uma imagem uint8 em tons de cinza como PNG, linha a linha
+
+    Lê a imagem (pode ser um array mapeado) em faixas, sem carregá-la
+    inteira, e comprime com zlib em fluxo.
+
+    Args:
+        imagem: Array uint8 (altura, largura)
+        caminho_png: Arquivo de saída
+        linhas_por_vez: Linhas lidas e comprimidas por vez
+    """
+    altura, largura = imagem.shape
+
+    def bloco_png(arquivo, tipo, dados):
+        arquivo.write(struct.pack('>I', len(dados)))
+        arquivo.write(tipo + dados)
+        arquivo.write(struct.pack('>I', zlib.crc32(tipo + dados) & 0xffffffff))
+
+    compressor = zlib.compressobj(6)
+    with open(caminho_png, 'wb') as arquivo:
+        arquivo.write(b'\x89PNG\r\n\x1a\n')
+        bloco_png(arquivo, b'IHDR', struct.pack('>IIBBBBB', largura, altura, 8, 0, 0, 0, 0))
+
+        for i0 in range(0, altura, linhas_por_vez):
+            faixa = np.asarray(imagem[i0:i0 + linhas_por_vez])
+            # Cada linha PNG começa com o byte de filtro (0 = nenhum)
+            linhas = np.zeros((faixa.shape[0], largura + 1), dtype=np.uint8)
+            linhas[:, 1:] = faixa
+            dados = compressor.compress(linhas.tobytes())
+            if dados:
+                bloco_png(arquivo, b'IDAT', dados)
+
+        bloco_png(arquivo, b'IDAT', compressor.flush())
+        bloco_png(arquivo, b'IEND', b'')
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Renderiza a sombra de um buraco negro de 5 massas solares"""
+    parser = argparse.ArgumentParser(description="Sombra de buraco negro de Schwarzschild")
+    parser.add_argument('saida', help="arquivo .npy de saída (um .png é gerado ao lado)")
+    parser.add_argument('--largura', type=int, default=3840)
+    parser.add_argument('--altura', type=int, default=2160)
+    parser.add_argument('--distancia', type=float, default=30.0, help="em unidades de r_s")
+    parser.add_argument('--processos', type=int, default=None)
+    args = parser.parse_args()
+
+    imagem = renderizar_sombra(args.saida, largura=args.largura, altura=args.altura,
+                               distancia=args.distancia, processos=args.processos)
+    salvar_png(imagem, os.path.splitext(args.saida)[0] + '.png')
+
+
+if __name__ == "__main__":
+    main()
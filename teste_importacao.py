@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TESTE DE IMPORTAÇÃO: ORÇAMENTO DE TEMPO DOS MÓDULOS DE KERNELS
+==============================================================
+
+Garante que importar os módulos de kernels custa apenas a definição das
+funções: nenhuma impressão e nenhum cálculo em nível de módulo.
+
+O tempo é medido com `python -X importtime` em um processo novo por
+repetição. O NumPy é importado antes do módulo, para que o orçamento cubra
+somente o tempo cumulativo do próprio módulo e de qualquer dependência
+nova que ele venha a importar. Depois do NumPy, o cache de bytecode é
+desviado para um diretório vazio: um .pyc já existente não mascara o
+custo da compilação.
+
+Uso:
+    python teste_importacao.py      (código de saída 1 em caso de falha)
+    python -m pytest teste_importacao.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+# Orçamento de tempo próprio de importação, em microssegundos.
+# Medido: ~3 ms para calculos_verdadeiros (com compilação do bytecode).
+ORCAMENTO_IMPORTACAO_US = {
+    'calculos_verdadeiros': 5000,
+}
+
+# Melhor de N execuções, para filtrar ruído do sistema operacional
+REPETICOES = 5
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacao(modulo):
+    """
+    Mede a importação de um módulo em um interpretador novo
+
+    Args:
+        modulo: Nome do módulo a importar
+
+    Returns:
+        Tuple (cumulativo_us, saida) - tempo do módulo em μs e o texto
+        impresso em stdout durante a importação
+    """
+    with tempfile.TemporaryDirectory() as cache_vazio:
+        codigo = (f"import sys, numpy; sys.pycache_prefix = {cache_vazio!r}; "
+                  f"import {modulo}")
+        resultado = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', codigo],
+            cwd=PASTA, capture_output=True, text=True, check=True,
+        )
+
+    # Linhas no formato "import time: self [us] | cumulative | imported package"
+    for linha in resultado.stderr.splitlines():
+        campos = linha.split('|')
+        if len(campos) == 3 and campos[2].strip() == modulo:
+            return int(campos[1]), resultado.stdout
+
+    raise RuntimeError(f"{modulo} não aparece na saída de -X importtime")
+
+
+def teste_orcamento_importacao():
+    """Verifica o orçamento de tempo e a ausência de efeitos colaterais"""
+    falhas = []
+
+    for modulo, orcamento in ORCAMENTO_IMPORTACAO_US.items():
+        medidas = [medir_importacao(modulo) for _ in range(REPETICOES)]
+        tempo_us = min(m[0] for m in medidas)
+        saida = medidas[0][1]
+
+        status = "✅" if tempo_us <= orcamento else "❌"
+        print(f"{status} {modulo}: {tempo_us} μs (orçamento {orcamento} μs)")
+
+        if tempo_us > orcamento:
+            falhas.append(f"{modulo} importou em {tempo_us} μs (> {orcamento} μs)")
+        if saida:
+            falhas.append(f"{modulo} imprimiu {len(saida)} caracteres ao ser importado")
+
+    assert not falhas, "; ".join(falhas)
+
+
+def main():
+    """Executa o teste e sai com código 1 em caso de falha"""
+    try:
+        teste_orcamento_importacao()
+    except AssertionError as falha:
+        print(f"❌ {falha}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
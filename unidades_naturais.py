@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UNIDADES NATURAIS: KERNELS EM FLOAT32 COM ERRO VALIDADO
+=======================================================
+
+Em unidades SI as grandezas dos kernels vão de ~10⁻¹⁴⁰ (ℓ_P⁴) a ~10⁷⁷
+(entropia de um buraco negro solar), o que obriga o uso de float64 (faixa
+de float32: ~10⁻³⁸ a 3·10³⁸). Aqui cada grandeza é medida numa unidade
+própria do problema - por padrão as de Planck, ℓ_P, m_P, t_P, T_P = E_P/k_B
+e k_B para a entropia - e os kernels operam sobre os números adimensionais
+resultantes, em float32: metade da memória e da largura de banda.
+
+Cada kernel junta todas as constantes e escalas num coeficiente calculado
+em float64 (ex.: T_H = b / M, com b = ħc³ / (8π k_B G m_P T_P) = 1/8π em
+unidades de Planck) e faz em float32 só as operações sobre os arrays.
+Escalas de problema (ex.: massa = M☉) mantêm coeficientes e valores perto
+de 1 onde as de Planck não mantêm.
+
+Garantias:
+- verificar=True (padrão): conversões, coeficientes e operações que
+  saem da faixa normal do dtype (overflow, underflow ou subnormal) geram
+  ValueError em vez de resultados silenciosamente errados;
+- limite_erro(): limite a priori do erro relativo de cada saída contra o
+  caminho float64 SI (γ_k = ku/(1 - ku) com k arredondamentos em float32,
+  mais uma folga para os arredondamentos em float64 dos coeficientes, das
+  conversões e do próprio caminho SI);
+- validar(): confere os limites contra calculos_vetorizados e
+  GUP3DEnsemble em amostras aleatórias.
+
+Uso:
+    planck = SistemaUnidades()
+    M = planck.para_sistema(massas_kg, 'massa')        # float32
+    T = planck.temperatura_hawking(M)                  # float32, em T_P
+    T_kelvin = planck.para_si(T, 'temperatura')        # float64
+"""
+
+import math
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+import constantes
+import renderizacao
+import calculos_vetorizados
+from GUP_3D_Corrigido import GUP3DEnsemble
+from renderizacao import Resultado
+
+# Expoentes de (comprimento, massa, tempo, temperatura, entropia)
+GRANDEZAS = {
+    'adimensional': (0, 0, 0, 0, 0),
+    'comprimento': (1, 0, 0, 0, 0),
+    'area': (2, 0, 0, 0, 0),
+    'massa': (0, 1, 0, 0, 0),
+    'tempo': (0, 0, 1, 0, 0),
+    'temperatura': (0, 0, 0, 1, 0),
+    'entropia': (0, 0, 0, 0, 1),
+    'energia': (2, 1, -2, 0, 0),
+    'momento': (1, 1, -1, 0, 0),
+    'acao': (2, 1, -1, 0, 0),
+    # Termos de [X̂ᵢ, X̂ⱼ] (ver GUP3D.comutador_espacial_com_ordem)
+    'termo_principal': (4, 1, -1, 0, 0),    # ħ ℓ_P²
+    'O_termo': (7, 3, -3, 0, 0),            # ℓ_P⁴ ΔP³
+    'razao': (3, 2, -2, 0, 0),              # ℓ_P² ΔP³ / ħ
+}
+
+# Arredondamentos em float64 cobertos pela folga dos limites (coeficientes,
+# conversões de entrada e saída e o caminho SI de referência)
+FOLGA_FLOAT64 = 64
+
+
+def _gama(k, u):
+    """γ_k = ku / (1 - ku) (Higham): limite de k arredondamentos"""
+    return k * u / (1 - k * u)
+
+
+class _FaixaFloat:
+    """np.errstate que converte overflow e underflow em ValueError"""
+
+    def __init__(self, ativo, contexto):
+        self.ativo, self.contexto = ativo, contexto
+
+    def __enter__(self):
+        if self.ativo:
+            self.estado = np.errstate(over='raise', under='raise')
+            self.estado.__enter__()
+
+    def __exit__(self, tipo, valor, rastro):
+        if not self.ativo:
+            return False
+        self.estado.__exit__(tipo, valor, rastro)
+        if tipo is FloatingPointError:
+            raise ValueError(f"{self.contexto}: fora da faixa normal do dtype ({valor}); "
+                             "escolha outras escalas") from valor
+        return False
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                       SISTEMA DE UNIDADES                                 ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+class SistemaUnidades:
+    """Escalas de base e kernels nas unidades correspondentes"""
+
+    def __init__(self, comprimento=None, massa=None, tempo=None, temperatura=None,
+                 entropia=None, dtype=np.float32):
+        """
+        Args:
+            comprimento, massa, tempo, temperatura, entropia: Valor SI da
+                unidade de cada grandeza de base (None: a de Planck do
+                conjunto de constantes ativo na construção; entropia em k_B)
+            dtype: Tipo de ponto flutuante dos kernels
+        """
+        K = constantes.atual()
+        self.escalas = (
+            K.l_P if comprimento is None else float(comprimento),
+            K.m_P if massa is None else float(massa),
+            K.t_P if tempo is None else float(tempo),
+            K.E_P / K.k_B if temperatura is None else float(temperatura),
+            K.k_B if entropia is None else float(entropia),
+        )
+        self.dtype = np.dtype(dtype)
+        self.u = float(np.finfo(self.dtype).eps) / 2
+
+    def __repr__(self):
+        nomes = ('comprimento', 'massa', 'tempo', 'temperatura', 'entropia')
+        escalas = ", ".join(f"{n}={e:.4e}" for n, e in zip(nomes, self.escalas))
+        return f"SistemaUnidades({escalas}, dtype={self.dtype.name})"
+
+    def unidade(self, grandeza):
+        """Valor SI da unidade de `grandeza` (chave de GRANDEZAS)"""
+        valor = 1.0
+        for escala, expoente in zip(self.escalas, GRANDEZAS[grandeza]):
+            valor *= escala**expoente
+        return valor
+
+    def para_sistema(self, x, grandeza, out=None, verificar=True):
+        """
+        Converte valores SI (float64) para o sistema, no dtype dos kernels
+
+        A divisão é feita em float64 e arredondada uma vez para o dtype,
+        sem array temporário em float64.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        res = out if out is not None else np.empty(x.shape, dtype=self.dtype)
+        with _FaixaFloat(verificar, f"conversão de {grandeza}"):
+            np.divide(x, self.unidade(grandeza), out=res)
+        return res
+
+    def para_si(self, x, grandeza, out=None):
+        """Converte valores do sistema para SI em float64"""
+        return np.multiply(x, self.unidade(grandeza), out=out, dtype=np.float64)
+
+    def _coeficiente(self, valor, nome):
+        """Coeficiente calculado em float64 e arredondado uma vez para o dtype"""
+        coeficiente = self.dtype.type(valor)
+        if valor != 0 and not (np.finfo(self.dtype).tiny <= abs(coeficiente) < np.inf):
+            raise ValueError(f"coeficiente {nome} = {valor:.3e} fora da faixa de "
+                             f"{self.dtype.name}; escolha outras escalas")
+        return coeficiente
+
+    def _entrada(self, x):
+        return np.asarray(x, dtype=self.dtype)
+
+    def _saidas(self, out, n, forma):
+        if out is None:
+            return tuple(np.empty(forma, dtype=self.dtype) for _ in range(n))
+        return out
+
+    # ── Kernels (entradas e saídas nas unidades do sistema) ─────────────────
+
+    def temperatura_hawking(self, M, out=None, verificar=True):
+        """
+        T_H = b / M, b = ħc³ / (8π k_B G) em unidades do sistema
+
+        Args:
+            M: Massa(s) (unidades de massa)
+            out: Buffer de saída opcional
+            verificar: Erro fora da faixa normal do dtype
+
+        Returns:
+            Temperatura (unidades de temperatura)
+        """
+        K = constantes.atual()
+        _, s_M, _, s_T, _ = self.escalas
+        b = self._coeficiente(K.hbar * K.c3 / (8 * math.pi * K.k_B * K.G * s_M * s_T), 'b')
+        M = self._entrada(M)
+        res = out if out is not None else np.empty(M.shape, dtype=self.dtype)
+        with _FaixaFloat(verificar, "temperatura_hawking"):
+            np.divide(b, M, out=res)
+        return res
+
+    def entropia_bekenstein_hawking(self, M, out=None, verificar=True):
+        """
+        S = e M², e = 4πG / (ħc) · k_B em unidades do sistema
+
+        Returns:
+            Entropia (unidades de entropia)
+        """
+        K = constantes.atual()
+        _, s_M, _, _, s_S = self.escalas
+        e = self._coeficiente(4 * math.pi * K.G * K.k_B / (K.hbar * K.c) * s_M * s_M / s_S, 'e')
+        M = self._entrada(M)
+        res = out if out is not None else np.empty(M.shape, dtype=self.dtype)
+        with _FaixaFloat(verificar, "entropia_bekenstein_hawking"):
+            np.multiply(M, M, out=res)
+            np.multiply(res, e, out=res)
+        return res
+
+    def schwarzschild_metric(self, r, M, out=None, verificar=True):
+        """
+        Métrica de Schwarzschild com r_s = a M, a = 2G/c² no sistema
+
+        Returns:
+            Tupla (g_00, g_11, g_22, r_s) como em
+            calculos_vetorizados.schwarzschild_metric; g_22 em unidades de
+            área e r_s de comprimento
+        """
+        K = constantes.atual()
+        s_L, s_M = self.escalas[:2]
+        a = self._coeficiente(2 * K.G / K.c2 * s_M / s_L, 'a')
+        r, M = self._entrada(r), self._entrada(M)
+        forma = np.broadcast_shapes(r.shape, M.shape)
+        if out is None:
+            out = self._saidas(None, 3, forma) + (np.empty(M.shape, dtype=self.dtype),)
+        g_00, g_11, g_22, r_s = out
+
+        with _FaixaFloat(verificar, "schwarzschild_metric"):
+            np.multiply(a, M, out=r_s)
+            np.divide(r_s, r, out=g_11)
+            np.subtract(1, g_11, out=g_11)
+            np.negative(g_11, out=g_00)
+            np.divide(1, g_11, out=g_11)
+            np.multiply(r, r, out=g_22)
+        return g_00, g_11, g_22, r_s
+
+    def energia_relativistica(self, p, m, out=None, verificar=True):
+        """
+        E = hypot(c_p p, c_m m), com c_p = c e c_m = c² no sistema
+
+        Usa hypot em vez de √(x² + y²): os quadrados saem da faixa de
+        float32 muito antes do resultado.
+
+        Returns:
+            Energia (unidades de energia)
+        """
+        c_p, c_m = self._coeficientes_dispersao()
+        p, m = self._entrada(p), self._entrada(m)
+        res = out if out is not None else np.empty(np.broadcast_shapes(p.shape, m.shape), self.dtype)
+        with _FaixaFloat(verificar, "energia_relativistica"):
+            np.multiply(p, c_p, out=res)
+            np.hypot(res, np.multiply(m, c_m), out=res)
+        return res
+
+    def _coeficientes_dispersao(self):
+        K = constantes.atual()
+        s_E, s_p = self.unidade('energia'), self.unidade('momento')
+        c_p = self._coeficiente(K.c * s_p / s_E, 'c_p')
+        c_m = self._coeficiente(K.c2 * self.escalas[1] / s_E, 'c_m')
+        return c_p, c_m
+
+    def dispersao_relativistica(self, p, m, alpha=None, out=None, verificar=True):
+        """
+        (E, K, γ) como em calculos_vetorizados.dispersao_relativistica;
+        com `alpha`, f = 1 + α (q p)², q = 1 / (m_P c) no sistema
+
+        Returns:
+            Tuple (E, K, γ) - energias em unidades de energia
+        """
+        K = constantes.atual()
+        c_p, c_m = self._coeficientes_dispersao()
+        p, m = self._entrada(p), self._entrada(m)
+        formas = [p.shape, m.shape]
+        if alpha is not None:
+            q = self._coeficiente(self.unidade('momento') / (K.m_P * K.c), 'q')
+            alpha = self._entrada(alpha)
+            formas.append(alpha.shape)
+        E, cinetica, gama = self._saidas(out, 3, np.broadcast_shapes(*formas))
+
+        with _FaixaFloat(verificar, "dispersao_relativistica"):
+            np.abs(p, out=cinetica)
+            np.multiply(cinetica, c_p, out=cinetica)
+            if alpha is not None:
+                np.multiply(p, q, out=gama)
+                np.multiply(gama, gama, out=gama)
+                np.multiply(gama, alpha, out=gama)
+                np.add(gama, 1, out=gama)
+                np.multiply(cinetica, gama, out=cinetica)
+
+            repouso = np.multiply(m, c_m)
+            np.hypot(cinetica, repouso, out=E)
+
+            # p = m = 0 dá K = nan e m = 0 dá γ = inf, como no caminho SI
+            np.add(E, repouso, out=gama)
+            with np.errstate(invalid='ignore'):
+                np.divide(cinetica, gama, out=gama)
+            np.multiply(cinetica, gama, out=cinetica)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(E, repouso, out=gama)
+        return E, cinetica, gama
+
+    def comutador_espacial_com_ordem(self, alpha, Delta_P, out=None, verificar=True):
+        """
+        Termos de [X̂ᵢ, X̂ⱼ] de GUP3D.comutador_espacial_com_ordem, por
+        broadcasting de (alpha, Delta_P)
+
+        termo_principal = -2ħℓ_P² α,  O_termo = αℓ_P⁴ ΔP³,  razao = ℓ_P² ΔP³ / 2ħ
+
+        Args:
+            alpha: Parâmetro(s) α (adimensional)
+            Delta_P: Incerteza(s) no momento (unidades de momento)
+            out: Tupla opcional (O_termo, razao) de buffers
+
+        Returns:
+            dict com as chaves de GUP3D.comutador_espacial_com_ordem, nas
+            unidades GRANDEZAS['termo_principal'], ['O_termo'] e ['razao'];
+            'regime_valido' compara a razão com 0.1 em SI, como o original
+        """
+        K = constantes.atual()
+        s_p = self.unidade('momento')
+        c_principal = self._coeficiente(-2 * K.hbar * K.l_P2 / self.unidade('termo_principal'), 'principal')
+        c_O = self._coeficiente(K.l_P4 * s_p**3 / self.unidade('O_termo'), 'O_termo')
+        c_razao = self._coeficiente(K.l_P2 * s_p**3 / (2 * K.hbar * self.unidade('razao')), 'razao')
+        limite_regime = 0.1 / self.unidade('razao')
+
+        alpha, Delta_P = self._entrada(alpha), self._entrada(Delta_P)
+        termo_ordem_superior, razao = self._saidas(out, 2, np.broadcast_shapes(alpha.shape, Delta_P.shape))
+
+        with _FaixaFloat(verificar, "comutador_espacial_com_ordem"):
+            termo_principal = np.multiply(c_principal, alpha)
+            # ΔP³, no buffer da razão
+            np.multiply(Delta_P, Delta_P, out=razao)
+            np.multiply(razao, Delta_P, out=razao)
+            np.multiply(np.multiply(c_O, alpha), razao, out=termo_ordem_superior)
+            np.multiply(razao, c_razao, out=razao)
+
+        return {
+            'termo_principal': termo_principal,
+            'O_termo': termo_ordem_superior,
+            'razao': razao,
+            'regime_valido': razao < limite_regime,
+        }
+
+    # ── Limites de erro ─────────────────────────────────────────────────────
+
+    def limite_erro(self, kernel, eps_max=0.5, gup=False):
+        """
+        Limite a priori do erro relativo de cada saída contra o caminho
+        float64 SI, sem overflow ou underflow (garantido por verificar=True)
+
+        k conta os arredondamentos em float32 no pior caminho até a saída,
+        incluindo a conversão das entradas e dos coeficientes; somas e
+        hypot de termos positivos têm condicionamento 1. Em g₀₀ e g₁₁ o
+        erro de ε = r_s/r é amplificado por ε/(1 - ε) em 1 - ε.
+
+        Args:
+            kernel: Nome do kernel
+            eps_max: Maior r_s/r das entradas (schwarzschild_metric)
+            gup: Com alpha ≥ 0 (dispersao_relativistica)
+
+        Returns:
+            dict saída -> limite do erro relativo
+        """
+        u = self.u
+        folga = _gama(FOLGA_FLOAT64, 2.0**-53)
+        if kernel == 'schwarzschild_metric':
+            amplificacao = eps_max / (1 - eps_max)
+            contagens = {'g_00': (5, 1), 'g_11': (5, 2), 'g_22': 3, 'r_s': 3}
+            limites = {}
+            for saida, k in contagens.items():
+                if isinstance(k, tuple):
+                    limites[saida] = _gama(k[0], u) * amplificacao + _gama(k[1], u) + folga
+                else:
+                    limites[saida] = _gama(k, u) + folga
+            return limites
+        contagens = {
+            'temperatura_hawking': {'T_H': 3},
+            'entropia_bekenstein_hawking': {'S': 5},
+            'energia_relativistica': {'E': 5},
+            'dispersao_relativistica': ({'E': 16, 'K': 47, 'gama': 20} if gup else
+                                        {'E': 5, 'K': 14, 'gama': 9}),
+            'comutador_espacial_com_ordem': {'termo_principal': 3, 'O_termo': 9, 'razao': 7},
+        }[kernel]
+        return {saida: _gama(k, u) + folga for saida, k in contagens.items()}
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                           VALIDAÇÃO                                       ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+@dataclass
+class LinhaValidacao:
+    """Erro observado de uma saída contra o caminho float64 SI"""
+    kernel: str
+    saida: str
+    erro: float        # nan quando o kernel sai da faixa do dtype
+    limite: float
+    observacao: str = ""
+
+
+@dataclass
+class ResultadoUnidadesNaturais(Resultado):
+    """Validação dos kernels de um sistema de unidades"""
+    titulo = "UNIDADES NATURAIS: ERRO CONTRA O CAMINHO FLOAT64 SI"
+
+    sistema: str
+    amostras: int
+    linhas: list
+
+    def linhas_console(self):
+        yield "\n" + "="*80
+        yield self.titulo
+        yield "="*80
+        yield f"{self.sistema}; {self.amostras} amostras por kernel\n"
+        yield "{:>30} | {:>8} | {:>11} | {:>11} | {:>6}".format(
+            "Kernel", "Saída", "Erro máx.", "Limite", "OK")
+        yield "-" * 80
+        for l in self.linhas:
+            if l.observacao:
+                yield "{:>30} | {:>8} | {}".format(l.kernel, l.saida, l.observacao)
+            else:
+                yield "{:>30} | {:>8} | {:>11.3e} | {:>11.3e} | {:>6}".format(
+                    l.kernel, l.saida, l.erro, l.limite, "✅" if l.erro <= l.limite else "❌")
+
+
+def _erro_relativo(aproximado, exato):
+    aproximado, exato = np.broadcast_arrays(np.asarray(aproximado, np.float64), exato)
+    validos = exato != 0
+    return float(np.max(np.abs(aproximado[validos] - exato[validos]) / np.abs(exato[validos]),
+                        initial=0.0))
+
+
+def validar(sistema, amostras=100_000, semente=0, eps_max=0.9, alpha=0.6):
+    """
+    Compara os kernels do sistema com calculos_vetorizados e
+    GUP3DEnsemble (float64 SI) e com os limites de limite_erro()
+
+    As entradas são log-uniformes entre 10⁻² e 10² unidades do sistema;
+    em schwarzschild_metric, r_s/r é log-uniforme entre 10⁻⁶ e eps_max.
+
+    Returns:
+        ResultadoUnidadesNaturais
+    """
+    rng = np.random.default_rng(semente)
+
+    def amostra(grandeza):
+        return sistema.unidade(grandeza) * 10**rng.uniform(-2, 2, amostras)
+
+    K = constantes.atual()
+    M, m, p = amostra('massa'), amostra('massa'), amostra('momento')
+    r_s = 2 * K.G * M / K.c2
+    r = r_s / 10**rng.uniform(-6, math.log10(eps_max), amostras)
+
+    casos = [
+        ('temperatura_hawking', {},
+         lambda: (calculos_vetorizados.temperatura_hawking(M),),
+         lambda: (sistema.temperatura_hawking(sistema.para_sistema(M, 'massa')),),
+         ('temperatura',)),
+        ('entropia_bekenstein_hawking', {},
+         lambda: (calculos_vetorizados.entropia_bekenstein_hawking(M),),
+         lambda: (sistema.entropia_bekenstein_hawking(sistema.para_sistema(M, 'massa')),),
+         ('entropia',)),
+        ('schwarzschild_metric', {'eps_max': eps_max},
+         lambda: calculos_vetorizados.schwarzschild_metric(r, M),
+         lambda: sistema.schwarzschild_metric(sistema.para_sistema(r, 'comprimento'),
+                                              sistema.para_sistema(M, 'massa')),
+         ('adimensional', 'adimensional', 'area', 'comprimento')),
+        ('energia_relativistica', {},
+         lambda: (calculos_vetorizados.energia_relativistica(p, m),),
+         lambda: (sistema.energia_relativistica(sistema.para_sistema(p, 'momento'),
+                                                sistema.para_sistema(m, 'massa')),),
+         ('energia',)),
+        ('dispersao_relativistica', {'gup': True},
+         lambda: calculos_vetorizados.dispersao_relativistica(p, m, alpha),
+         lambda: sistema.dispersao_relativistica(sistema.para_sistema(p, 'momento'),
+                                                 sistema.para_sistema(m, 'massa'), alpha),
+         ('energia', 'energia', 'adimensional')),
+        ('comutador_espacial_com_ordem', {},
+         lambda: _comutador_si(alpha, p),
+         lambda: _comutador_sistema(sistema, alpha, sistema.para_sistema(p, 'momento')),
+         ('termo_principal', 'O_termo', 'razao')),
+    ]
+
+    linhas = []
+    for kernel, opcoes, referencia, aproximado, grandezas in casos:
+        limites = sistema.limite_erro(kernel, **opcoes)
+        try:
+            resultados = aproximado()
+        except ValueError as erro:
+            linhas.append(LinhaValidacao(kernel, "-", math.nan, math.nan, str(erro)))
+            continue
+        for (saida, limite), exato, valor, grandeza in zip(
+                limites.items(), referencia(), resultados, grandezas):
+            erro = _erro_relativo(sistema.para_si(valor, grandeza), exato)
+            linhas.append(LinhaValidacao(kernel, saida, erro, limite))
+    return ResultadoUnidadesNaturais(repr(sistema), amostras, linhas)
+
+
+def _comutador_si(alpha, Delta_P):
+    resultado = GUP3DEnsemble([alpha]).comutador_espacial_com_ordem(Delta_P)
+    return resultado['termo_principal'][0], resultado['O_termo'][0], resultado['razao'][0]
+
+
+def _comutador_sistema(sistema, alpha, Delta_P):
+    resultado = sistema.comutador_espacial_com_ordem(alpha, Delta_P)
+    return resultado['termo_principal'], resultado['O_termo'], resultado['razao']
+
+
+def main():
+    """Valida os kernels em unidades de Planck e em unidades estelares"""
+    parser = argparse.ArgumentParser(description="Kernels em unidades naturais (float32)")
+    parser.add_argument('--amostras', type=int, default=100_000)
+    parser.add_argument('--float64', action='store_true', help="kernels em float64")
+    parser.add_argument('--formato', choices=renderizacao.FORMATOS, default='console')
+    args = parser.parse_args()
+
+    dtype = np.float64 if args.float64 else np.float32
+    K = constantes.atual()
+    # Buraco negro estelar: r_s e M☉, tempo de luz r_s/c, T_H solar ~ 6·10⁻⁸ K
+    estelar = SistemaUnidades(comprimento=K.r_s_sun, massa=K.M_sun, tempo=K.r_s_sun / K.c,
+                              temperatura=1e-7, entropia=1e77 * K.k_B, dtype=dtype)
+    resultados = [validar(SistemaUnidades(dtype=dtype), args.amostras),
+                  validar(estelar, args.amostras)]
+    renderizacao.renderizar(resultados, args.formato)
+
+
+if __name__ == "__main__":
+    main()
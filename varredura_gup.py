@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VARREDURA PARALELA: VALIDADE DO REGIME O(ℓ_P²) DO GUP 3D
+========================================================
+
+Executa a análise de teste_5_ordem_grandeza (GUP_3D_Corrigido.py) sobre
+grades α × ΔP de até ~10⁹ pontos:
+
+- A grade é dividida em blocos de tamanho fixo, processados por um pool
+  de processos com GUP3DEnsemble (uma chamada vetorizada por bloco).
+- Cada bloco é gravado diretamente em arquivos .npy mapeados em memória,
+  de modo que a memória usada depende só do tamanho do bloco.
+- Blocos concluídos são registrados em `progresso.log`; uma nova chamada
+  com o mesmo diretório retoma a partir do último bloco concluído.
+
+Arquivos no diretório de saída:
+    alpha.npy             (N_α,)       parâmetros α da grade
+    Delta_P.npy           (N_P,)       incertezas no momento da grade
+    razao.npy             (N_α, N_P)   razão O(ℓ_P⁴) / termo principal
+    regime_valido.npy     (N_α, N_P)   razão < 0.1
+    incerteza_minima.npy  (N_α,)       (ΔX)ₘᵢₙ = √(5α/3) ℓ_P
+    blocos.npy            (N_blocos, 4) limites (i0, i1, j0, j1) de cada bloco
+    progresso.log                      índices dos blocos concluídos
+
+Os índices de progresso.log só valem para a divisão gravada em blocos.npy:
+retomar com outro pontos_por_bloco gera ValueError.
+
+Os processos do pool usam o mesmo conjunto de constantes do processo
+principal (constantes.usar_codata e constantes.alterar).
+
+Uso:
+    python varredura_gup.py DIRETORIO [--n-alpha N] [--n-delta-p N] [--processos N]
+"""
+
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+import constantes
+from GUP_3D_Corrigido import GUP3DEnsemble
+
+ARQUIVO_PROGRESSO = 'progresso.log'
+
+# Pontos por bloco: ~2²² pontos ≈ 40 MB de resultados por bloco
+PONTOS_POR_BLOCO = 2**22
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                          DIVISÃO EM BLOCOS                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def dividir_em_blocos(n_alpha, n_delta_p, pontos_por_bloco=PONTOS_POR_BLOCO):
+    """
+    Divide a grade α × ΔP em blocos retangulares
+
+    Args:
+        n_alpha: Número de valores de α (linhas)
+        n_delta_p: Número de valores de ΔP (colunas)
+        pontos_por_bloco: Número máximo de pontos por bloco
+
+    Returns:
+        list: Tuplas (i0, i1, j0, j1) em ordem determinística; o índice
+              na lista é o identificador do bloco
+    """
+    colunas = max(1, min(n_delta_p, pontos_por_bloco))
+    linhas = max(1, pontos_por_bloco // colunas)
+
+    return [
+        (i0, min(i0 + linhas, n_alpha), j0, min(j0 + colunas, n_delta_p))
+        for i0 in range(0, n_alpha, linhas)
+        for j0 in range(0, n_delta_p, colunas)
+    ]
+
+
+def _processar_bloco(diretorio, bloco):
+    """
+    Avalia um bloco e grava o resultado nos arquivos mapeados
+
+    Executado nos processos do pool: só recebe o caminho e os limites do
+    bloco, e lê os eixos da grade do disco.
+    """
+    i0, i1, j0, j1 = bloco
+    alpha = np.load(os.path.join(diretorio, 'alpha.npy'), mmap_mode='r')[i0:i1]
+    Delta_P = np.load(os.path.join(diretorio, 'Delta_P.npy'), mmap_mode='r')[j0:j1]
+
+    ensemble = GUP3DEnsemble(alpha)
+    resultado = ensemble.comutador_espacial_com_ordem(Delta_P)
+
+    razao = np.load(os.path.join(diretorio, 'razao.npy'), mmap_mode='r+')
+    razao[i0:i1, j0:j1] = resultado['razao']
+    razao.flush()
+
+    regime = np.load(os.path.join(diretorio, 'regime_valido.npy'), mmap_mode='r+')
+    regime[i0:i1, j0:j1] = resultado['regime_valido']
+    regime.flush()
+
+    # A incerteza mínima não depende de ΔP: só o primeiro bloco da linha grava
+    if j0 == 0:
+        incerteza = np.load(os.path.join(diretorio, 'incerteza_minima.npy'), mmap_mode='r+')
+        incerteza[i0:i1] = ensemble.incerteza_posicao_minima()
+        incerteza.flush()
+
+    return bloco
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                        ARQUIVOS E RETOMADA                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def _preparar_diretorio(diretorio, alpha, Delta_P, blocos):
+    """Cria os arquivos da varredura ou valida os de uma varredura anterior"""
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_alpha = os.path.join(diretorio, 'alpha.npy')
+    caminho_delta_p = os.path.join(diretorio, 'Delta_P.npy')
+    caminho_blocos = os.path.join(diretorio, 'blocos.npy')
+    blocos = np.array(blocos, dtype=np.int64).reshape(-1, 4)
+
+    if os.path.exists(caminho_alpha):
+        if not (np.array_equal(np.load(caminho_alpha), alpha)
+                and np.array_equal(np.load(caminho_delta_p), Delta_P)):
+            raise ValueError(f"{diretorio} contém uma varredura com outra grade α × ΔP")
+        # Os índices de progresso.log só identificam blocos da mesma divisão
+        if not (os.path.exists(caminho_blocos)
+                and np.array_equal(np.load(caminho_blocos), blocos)):
+            raise ValueError(f"{diretorio} contém uma varredura com outra divisão em blocos; "
+                             "retome com o mesmo pontos_por_bloco")
+        return
+
+    forma = (alpha.size, Delta_P.size)
+    open_memmap(os.path.join(diretorio, 'razao.npy'), mode='w+', dtype=np.float64, shape=forma)
+    open_memmap(os.path.join(diretorio, 'regime_valido.npy'), mode='w+', dtype=np.bool_, shape=forma)
+    open_memmap(os.path.join(diretorio, 'incerteza_minima.npy'), mode='w+', dtype=np.float64, shape=alpha.shape)
+
+    # Eixos gravados por último: sua presença indica arquivos completos
+    np.save(caminho_blocos, blocos)
+    np.save(caminho_delta_p, Delta_P)
+    np.save(caminho_alpha, alpha)
+
+
+def _blocos_concluidos(diretorio):
+    """Lê os índices de blocos já concluídos (tolera última linha truncada)"""
+    caminho = os.path.join(diretorio, ARQUIVO_PROGRESSO)
+    if not os.path.exists(caminho):
+        return set()
+
+    concluidos = set()
+    with open(caminho) as arquivo:
+        for linha in arquivo:
+            if linha.endswith('\n') and linha.strip().isdigit():
+                concluidos.add(int(linha))
+    return concluidos
+
+
+def carregar_varredura(diretorio):
+    """
+    Abre os resultados de uma varredura em modo somente leitura
+
+    Returns:
+        dict: Arrays mapeados 'alpha', 'Delta_P', 'razao',
+              'regime_valido' e 'incerteza_minima'
+    """
+    nomes = ['alpha', 'Delta_P', 'razao', 'regime_valido', 'incerteza_minima']
+    return {
+        nome: np.load(os.path.join(diretorio, f'{nome}.npy'), mmap_mode='r')
+        for nome in nomes
+    }
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         VARREDURA PARALELA                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def varrer_regime_gup(alpha, Delta_P, diretorio, processos=None,
+                      pontos_por_bloco=PONTOS_POR_BLOCO, progresso=None):
+    """
+    Varre a grade α × ΔP em paralelo, gravando os resultados em disco
+
+    Chamar de novo com o mesmo diretório, a mesma grade e o mesmo
+    pontos_por_bloco retoma a varredura, pulando os blocos registrados em
+    progresso.log; outra divisão em blocos gera ValueError.
+
+    Args:
+        alpha: Array 1D de parâmetros α
+        Delta_P: Array 1D de incertezas no momento (kg·m/s)
+        diretorio: Diretório de saída
+        processos: Número de processos (padrão: todos os núcleos;
+                   1 executa no processo atual, sem pool)
+        pontos_por_bloco: Tamanho máximo de cada bloco
+        progresso: Função opcional progresso(concluidos, total)
+
+    Returns:
+        dict: Resultados abertos com carregar_varredura()
+    """
+    alpha = np.ascontiguousarray(alpha, dtype=np.float64).ravel()
+    Delta_P = np.ascontiguousarray(Delta_P, dtype=np.float64).ravel()
+
+    blocos = dividir_em_blocos(alpha.size, Delta_P.size, pontos_por_bloco)
+    _preparar_diretorio(diretorio, alpha, Delta_P, blocos)
+    concluidos = _blocos_concluidos(diretorio)
+    pendentes = [indice for indice in range(len(blocos)) if indice not in concluidos]
+
+    processos = processos or os.cpu_count() or 1
+    n_concluidos = len(blocos) - len(pendentes)
+
+    with open(os.path.join(diretorio, ARQUIVO_PROGRESSO), 'a') as registro:
+
+        def registrar(indice):
+            nonlocal n_concluidos
+            registro.write(f"{indice}\n")
+            registro.flush()
+            os.fsync(registro.fileno())
+            n_concluidos += 1
+            if progresso is not None:
+                progresso(n_concluidos, len(blocos))
+
+        if processos == 1:
+            for indice in pendentes:
+                _processar_bloco(diretorio, blocos[indice])
+                registrar(indice)
+        else:
+            with ProcessPoolExecutor(max_workers=processos, initializer=constantes.restaurar,
+                                     initargs=constantes.estado()) as pool:
+                fila = iter(pendentes)
+                em_andamento = {}
+
+                # No máximo 2 blocos por processo em voo: memória limitada
+                while True:
+                    for indice in fila:
+                        futuro = pool.submit(_processar_bloco, diretorio, blocos[indice])
+                        em_andamento[futuro] = indice
+                        if len(em_andamento) >= 2 * processos:
+                            break
+
+                    if not em_andamento:
+                        break
+
+                    prontos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        futuro.result()
+                        registrar(em_andamento.pop(futuro))
+
+    return carregar_varredura(diretorio)
+
+
+# ╔════════════════════════════════════════════════════════════════════════════╗
+# ║                         PROGRAMA PRINCIPAL                                ║
+# ╚════════════════════════════════════════════════════════════════════════════╝
+
+def main():
+    """Varredura de produção equivalente a teste_5_ordem_grandeza"""
+    parser = argparse.ArgumentParser(description="Varredura α × ΔP do regime O(ℓ_P²)")
+    parser.add_argument('diretorio')
+    parser.add_argument('--n-alpha', type=int, default=1000)
+    parser.add_argument('--n-delta-p', type=int, default=1000)
+    parser.add_argument('--processos', type=int, default=None)
+    args = parser.parse_args()
+
+    # Mesma faixa de teste_5 (1e-30 a 1e-15 em unidades de ħ/ℓ_P), agora densa
+    K = constantes.atual()
+    alpha = np.linspace(0.1, 2.0, args.n_alpha)
+    Delta_P = np.logspace(-30, -15, args.n_delta_p) * K.hbar / K.l_P
+
+    def progresso(concluidos, total):
+        print(f"\rBlocos concluídos: {concluidos}/{total}", end='', flush=True)
+
+    resultado = varrer_regime_gup(alpha, Delta_P, args.diretorio,
+                                  processos=args.processos, progresso=progresso)
+
+    fracao = np.count_nonzero(resultado['regime_valido']) / resultado['regime_valido'].size
+    print(f"\nPontos com regime O(ℓ_P²) válido: {fracao:.2%}")
+
+
+if __name__ == "__main__":
+    main()